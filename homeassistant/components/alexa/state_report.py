@@ -7,6 +7,8 @@ import aiohttp
 import async_timeout
 
 from homeassistant.const import MATCH_ALL, STATE_ON
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
 import homeassistant.util.dt as dt_util
 
 from .const import API_CHANGE, Cause
@@ -16,6 +18,18 @@ from .messages import AlexaResponse
 _LOGGER = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 10
 
+# Time to collect state changes before sending ChangeReports
+CHANGE_REPORT_WINDOW = 1
+
+# Maximum number of ChangeReports that are sent to Alexa at the same time
+MAX_CONCURRENT_REPORTS = 4
+
+# Number of times to retry a ChangeReport when Alexa is throttling us
+MAX_THROTTLE_RETRIES = 3
+
+# Seconds to wait before the first retry, doubled for every next attempt
+THROTTLE_BACKOFF = 1
+
 
 async def async_enable_proactive_mode(hass, smart_home_config):
     """Enable the proactive mode.
@@ -25,8 +39,80 @@ async def async_enable_proactive_mode(hass, smart_home_config):
     # Validate we can get access token.
     await smart_home_config.async_get_access_token()
 
-    async def async_entity_state_listener(changed_entity, old_state, new_state):
+    # entity_id -> (attributes, reports changes, doorbell reported first)
+    capabilities = {}
+    # entity_id -> last reported property values
+    checker = {}
+    pending = {}
+    unsub_pending = None
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REPORTS)
+
+    @callback
+    def async_get_capabilities(new_state):
+        """Return how the state of an entity should be reported."""
+        cached = capabilities.get(new_state.entity_id)
+
+        if cached is not None and cached[0] == new_state.attributes:
+            return cached[1:]
+
+        alexa_entity = ENTITY_ADAPTERS[new_state.domain](
+            hass, smart_home_config, new_state
+        )
+        change_report = False
+        doorbell_first = False
+
+        for interface in alexa_entity.interfaces():
+            if interface.properties_proactively_reported():
+                change_report = True
+                break
+            if interface.name() == "Alexa.DoorbellEventSource":
+                doorbell_first = True
+
+        capabilities[new_state.entity_id] = (
+            new_state.attributes,
+            change_report,
+            doorbell_first,
+        )
+        return change_report, doorbell_first
+
+    async def async_send_change_report(alexa_entity, properties):
+        """Send a ChangeReport while limiting concurrent requests."""
+        async with semaphore:
+            await async_send_changereport_message(
+                hass, smart_home_config, alexa_entity, properties=properties
+            )
+
+    async def async_send_pending(_now):
+        """Send ChangeReports for all collected state changes."""
+        nonlocal pending, unsub_pending
+
+        unsub_pending = None
+        states, pending = pending, {}
+        tasks = []
+
+        for entity_id, state in states.items():
+            alexa_entity = ENTITY_ADAPTERS[state.domain](hass, smart_home_config, state)
+            properties = list(alexa_entity.serialize_properties())
+            values = _property_values(properties)
+
+            # Only report to Alexa if data that Alexa cares about has changed
+            if checker.get(entity_id) == values:
+                continue
+
+            checker[entity_id] = values
+            tasks.append(async_send_change_report(alexa_entity, properties))
+
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    @callback
+    def async_entity_state_listener(changed_entity, old_state, new_state):
+        nonlocal unsub_pending
+
         if not new_state:
+            capabilities.pop(changed_entity, None)
+            checker.pop(changed_entity, None)
+            pending.pop(changed_entity, None)
             return
 
         if new_state.domain not in ENTITY_ADAPTERS:
@@ -36,32 +122,56 @@ async def async_enable_proactive_mode(hass, smart_home_config):
             _LOGGER.debug("Not exposing %s because filtered by config", changed_entity)
             return
 
-        alexa_changed_entity = ENTITY_ADAPTERS[new_state.domain](
-            hass, smart_home_config, new_state
-        )
+        change_report, doorbell_first = async_get_capabilities(new_state)
 
-        for interface in alexa_changed_entity.interfaces():
-            if interface.properties_proactively_reported():
-                await async_send_changereport_message(
-                    hass, smart_home_config, alexa_changed_entity
+        if doorbell_first and new_state.state == STATE_ON:
+            hass.async_create_task(
+                async_send_doorbell_event_message(
+                    hass,
+                    smart_home_config,
+                    ENTITY_ADAPTERS[new_state.domain](
+                        hass, smart_home_config, new_state
+                    ),
                 )
-                return
-            if (
-                interface.name() == "Alexa.DoorbellEventSource"
-                and new_state.state == STATE_ON
-            ):
-                await async_send_doorbell_event_message(
-                    hass, smart_home_config, alexa_changed_entity
-                )
-                return
+            )
+            return
 
-    return hass.helpers.event.async_track_state_change(
+        if not change_report:
+            return
+
+        # Only the latest state per endpoint is reported
+        pending[changed_entity] = new_state
+
+        if unsub_pending is None:
+            unsub_pending = async_call_later(
+                hass, CHANGE_REPORT_WINDOW, async_send_pending
+            )
+
+    unsub_listener = hass.helpers.event.async_track_state_change(
         MATCH_ALL, async_entity_state_listener
     )
 
+    @callback
+    def unsub():
+        """Stop reporting state changes."""
+        unsub_listener()
+
+        if unsub_pending is not None:
+            unsub_pending()
+
+    return unsub
+
+
+def _property_values(properties):
+    """Return the reported values of serialized properties, without sample time."""
+    return [
+        (prop["namespace"], prop.get("instance"), prop["name"], prop["value"])
+        for prop in properties
+    ]
+
 
 async def async_send_changereport_message(
-    hass, config, alexa_entity, *, invalidate_access_token=True
+    hass, config, alexa_entity, *, invalidate_access_token=True, properties=None
 ):
     """Send a ChangeReport message for an Alexa entity.
 
@@ -76,7 +186,8 @@ async def async_send_changereport_message(
     # this sends all the properties of the Alexa Entity, whether they have
     # changed or not. this should be improved, and properties that have not
     # changed should be moved to the 'context' object
-    properties = list(alexa_entity.serialize_properties())
+    if properties is None:
+        properties = list(alexa_entity.serialize_properties())
 
     payload = {
         API_CHANGE: {"cause": {"type": Cause.APP_INTERACTION}, "properties": properties}
@@ -87,24 +198,38 @@ async def async_send_changereport_message(
 
     message_serialized = message.serialize()
     session = hass.helpers.aiohttp_client.async_get_clientsession()
+    retries = 0
+
+    while True:
+        try:
+            with async_timeout.timeout(DEFAULT_TIMEOUT):
+                response = await session.post(
+                    config.endpoint,
+                    headers=headers,
+                    json=message_serialized,
+                    allow_redirects=True,
+                )
 
-    try:
-        with async_timeout.timeout(DEFAULT_TIMEOUT):
-            response = await session.post(
-                config.endpoint,
-                headers=headers,
-                json=message_serialized,
-                allow_redirects=True,
-            )
+        except (asyncio.TimeoutError, aiohttp.ClientError):
+            _LOGGER.error("Timeout sending report to Alexa.")
+            return
 
-    except (asyncio.TimeoutError, aiohttp.ClientError):
-        _LOGGER.error("Timeout sending report to Alexa.")
-        return
+        response_text = await response.text()
 
-    response_text = await response.text()
+        _LOGGER.debug("Sent: %s", json.dumps(message_serialized))
+        _LOGGER.debug("Received (%s): %s", response.status, response_text)
 
-    _LOGGER.debug("Sent: %s", json.dumps(message_serialized))
-    _LOGGER.debug("Received (%s): %s", response.status, response_text)
+        if response.status != 429 or retries >= MAX_THROTTLE_RETRIES:
+            break
+
+        try:
+            delay = float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            delay = THROTTLE_BACKOFF * 2 ** retries
+
+        retries += 1
+        _LOGGER.debug("ChangeReport for %s throttled, retry in %ss", endpoint, delay)
+        await asyncio.sleep(delay)
 
     if response.status == 202:
         return
@@ -117,7 +242,11 @@ async def async_send_changereport_message(
     ):
         config.async_invalidate_access_token()
         return await async_send_changereport_message(
-            hass, config, alexa_entity, invalidate_access_token=False
+            hass,
+            config,
+            alexa_entity,
+            invalidate_access_token=False,
+            properties=properties,
         )
 
     _LOGGER.error(
@@ -1,7 +1,8 @@
 """Allow to set up simple automation rules via the config file."""
+import hashlib
 import importlib
 import logging
-from typing import Any, Awaitable, Callable, List, Optional, Set
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
 
 import voluptuous as vol
 
@@ -215,8 +216,8 @@ async def async_setup(hass, config):
     component.async_register_entity_service(SERVICE_TURN_OFF, {}, "async_turn_off")
 
     async def reload_service_handler(service_call):
-        """Remove all automations and load new ones from config."""
-        conf = await component.async_prepare_reload()
+        """Rebuild the automations that changed in the config."""
+        conf = await component.async_prepare_reload(skip_reset=True)
         if conf is None:
             return
         await _async_process_config(hass, conf, component)
@@ -240,6 +241,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         action_script,
         hidden,
         initial_state,
+        config_hash=None,
     ):
         """Initialize an automation entity."""
         self._id = automation_id
@@ -254,6 +256,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         self._is_enabled = False
         self._referenced_entities: Optional[Set[str]] = None
         self._referenced_devices: Optional[Set[str]] = None
+        self.config_hash = config_hash
 
     @property
     def name(self):
@@ -492,11 +495,24 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         return {CONF_ID: self._id}
 
 
+def _config_hash(name, config_block):
+    """Return a hash of a validated automation config."""
+    return hashlib.sha1(repr((name, config_block)).encode()).hexdigest()
+
+
 async def _async_process_config(hass, config, component):
     """Process config and add automations.
 
+    Automations already set up with the same id and config keep running,
+    the others are removed and rebuilt.
+
     This method is a coroutine.
     """
+    existing: Dict[str, List[AutomationEntity]] = {}
+    for entity in component.entities:
+        if isinstance(entity, AutomationEntity):
+            existing.setdefault(entity.config_hash, []).append(entity)
+
     entities = []
 
     for config_key in extract_domain_configs(config, DOMAIN):
@@ -506,6 +522,11 @@ async def _async_process_config(hass, config, component):
             automation_id = config_block.get(CONF_ID)
             name = config_block.get(CONF_ALIAS) or f"{config_key} {list_no}"
 
+            config_hash = _config_hash(name, config_block)
+            if existing.get(config_hash):
+                existing[config_hash].pop()
+                continue
+
             hidden = config_block[CONF_HIDE_ENTITY]
             initial_state = config_block.get(CONF_INITIAL_STATE)
 
@@ -527,10 +548,16 @@ async def _async_process_config(hass, config, component):
                 action_script,
                 hidden,
                 initial_state,
+                config_hash,
             )
 
             entities.append(entity)
 
+    # Remove stale automations first so changed ones can reuse their entity id
+    for stale in existing.values():
+        for entity in stale:
+            await component.async_remove_entity(entity.entity_id)
+
     if entities:
         await component.async_add_entities(entities)
 
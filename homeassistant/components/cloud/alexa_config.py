@@ -48,6 +48,7 @@ class AlexaConfig(alexa_config.AbstractConfig):
         self._cur_entity_prefs = prefs.alexa_entity_configs
         self._alexa_sync_unsub = None
         self._endpoint = None
+        self._token_lock = None
 
         prefs.async_listen_updates(self._async_prefs_updated)
         hass.bus.async_listen(
@@ -108,6 +109,15 @@ class AlexaConfig(alexa_config.AbstractConfig):
 
     async def async_get_access_token(self):
         """Get an access token."""
+        # Serialize token refreshes between concurrent state reports
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+
+        async with self._token_lock:
+            return await self._async_get_access_token()
+
+    async def _async_get_access_token(self):
+        """Get an access token, refreshing it if needed."""
         if self._token_valid is not None and self._token_valid > utcnow():
             return self._token
 
@@ -27,6 +27,7 @@ from .const import (
     ATTR_SOURCE_TYPE,
     CONF_AWAY_HIDE,
     CONF_CONSIDER_HOME,
+    CONF_KNOWN_DEVICES_STORAGE,
     CONF_NEW_DEVICE_DEFAULTS,
     CONF_SCAN_INTERVAL,
     CONF_TRACK_NEW,
@@ -71,6 +72,7 @@ PLATFORM_SCHEMA = cv.PLATFORM_SCHEMA.extend(
             cv.time_period, cv.positive_timedelta
         ),
         vol.Optional(CONF_NEW_DEVICE_DEFAULTS, default={}): NEW_DEVICE_DEFAULTS_SCHEMA,
+        vol.Optional(CONF_KNOWN_DEVICES_STORAGE): cv.boolean,
     }
 )
 PLATFORM_SCHEMA_BASE = cv.PLATFORM_SCHEMA_BASE.extend(PLATFORM_SCHEMA.schema)
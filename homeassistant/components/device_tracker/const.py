@@ -29,6 +29,9 @@ DEFAULT_CONSIDER_HOME = timedelta(seconds=180)
 
 CONF_NEW_DEVICE_DEFAULTS = "new_device_defaults"
 
+CONF_KNOWN_DEVICES_STORAGE = "known_devices_storage"
+DEFAULT_KNOWN_DEVICES_STORAGE = False
+
 ATTR_ATTRIBUTES = "attributes"
 ATTR_BATTERY = "battery"
 ATTR_DEV_ID = "dev_id"
@@ -2,7 +2,8 @@
 import asyncio
 from datetime import timedelta
 import hashlib
-from typing import Any, List, Sequence
+import os
+from typing import Any, Dict, List, Optional, Sequence
 
 import voluptuous as vol
 
@@ -39,10 +40,12 @@ from .const import (
     ATTR_SOURCE_TYPE,
     CONF_AWAY_HIDE,
     CONF_CONSIDER_HOME,
+    CONF_KNOWN_DEVICES_STORAGE,
     CONF_NEW_DEVICE_DEFAULTS,
     CONF_TRACK_NEW,
     DEFAULT_AWAY_HIDE,
     DEFAULT_CONSIDER_HOME,
+    DEFAULT_KNOWN_DEVICES_STORAGE,
     DEFAULT_TRACK_NEW,
     DOMAIN,
     ENTITY_ID_FORMAT,
@@ -53,6 +56,10 @@ from .const import (
 YAML_DEVICES = "known_devices.yaml"
 EVENT_NEW_DEVICE = "device_tracker_new_device"
 
+STORAGE_KEY = f"{DOMAIN}.known_devices"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
 
 async def get_tracker(hass, config):
     """Create a tracker."""
@@ -67,11 +74,105 @@ async def get_tracker(hass, config):
     if track_new is None:
         track_new = defaults.get(CONF_TRACK_NEW, DEFAULT_TRACK_NEW)
 
-    devices = await async_load_config(yaml_path, hass, consider_home)
-    tracker = DeviceTracker(hass, consider_home, track_new, defaults, devices)
+    if conf.get(CONF_KNOWN_DEVICES_STORAGE, DEFAULT_KNOWN_DEVICES_STORAGE):
+        known_devices = KnownDevices(hass, yaml_path)
+        devices = async_devices_from_config(
+            hass, await known_devices.async_load(), consider_home
+        )
+    else:
+        known_devices = None
+        devices = await async_load_config(yaml_path, hass, consider_home)
+
+    tracker = DeviceTracker(
+        hass, consider_home, track_new, defaults, devices, known_devices
+    )
     return tracker
 
 
+class KnownDevices:
+    """Persist known devices in storage instead of known_devices.yaml.
+
+    New devices are written in batches with a delay. The first load migrates
+    the entries of the YAML file, which is left in place for other integrations
+    that still read it. Later edits of the YAML file are not loaded, a warning
+    is logged once for every change.
+    """
+
+    def __init__(self, hass: HomeAssistantType, yaml_path: str) -> None:
+        """Initialize the known devices storage."""
+        self.hass = hass
+        self.yaml_path = yaml_path
+        self.devices: Dict[str, Optional[dict]] = {}
+        self._yaml_mtime: Optional[float] = None
+        # False while the YAML file could not be migrated, nothing is saved
+        # then so the migration is tried again on the next start
+        self._migrated = False
+        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+
+    async def async_load(self) -> Dict[str, Optional[dict]]:
+        """Load the device configurations, migrating the YAML file once."""
+        data = await self._store.async_load()
+        yaml_mtime = await self.hass.async_add_executor_job(_get_mtime, self.yaml_path)
+
+        if data is not None:
+            self.devices = data["devices"]
+            self._yaml_mtime = data.get("yaml_mtime")
+            if yaml_mtime is not None and (
+                self._yaml_mtime is None or yaml_mtime > self._yaml_mtime
+            ):
+                LOGGER.warning(
+                    "%s changed after it was migrated, known devices are now "
+                    "kept in storage and the changes are ignored",
+                    self.yaml_path,
+                )
+                self._yaml_mtime = yaml_mtime
+                self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+            self._migrated = True
+            return self.devices
+
+        try:
+            devices = await self.hass.async_add_executor_job(
+                load_yaml_config_file, self.yaml_path
+            )
+        except HomeAssistantError as err:
+            LOGGER.error(
+                "Unable to migrate %s, tracking without its devices until it "
+                "is fixed: %s",
+                self.yaml_path,
+                str(err),
+            )
+            self.devices = {}
+            return self.devices
+        except FileNotFoundError:
+            devices = {}
+
+        self.devices = {str(dev_id): device for dev_id, device in devices.items()}
+        self._yaml_mtime = yaml_mtime
+        self._migrated = True
+        await self._store.async_save(self._data_to_save())
+        return self.devices
+
+    @callback
+    def async_add(self, device: "Device") -> None:
+        """Add a new device and schedule a batched save."""
+        self.devices[device.dev_id] = device_config(device)
+        if self._migrated:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict:
+        """Return the data to store."""
+        return {"devices": self.devices, "yaml_mtime": self._yaml_mtime}
+
+
+def _get_mtime(path: str) -> Optional[float]:
+    """Return the modification time of a file, None if it does not exist."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
 class DeviceTracker:
     """Representation of a device tracker."""
 
@@ -82,6 +183,7 @@ class DeviceTracker:
         track_new: bool,
         defaults: dict,
         devices: Sequence,
+        known_devices: Optional[KnownDevices] = None,
     ) -> None:
         """Initialize a device tracker."""
         self.hass = hass
@@ -94,6 +196,7 @@ class DeviceTracker:
             else defaults.get(CONF_TRACK_NEW, DEFAULT_TRACK_NEW)
         )
         self.defaults = defaults
+        self.known_devices = known_devices
         self._is_updating = asyncio.Lock()
 
         for dev in devices:
@@ -228,12 +331,15 @@ class DeviceTracker:
             },
         )
 
-        # update known_devices.yaml
-        self.hass.async_create_task(
-            self.async_update_config(
-                self.hass.config.path(YAML_DEVICES), dev_id, device
+        if self.known_devices is not None:
+            self.known_devices.async_add(device)
+        else:
+            # update known_devices.yaml
+            self.hass.async_create_task(
+                self.async_update_config(
+                    self.hass.config.path(YAML_DEVICES), dev_id, device
+                )
             )
-        )
 
     async def async_update_config(self, path, dev_id, device):
         """Add device to YAML configuration file.
@@ -519,6 +625,22 @@ async def async_load_config(
 
     This method is a coroutine.
     """
+    try:
+        devices = await hass.async_add_job(load_yaml_config_file, path)
+    except HomeAssistantError as err:
+        LOGGER.error("Unable to load %s: %s", path, str(err))
+        return []
+    except FileNotFoundError:
+        return []
+
+    return async_devices_from_config(hass, devices, consider_home)
+
+
+@callback
+def async_devices_from_config(
+    hass: HomeAssistantType, devices: Dict[str, Any], consider_home: timedelta
+) -> List["Device"]:
+    """Create devices from their configuration, keyed by device id."""
     dev_schema = vol.Schema(
         {
             vol.Required(CONF_NAME): cv.string,
@@ -536,17 +658,10 @@ async def async_load_config(
         }
     )
     result = []
-    try:
-        devices = await hass.async_add_job(load_yaml_config_file, path)
-    except HomeAssistantError as err:
-        LOGGER.error("Unable to load %s: %s", path, str(err))
-        return []
-    except FileNotFoundError:
-        return []
-
     for dev_id, device in devices.items():
-        # Deprecated option. We just ignore it to avoid breaking change
-        device.pop("vendor", None)
+        if isinstance(device, dict):
+            # Deprecated option. We just ignore it to avoid breaking change
+            device = {key: val for key, val in device.items() if key != "vendor"}
         try:
             device = dev_schema(device)
             device["dev_id"] = cv.slugify(dev_id)
@@ -557,21 +672,23 @@ async def async_load_config(
     return result
 
 
+def device_config(device: Device) -> dict:
+    """Return the configuration to persist for a device."""
+    return {
+        ATTR_NAME: device.name,
+        ATTR_MAC: device.mac,
+        ATTR_ICON: device.icon,
+        "picture": device.config_picture,
+        "track": device.track,
+        CONF_AWAY_HIDE: device.away_hide,
+    }
+
+
 def update_config(path: str, dev_id: str, device: Device):
     """Add device to YAML configuration file."""
     with open(path, "a") as out:
-        device = {
-            device.dev_id: {
-                ATTR_NAME: device.name,
-                ATTR_MAC: device.mac,
-                ATTR_ICON: device.icon,
-                "picture": device.config_picture,
-                "track": device.track,
-                CONF_AWAY_HIDE: device.away_hide,
-            }
-        }
         out.write("\n")
-        out.write(dump(device))
+        out.write(dump({device.dev_id: device_config(device)}))
 
 
 def get_gravatar_for_email(email: str):
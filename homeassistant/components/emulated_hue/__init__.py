@@ -175,6 +175,7 @@ class Config:
         self.type = conf.get(CONF_TYPE)
         self.numbers = None
         self.cached_states = {}
+        self.light_table = None
 
         if self.type == TYPE_ALEXA:
             _LOGGER.warning(
@@ -1,7 +1,10 @@
 """Support for a Hue API to control Home Assistant."""
 import hashlib
+import json
 import logging
 
+from aiohttp import web
+
 from homeassistant import core
 from homeassistant.components import (
     climate,
@@ -48,6 +51,8 @@ from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_SUPPORTED_FEATURES,
     ATTR_TEMPERATURE,
+    CONTENT_TYPE_JSON,
+    EVENT_STATE_CHANGED,
     HTTP_BAD_REQUEST,
     HTTP_NOT_FOUND,
     HTTP_UNAUTHORIZED,
@@ -60,6 +65,7 @@ from homeassistant.const import (
     STATE_ON,
     STATE_UNAVAILABLE,
 )
+from homeassistant.helpers.json import JSONEncoder
 from homeassistant.util.network import is_local
 
 _LOGGER = logging.getLogger(__name__)
@@ -199,7 +205,14 @@ class HueAllLightsStateView(HomeAssistantView):
         if not is_local(request[KEY_REAL_IP]):
             return self.json_message("Only local IPs allowed", HTTP_UNAUTHORIZED)
 
-        return self.json(create_list_of_entities(self.config, request))
+        body, etag = async_get_light_table(self.config, request).async_get_body()
+
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+
+        return web.Response(
+            body=body, content_type=CONTENT_TYPE_JSON, headers={"ETag": etag}
+        )
 
 
 class HueFullStateView(HomeAssistantView):
@@ -485,6 +498,7 @@ class HueOneLightChangeView(HomeAssistantView):
             # status, we report what Alexa will want to see, which is the same
             # as the actual requested command.
             config.cached_states[entity_id] = parsed
+            async_get_light_table(config, request).async_invalidate(entity_id)
 
         # Separate call to turn on needed
         if turn_on_needed:
@@ -585,7 +599,7 @@ def get_entity_state(config, entity):
             level = entity.attributes.get(ATTR_CURRENT_POSITION, 0)
             data[STATE_BRIGHTNESS] = round(level / 100 * 255)
     else:
-        data = cached_state
+        data = dict(cached_state)
         # Make sure brightness is valid
         if data[STATE_BRIGHTNESS] is None:
             data[STATE_BRIGHTNESS] = 255 if data[STATE_ON] else 0
@@ -719,12 +733,93 @@ def create_hue_success_response(entity_id, attr, value):
 
 def create_list_of_entities(config, request):
     """Create a list of all entities."""
-    hass = request.app["hass"]
-    json_response = {}
+    return async_get_light_table(config, request).lights
+
+
+@core.callback
+def async_get_light_table(config, request):
+    """Return the light table of the bridge, creating it on first use."""
+    if config.light_table is None:
+        config.light_table = HueLightTable(request.app["hass"], config)
+    return config.light_table
+
+
+class HueLightTable:
+    """Hue JSON representation of all exposed entities.
+
+    The table is built once and afterwards only entities that changed are
+    converted again, so that polling the list of lights is cheap.
+    """
+
+    def __init__(self, hass, config):
+        """Initialize the light table."""
+        self.hass = hass
+        self.config = config
+        self._lights = {}
+        self._numbers = {}
+        self._dirty = set()
+        self._body = None
+        self._etag = None
+
+        for entity in hass.states.async_all():
+            self._async_update_entity(entity.entity_id, entity)
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+
+    @property
+    def lights(self):
+        """Return the Hue JSON representation of all exposed entities."""
+        self._async_process_dirty()
+        return self._lights
+
+    @core.callback
+    def async_get_body(self):
+        """Return serialized light table and its ETag."""
+        self._async_process_dirty()
+
+        if self._body is None:
+            self._body = json.dumps(
+                self._lights, sort_keys=True, cls=JSONEncoder
+            ).encode("UTF-8")
+            self._etag = '"{}"'.format(hashlib.md5(self._body).hexdigest())
+
+        return self._body, self._etag
+
+    @core.callback
+    def async_invalidate(self, entity_id):
+        """Mark an entity to be converted again."""
+        self._dirty.add(entity_id)
+        self._body = None
+
+    @core.callback
+    def _async_state_changed(self, event):
+        """Mark entities as changed if they are, or were, exposed."""
+        entity_id = event.data["entity_id"]
+        new_state = event.data.get("new_state")
+
+        if entity_id in self._numbers or (
+            new_state is not None and self.config.is_entity_exposed(new_state)
+        ):
+            self.async_invalidate(entity_id)
+
+    @core.callback
+    def _async_process_dirty(self):
+        """Convert all entities that changed since the last request."""
+        while self._dirty:
+            entity_id = self._dirty.pop()
+            self._async_update_entity(entity_id, self.hass.states.get(entity_id))
+
+    @core.callback
+    def _async_update_entity(self, entity_id, entity):
+        """Update the Hue representation of a single entity."""
+        number = self._numbers.pop(entity_id, None)
+
+        if number is not None:
+            self._lights.pop(number, None)
 
-    for entity in hass.states.async_all():
-        if config.is_entity_exposed(entity):
-            number = config.entity_id_to_number(entity.entity_id)
-            json_response[number] = entity_to_json(config, entity)
+        if entity is None or not self.config.is_entity_exposed(entity):
+            return
 
-    return json_response
+        number = self.config.entity_id_to_number(entity_id)
+        self._numbers[entity_id] = number
+        self._lights[number] = entity_to_json(self.config, entity)
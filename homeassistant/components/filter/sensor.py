@@ -6,8 +6,10 @@ from functools import partial
 import logging
 from numbers import Number
 import statistics
-from typing import Optional
+from typing import List, Optional
 
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
 import voluptuous as vol
 
 from homeassistant.components import history
@@ -271,13 +273,43 @@ class SensorFilter(Entity):
             )
 
             # Replay history through the filter chain
-            prev_state = None
-            for state in history_list:
-                filter_sensor_state_listener(self._entity, prev_state, state, False)
-                prev_state = state
+            self._filter_history(history_list)
 
         async_track_state_change(self.hass, self._entity, filter_sensor_state_listener)
 
+    def _filter_history(self, history_list):
+        """Run the history through the filter chain as one batch.
+
+        Every filter processes the whole batch before the next one, which
+        gives the same result as filtering the states one by one.
+        """
+        batch = [
+            (state, FilterState(state))
+            for state in history_list
+            if state.state not in [STATE_UNKNOWN, STATE_UNAVAILABLE]
+        ]
+
+        for filt in self._filters:
+            filtered_states = filt.filter_states([item[1] for item in batch])
+            batch = [
+                (state, filtered)
+                for (state, _), filtered in zip(batch, filtered_states)
+                if filtered is not None
+            ]
+
+        if not batch:
+            return
+
+        self._state = batch[-1][1].state
+
+        if self._icon is None:
+            self._icon = batch[0][0].attributes.get(ATTR_ICON, ICON)
+
+        if self._unit_of_measurement is None:
+            self._unit_of_measurement = batch[0][0].attributes.get(
+                ATTR_UNIT_OF_MEASUREMENT
+            )
+
     @property
     def name(self):
         """Return the name of the sensor."""
@@ -314,8 +346,11 @@ class FilterState:
     """State abstraction for filter usage."""
 
     def __init__(self, state):
-        """Initialize with HA State object."""
-        self.timestamp = state.last_updated
+        """Initialize with HA State object or another FilterState."""
+        if isinstance(state, FilterState):
+            self.timestamp = state.timestamp
+        else:
+            self.timestamp = state.last_updated
         try:
             self.state = float(state.state)
         except ValueError:
@@ -386,14 +421,64 @@ class Filter:
 
     def filter_state(self, new_state):
         """Implement a common interface for filters."""
-        filtered = self._filter_state(FilterState(new_state))
+        filtered = self._filter_single(FilterState(new_state))
+        new_state.state = filtered.state
+        return new_state
+
+    def _filter_single(self, raw):
+        """Filter a single state and add it to the window."""
+        filtered = self._filter_state(copy(raw))
         filtered.set_precision(self.precision)
         if self._store_raw:
-            self.states.append(copy(FilterState(new_state)))
+            self.states.append(raw)
         else:
             self.states.append(copy(filtered))
-        new_state.state = filtered.state
-        return new_state
+        return filtered
+
+    def filter_states(self, new_states: List[FilterState]) -> List[FilterState]:
+        """Filter a batch of states, oldest first.
+
+        Returns the filtered states in the same order, with None for the
+        states that are skipped or cannot be filtered.
+        """
+        filtered_states = []
+
+        for new_state in new_states:
+            try:
+                filtered = self._filter_single(FilterState(new_state))
+            except ValueError:
+                _LOGGER.error("Could not convert state: %s to number", new_state)
+                filtered = None
+
+            if filtered is not None and self.skip_processing:
+                filtered = None
+
+            filtered_states.append(filtered)
+
+        return filtered_states
+
+    def _finish_batch(self, raw_states, values):
+        """Round the values of a vectorized batch and add them to the window."""
+        filtered_states = []
+
+        for raw, value in zip(raw_states, values):
+            filtered = FilterState(raw)
+            filtered.state = value
+            filtered.set_precision(self.precision)
+            filtered_states.append(filtered)
+
+        window = raw_states if self._store_raw else filtered_states
+        if self.states.maxlen:
+            self.states.extend(copy(state) for state in window[-self.states.maxlen :])
+
+        return filtered_states
+
+
+def _batch_values(states):
+    """Return the values of a batch of states as array, None if not numeric."""
+    if not all(isinstance(state.state, float) for state in states):
+        return None
+    return np.fromiter((state.state for state in states), float, len(states))
 
 
 @FILTERS.register(FILTER_NAME_RANGE)
@@ -449,6 +534,26 @@ class RangeFilter(Filter):
 
         return new_state
 
+    def filter_states(self, new_states):
+        """Filter a batch of states with NumPy."""
+        raw_states = [FilterState(new_state) for new_state in new_states]
+        values = _batch_values(raw_states)
+
+        if values is None:
+            return super().filter_states(new_states)
+
+        filtered = values
+        if self._upper_bound is not None:
+            upper = filtered > self._upper_bound
+            self._stats_internal["erasures_up"] += int(upper.sum())
+            filtered = np.where(upper, self._upper_bound, filtered)
+        if self._lower_bound is not None:
+            lower = filtered < self._lower_bound
+            self._stats_internal["erasures_low"] += int(lower.sum())
+            filtered = np.where(lower, self._lower_bound, filtered)
+
+        return self._finish_batch(raw_states, filtered.tolist())
+
 
 @FILTERS.register(FILTER_NAME_OUTLIER)
 class OutlierFilter(Filter):
@@ -486,6 +591,39 @@ class OutlierFilter(Filter):
             new_state.state = median
         return new_state
 
+    def filter_states(self, new_states):
+        """Filter a batch of states with NumPy.
+
+        The median of every full window of previous raw states is calculated
+        at once over a sliding view of the window and the batch.
+        """
+        size = self.states.maxlen
+        raw_states = [FilterState(new_state) for new_state in new_states]
+        values = _batch_values(list(self.states) + raw_states)
+
+        if values is None or not size or not raw_states:
+            return super().filter_states(new_states)
+
+        filtered = values[len(self.states) :]
+        # The first state in the batch that has a full window before it
+        first = max(size - len(self.states), 0)
+
+        if first < len(raw_states):
+            stride = values.strides[0]
+            windows = as_strided(
+                values[len(self.states) + first - size :],
+                shape=(len(raw_states) - first, size),
+                strides=(stride, stride),
+                writeable=False,
+            )
+            medians = np.median(windows, axis=1)
+            outliers = np.abs(filtered[first:] - medians) > self._radius
+            self._stats_internal["erasures"] += int(outliers.sum())
+            filtered = filtered.copy()
+            filtered[first:] = np.where(outliers, medians, filtered[first:])
+
+        return self._finish_batch(raw_states, filtered.tolist())
+
 
 @FILTERS.register(FILTER_NAME_LOWPASS)
 class LowPassFilter(Filter):
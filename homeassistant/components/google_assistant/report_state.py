@@ -12,6 +12,9 @@ from .helpers import AbstractConfig, GoogleEntity, async_get_entities
 # https://github.com/actions-on-google/smart-home-nodejs/issues/196#issuecomment-439156639
 INITIAL_REPORT_DELAY = 60
 
+# Time to collect state changes before reporting them in a single message
+REPORT_STATE_WINDOW = 1
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,9 +22,31 @@ _LOGGER = logging.getLogger(__name__)
 @callback
 def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig):
     """Enable state reporting."""
+    # Last serialized state per entity, reported or pending to be reported
+    checker = {}
+    pending = {}
+    unsub_pending = None
+    unsub_initial = None
+
+    async def report_states(_now=None):
+        """Report the collected states to Google."""
+        nonlocal pending, unsub_pending
+
+        unsub_pending = None
+        states, pending = pending, {}
+
+        if not states:
+            return
+
+        await google_config.async_report_state_all({"devices": {"states": states}})
+
+    @callback
+    def async_entity_state_listener(changed_entity, old_state, new_state):
+        nonlocal unsub_pending
 
-    async def async_entity_state_listener(changed_entity, old_state, new_state):
         if not new_state:
+            checker.pop(changed_entity, None)
+            pending.pop(changed_entity, None)
             return
 
         if not google_config.should_expose(new_state):
@@ -38,19 +63,33 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
             _LOGGER.debug("Not reporting state for %s: %s", changed_entity, err.code)
             return
 
-        if old_state:
-            old_entity = GoogleEntity(hass, google_config, old_state)
+        if changed_entity in checker:
+            old_entity_data = checker[changed_entity]
+        elif old_state:
+            try:
+                old_entity_data = GoogleEntity(
+                    hass, google_config, old_state
+                ).query_serialize()
+            except SmartHomeError:
+                old_entity_data = None
+        else:
+            old_entity_data = None
 
-            # Only report to Google if data that Google cares about has changed
-            if entity_data == old_entity.query_serialize():
-                return
+        # Only report to Google if data that Google cares about has changed
+        if entity_data == old_entity_data:
+            return
+
+        checker[changed_entity] = entity_data
+        pending[changed_entity] = entity_data
 
-        await google_config.async_report_state_all(
-            {"devices": {"states": {changed_entity: entity_data}}}
-        )
+        if unsub_pending is None:
+            unsub_pending = async_call_later(hass, REPORT_STATE_WINDOW, report_states)
 
     async def inital_report(_now):
         """Report initially all states."""
+        nonlocal unsub_initial
+
+        unsub_initial = None
         entities = {}
 
         for entity in async_get_entities(hass, google_config):
@@ -62,10 +101,25 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
             except SmartHomeError:
                 continue
 
+        checker.update(entities)
+
         await google_config.async_report_state_all({"devices": {"states": entities}})
 
-    async_call_later(hass, INITIAL_REPORT_DELAY, inital_report)
+    unsub_initial = async_call_later(hass, INITIAL_REPORT_DELAY, inital_report)
 
-    return hass.helpers.event.async_track_state_change(
+    unsub_listener = hass.helpers.event.async_track_state_change(
         MATCH_ALL, async_entity_state_listener
     )
+
+    @callback
+    def unsub():
+        """Stop reporting states."""
+        unsub_listener()
+
+        if unsub_initial is not None:
+            unsub_initial()
+
+        if unsub_pending is not None:
+            unsub_pending()
+
+    return unsub
@@ -441,6 +441,10 @@ class Group(Entity):
         self._order = order
         self._assumed_state = False
         self._async_unsub_state_changed = None
+        # Running counts of the member states, per member (is_on, assumed)
+        self._members = {}
+        self._on_count = 0
+        self._assumed_count = 0
 
     @staticmethod
     def create_group(
@@ -492,7 +496,7 @@ class Group(Entity):
         group = Group(
             hass,
             name,
-            order=len(hass.states.async_entity_ids(DOMAIN)),
+            order=hass.states.async_entity_ids_count(DOMAIN),
             visible=visible,
             icon=icon,
             view=view,
@@ -649,67 +653,75 @@ class Group(Entity):
 
         return states
 
+    @callback
+    def _async_count_members(self):
+        """Count the states of all members."""
+        self._members = {}
+        self._on_count = 0
+        self._assumed_count = 0
+
+        for entity_id in self.tracking:
+            self._async_count_member(entity_id, self.hass.states.get(entity_id))
+
+    @callback
+    def _async_count_member(self, entity_id, state):
+        """Replace the counted state of a member."""
+        old = self._members.pop(entity_id, None)
+
+        if old is not None:
+            self._on_count -= old[0]
+            self._assumed_count -= old[1]
+
+        if state is None:
+            return
+
+        new = (
+            state.state == self.group_on,
+            bool(state.attributes.get(ATTR_ASSUMED_STATE)),
+        )
+        self._members[entity_id] = new
+        self._on_count += new[0]
+        self._assumed_count += new[1]
+
     @callback
     def _async_update_group_state(self, tr_state=None):
         """Update group state.
 
         Optionally you can provide the only state changed since last update
-        allowing this method to take shortcuts.
+        so only that member has to be counted again.
 
         This method must be run in the event loop.
         """
-        # To store current states of group entities. Might not be needed.
-        states = None
-        gr_state = self._state
-        gr_on = self.group_on
-        gr_off = self.group_off
-
         # We have not determined type of group yet
-        if gr_on is None:
-            if tr_state is None:
-                states = self._tracking_states
+        if self.group_on is None:
+            gr_on, gr_off = None, None
 
-                for state in states:
+            if tr_state is None:
+                for state in self._tracking_states:
                     gr_on, gr_off = _get_group_on_off(state.state)
                     if gr_on is not None:
                         break
             else:
                 gr_on, gr_off = _get_group_on_off(tr_state.state)
 
-            if gr_on is not None:
-                self.group_on, self.group_off = gr_on, gr_off
-
-        # We cannot determine state of the group
-        if gr_on is None:
-            return
-
-        if tr_state is None or (
-            (gr_state == gr_on and tr_state.state == gr_off)
-            or (gr_state == gr_off and tr_state.state == gr_on)
-            or tr_state.state not in (gr_on, gr_off)
-        ):
-            if states is None:
-                states = self._tracking_states
-
-            if self.mode(state.state == gr_on for state in states):
-                self._state = gr_on
-            else:
-                self._state = gr_off
+            # We cannot determine state of the group
+            if gr_on is None:
+                return
 
-        elif tr_state.state in (gr_on, gr_off):
-            self._state = tr_state.state
+            self.group_on, self.group_off = gr_on, gr_off
+            # Members have not been counted yet
+            tr_state = None
 
-        if (
-            tr_state is None
-            or self._assumed_state
-            and not tr_state.attributes.get(ATTR_ASSUMED_STATE)
-        ):
-            if states is None:
-                states = self._tracking_states
+        if tr_state is None:
+            self._async_count_members()
+        else:
+            self._async_count_member(tr_state.entity_id, tr_state)
 
-            self._assumed_state = self.mode(
-                state.attributes.get(ATTR_ASSUMED_STATE) for state in states
-            )
+        if self.mode is all:
+            is_on = self._on_count == len(self._members)
+            self._assumed_state = self._assumed_count == len(self._members)
+        else:
+            is_on = self._on_count > 0
+            self._assumed_state = self._assumed_count > 0
 
-        elif tr_state.attributes.get(ATTR_ASSUMED_STATE):
-            self._assumed_state = True
+        self._state = self.group_on if is_on else self.group_off
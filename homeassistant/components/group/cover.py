@@ -1,6 +1,7 @@
 """This platform allows several cover to be grouped into one cover."""
+from collections import Counter
 import logging
-from typing import Dict, Optional, Set
+from typing import Any, Dict, Optional, Set
 
 import voluptuous as vol
 
@@ -89,6 +90,11 @@ class CoverGroup(CoverDevice):
             KEY_STOP: set(),
             KEY_POSITION: set(),
         }
+        # Running aggregates of the member states
+        self._not_closed: Set[str] = set()
+        self._assumed: Set[str] = set()
+        self._cover_positions = _PositionCounter()
+        self._tilt_positions = _PositionCounter()
 
     @callback
     def update_supported_features(
@@ -104,6 +110,10 @@ class CoverGroup(CoverDevice):
                 values.discard(entity_id)
             for values in self._tilts.values():
                 values.discard(entity_id)
+            self._not_closed.discard(entity_id)
+            self._assumed.discard(entity_id)
+            self._cover_positions.async_remove(entity_id)
+            self._tilt_positions.async_remove(entity_id)
             if update_state:
                 self.async_schedule_update_ha_state(True)
             return
@@ -136,6 +146,28 @@ class CoverGroup(CoverDevice):
         else:
             self._tilts[KEY_POSITION].discard(entity_id)
 
+        if new_state.state != STATE_CLOSED:
+            self._not_closed.add(entity_id)
+        else:
+            self._not_closed.discard(entity_id)
+        if new_state.attributes.get(ATTR_ASSUMED_STATE):
+            self._assumed.add(entity_id)
+        else:
+            self._assumed.discard(entity_id)
+
+        if entity_id in self._covers[KEY_POSITION]:
+            self._cover_positions.async_set(
+                entity_id, new_state.attributes.get(ATTR_CURRENT_POSITION)
+            )
+        else:
+            self._cover_positions.async_remove(entity_id)
+        if entity_id in self._tilts[KEY_POSITION]:
+            self._tilt_positions.async_set(
+                entity_id, new_state.attributes.get(ATTR_CURRENT_TILT_POSITION)
+            )
+        else:
+            self._tilt_positions.async_remove(entity_id)
+
         if update_state:
             self.async_schedule_update_ha_state(True)
 
@@ -252,46 +284,23 @@ class CoverGroup(CoverDevice):
         """Update state and attributes."""
         self._assumed_state = False
 
-        self._is_closed = True
-        for entity_id in self._entities:
-            state = self.hass.states.get(entity_id)
-            if not state:
-                continue
-            if state.state != STATE_CLOSED:
-                self._is_closed = False
-                break
+        self._is_closed = not self._not_closed
 
         self._cover_position = None
         if self._covers[KEY_POSITION]:
-            position = -1
             self._cover_position = 0 if self.is_closed else 100
-            for entity_id in self._covers[KEY_POSITION]:
-                state = self.hass.states.get(entity_id)
-                pos = state.attributes.get(ATTR_CURRENT_POSITION)
-                if position == -1:
-                    position = pos
-                elif position != pos:
-                    self._assumed_state = True
-                    break
-            else:
-                if position != -1:
-                    self._cover_position = position
+            if len(self._cover_positions) > 1:
+                self._assumed_state = True
+            elif self._cover_positions:
+                self._cover_position = self._cover_positions.value
 
         self._tilt_position = None
         if self._tilts[KEY_POSITION]:
-            position = -1
             self._tilt_position = 100
-            for entity_id in self._tilts[KEY_POSITION]:
-                state = self.hass.states.get(entity_id)
-                pos = state.attributes.get(ATTR_CURRENT_TILT_POSITION)
-                if position == -1:
-                    position = pos
-                elif position != pos:
-                    self._assumed_state = True
-                    break
-            else:
-                if position != -1:
-                    self._tilt_position = position
+            if len(self._tilt_positions) > 1:
+                self._assumed_state = True
+            elif self._tilt_positions:
+                self._tilt_position = self._tilt_positions.value
 
         supported_features = 0
         supported_features |= (
@@ -308,9 +317,41 @@ class CoverGroup(CoverDevice):
         )
         self._supported_features = supported_features
 
-        if not self._assumed_state:
-            for entity_id in self._entities:
-                state = self.hass.states.get(entity_id)
-                if state and state.attributes.get(ATTR_ASSUMED_STATE):
-                    self._assumed_state = True
-                    break
+        if self._assumed:
+            self._assumed_state = True
+
+
+class _PositionCounter:
+    """Count the distinct positions reported by the members of a group."""
+
+    def __init__(self) -> None:
+        """Initialize the counter."""
+        self._positions: Dict[str, Any] = {}
+        self._counts: Counter = Counter()
+
+    def __len__(self) -> int:
+        """Return the number of distinct positions."""
+        return len(self._counts)
+
+    @property
+    def value(self) -> Any:
+        """Return a reported position."""
+        return next(iter(self._counts))
+
+    @callback
+    def async_set(self, entity_id: str, position: Any) -> None:
+        """Set the position of a member."""
+        self.async_remove(entity_id)
+        self._positions[entity_id] = position
+        self._counts[position] += 1
+
+    @callback
+    def async_remove(self, entity_id: str) -> None:
+        """Remove a member."""
+        if entity_id not in self._positions:
+            return
+
+        position = self._positions.pop(entity_id)
+        self._counts[position] -= 1
+        if not self._counts[position]:
+            del self._counts[position]
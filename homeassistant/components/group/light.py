@@ -1,9 +1,9 @@
 """This platform allows several lights to be grouped into one light."""
 import asyncio
 from collections import Counter
-import itertools
 import logging
-from typing import Any, Callable, Iterator, List, Optional, Tuple, cast
+import math
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, cast
 
 import voluptuous as vol
 
@@ -66,6 +66,12 @@ SUPPORT_GROUP_LIGHT = (
     | SUPPORT_WHITE_VALUE
 )
 
+SUPPORT_GROUP_LIGHT_BITS = [
+    bit
+    for bit in range(SUPPORT_GROUP_LIGHT.bit_length())
+    if SUPPORT_GROUP_LIGHT >> bit & 1
+]
+
 
 async def async_setup_platform(
     hass: HomeAssistantType, config: ConfigType, async_add_entities, discovery_info=None
@@ -94,6 +100,7 @@ class LightGroup(light.Light):
         self._effect_list: Optional[List[str]] = None
         self._effect: Optional[str] = None
         self._supported_features: int = 0
+        self._aggregate = _LightGroupAggregate()
         self._async_unsub_state_changed: Optional[CALLBACK_TYPE] = None
 
     async def async_added_to_hass(self) -> None:
@@ -104,7 +111,9 @@ class LightGroup(light.Light):
             entity_id: str, old_state: State, new_state: State
         ):
             """Handle child updates."""
-            self.async_schedule_update_ha_state(True)
+            self._aggregate.async_set(entity_id, new_state)
+            self._async_update_from_aggregate()
+            self.async_write_ha_state()
 
         assert self.hass is not None
         self._async_unsub_state_changed = async_track_state_change(
@@ -267,84 +276,220 @@ class LightGroup(light.Light):
 
     async def async_update(self):
         """Query all members and determine the light group state."""
-        all_states = [self.hass.states.get(x) for x in self._entity_ids]
-        states: List[State] = list(filter(None, all_states))
-        on_states = [state for state in states if state.state == STATE_ON]
+        self._aggregate = _LightGroupAggregate()
+        for entity_id in self._entity_ids:
+            self._aggregate.async_set(entity_id, self.hass.states.get(entity_id))
+        self._async_update_from_aggregate()
 
-        self._is_on = len(on_states) > 0
-        self._available = any(state.state != STATE_UNAVAILABLE for state in states)
+    @callback
+    def _async_update_from_aggregate(self) -> None:
+        """Determine the light group state from the member aggregate."""
+        aggregate = self._aggregate
 
-        self._brightness = _reduce_attribute(on_states, ATTR_BRIGHTNESS)
+        self._is_on = bool(aggregate.on)
+        self._available = bool(aggregate.available)
 
-        self._hs_color = _reduce_attribute(on_states, ATTR_HS_COLOR, reduce=_mean_tuple)
+        self._brightness = aggregate.brightness.value
+        self._hs_color = aggregate.hs_color.value
+        self._white_value = aggregate.white_value.value
+        self._color_temp = aggregate.color_temp.value
 
-        self._white_value = _reduce_attribute(on_states, ATTR_WHITE_VALUE)
-
-        self._color_temp = _reduce_attribute(on_states, ATTR_COLOR_TEMP)
-        self._min_mireds = _reduce_attribute(
-            states, ATTR_MIN_MIREDS, default=154, reduce=min
-        )
-        self._max_mireds = _reduce_attribute(
-            states, ATTR_MAX_MIREDS, default=500, reduce=max
-        )
+        self._min_mireds = min(aggregate.min_mireds.counts, default=154)
+        self._max_mireds = max(aggregate.max_mireds.counts, default=500)
 
         self._effect_list = None
-        all_effect_lists = list(_find_state_attributes(states, ATTR_EFFECT_LIST))
-        if all_effect_lists:
+        if aggregate.effect_list:
             # Merge all effects from all effect_lists with a union merge.
-            self._effect_list = list(set().union(*all_effect_lists))
+            self._effect_list = list(aggregate.effect_list.counts)
 
         self._effect = None
-        all_effects = list(_find_state_attributes(on_states, ATTR_EFFECT))
-        if all_effects:
+        if aggregate.effect:
             # Report the most common effect.
-            effects_count = Counter(itertools.chain(all_effects))
-            self._effect = effects_count.most_common(1)[0][0]
+            self._effect = aggregate.effect.counts.most_common(1)[0][0]
 
+        # Merge supported features by emulating support for every feature
+        # we find. Only the features of the GroupedLight are counted so
+        # that we don't break in the future when a new feature is added.
         self._supported_features = 0
-        for support in _find_state_attributes(states, ATTR_SUPPORTED_FEATURES):
-            # Merge supported features by emulating support for every feature
-            # we find.
-            self._supported_features |= support
-        # Bitwise-and the supported features with the GroupedLight's features
-        # so that we don't break in the future when a new feature is added.
-        self._supported_features &= SUPPORT_GROUP_LIGHT
+        for bit in aggregate.supported_features.counts:
+            self._supported_features |= 1 << bit
+
 
+class _LightGroupAggregate:
+    """Running aggregate of the member states of a light group.
 
-def _find_state_attributes(states: List[State], key: str) -> Iterator[Any]:
-    """Find attributes with matching key from states."""
-    for state in states:
-        value = state.attributes.get(key)
-        if value is not None:
-            yield value
+    Every member adds its contribution to the aggregate, so a member state
+    change only has to replace the contribution of that member.
+    """
 
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        self.on: Set[str] = set()
+        self.available: Set[str] = set()
+        self.brightness = _RunningMean()
+        self.hs_color = _RunningMean()
+        self.white_value = _RunningMean()
+        self.color_temp = _RunningMean()
+        self.min_mireds = _RunningCounter()
+        self.max_mireds = _RunningCounter()
+        self.effect_list = _RunningCounter()
+        self.effect = _RunningCounter()
+        self.supported_features = _RunningCounter()
+
+    @callback
+    def async_set(self, entity_id: str, state: Optional[State]) -> None:
+        """Replace the contribution of a member."""
+        attrs = state.attributes if state is not None else {}
+        is_on = state is not None and state.state == STATE_ON
+        on_attrs = attrs if is_on else {}
+
+        if is_on:
+            self.on.add(entity_id)
+        else:
+            self.on.discard(entity_id)
+
+        if state is not None and state.state != STATE_UNAVAILABLE:
+            self.available.add(entity_id)
+        else:
+            self.available.discard(entity_id)
+
+        self.brightness.async_set(entity_id, on_attrs.get(ATTR_BRIGHTNESS))
+        self.hs_color.async_set(entity_id, on_attrs.get(ATTR_HS_COLOR))
+        self.white_value.async_set(entity_id, on_attrs.get(ATTR_WHITE_VALUE))
+        self.color_temp.async_set(entity_id, on_attrs.get(ATTR_COLOR_TEMP))
+        self.min_mireds.async_set(entity_id, _single(attrs.get(ATTR_MIN_MIREDS)))
+        self.max_mireds.async_set(entity_id, _single(attrs.get(ATTR_MAX_MIREDS)))
+        self.effect_list.async_set(entity_id, attrs.get(ATTR_EFFECT_LIST))
+        self.effect.async_set(entity_id, _single(on_attrs.get(ATTR_EFFECT)))
+
+        support = attrs.get(ATTR_SUPPORTED_FEATURES)
+        self.supported_features.async_set(
+            entity_id,
+            None
+            if support is None
+            else [bit for bit in SUPPORT_GROUP_LIGHT_BITS if support >> bit & 1],
+        )
 
-def _mean_int(*args):
-    """Return the mean of the supplied values."""
-    return int(sum(args) / len(args))
 
+class _RunningMean:
+    """Running mean of an attribute of the members reporting it.
 
-def _mean_tuple(*args):
-    """Return the mean values along the columns of the supplied values."""
-    return tuple(sum(l) / len(l) for l in zip(*args))
+    Tuple values are averaged along their columns.
+    """
 
+    def __init__(self) -> None:
+        """Initialize the running mean."""
+        self._values: Dict[str, Any] = {}
+        self._total: Any = None
+        self._removed = 0
 
-def _reduce_attribute(
-    states: List[State],
-    key: str,
-    default: Optional[Any] = None,
-    reduce: Callable[..., Any] = _mean_int,
-) -> Any:
-    """Find the first attribute matching key from states.
+    @property
+    def value(self) -> Any:
+        """Return the mean, or the value if only one member reports it."""
+        if not self._values:
+            return None
 
-    If none are found, return default.
-    """
-    attrs = list(_find_state_attributes(states, key))
+        if len(self._values) == 1:
+            return next(iter(self._values.values()))
+
+        if isinstance(self._total, tuple):
+            return tuple(total / len(self._values) for total in self._total)
+
+        return int(self._total / len(self._values))
+
+    @callback
+    def async_set(self, entity_id: str, value: Any) -> None:
+        """Set the value of a member, None if it does not report one."""
+        self.async_remove(entity_id)
+
+        if value is None:
+            return
+
+        self._values[entity_id] = value
+        self._total = _add(self._total, value, 1)
+
+    @callback
+    def async_remove(self, entity_id: str) -> None:
+        """Remove a member."""
+        if entity_id not in self._values:
+            return
+
+        value = self._values.pop(entity_id)
+
+        if not self._values:
+            self._removed = 0
+            self._total = None
+            return
+
+        self._total = _add(self._total, value, -1)
+
+        self._removed += 1
+        if self._removed >= len(self._values):
+            self._resync()
+
+    def _resync(self) -> None:
+        """Recalculate the total once per member count of removals.
+
+        This bounds the floating point error the removals accumulate.
+        """
+        self._removed = 0
+        values = list(self._values.values())
+
+        if isinstance(values[0], (list, tuple)):
+            self._total = tuple(math.fsum(column) for column in zip(*values))
+        else:
+            self._total = math.fsum(values)
+
+
+class _RunningCounter:
+    """Count the values of an attribute of the members reporting it."""
+
+    def __init__(self) -> None:
+        """Initialize the counter."""
+        self._values: Dict[str, Tuple[Any, ...]] = {}
+        self.counts: Counter = Counter()
+
+    def __len__(self) -> int:
+        """Return the number of members reporting the attribute."""
+        return len(self._values)
+
+    @callback
+    def async_set(self, entity_id: str, values: Optional[Iterable[Any]]) -> None:
+        """Set the values of a member, None if it does not report any."""
+        self.async_remove(entity_id)
+
+        if values is None:
+            return
+
+        self._values[entity_id] = tuple(values)
+        self.counts.update(self._values[entity_id])
+
+    @callback
+    def async_remove(self, entity_id: str) -> None:
+        """Remove a member."""
+        if entity_id not in self._values:
+            return
+
+        for value in self._values.pop(entity_id):
+            self.counts[value] -= 1
+            if not self.counts[value]:
+                del self.counts[value]
+
+
+def _single(value: Any) -> Optional[Tuple[Any]]:
+    """Return a single attribute value as values for a counter."""
+    if value is None:
+        return None
+    return (value,)
 
-    if not attrs:
-        return default
 
-    if len(attrs) == 1:
-        return attrs[0]
+def _add(total: Any, value: Any, sign: int) -> Any:
+    """Add a value to a running total."""
+    if isinstance(value, (list, tuple)):
+        if total is None:
+            return tuple(sign * val for val in value)
+        return tuple(tot + sign * val for tot, val in zip(total, value))
 
-    return reduce(*attrs)
+    if total is None:
+        return sign * value
+    return total + sign * value
@@ -2,24 +2,24 @@
 from datetime import timedelta
 from functools import partial, wraps
 from inspect import getmodule
+import json
 import logging
+import threading
 
-from pyhap.accessory import Accessory, Bridge
+from pyhap.accessory import Accessory, Bridge, get_topic
 from pyhap.accessory_driver import AccessoryDriver
-from pyhap.const import CATEGORY_OTHER
+from pyhap.const import CATEGORY_OTHER, HAP_REPR_AID, HAP_REPR_CHARS, HAP_REPR_IID
 
 from homeassistant.const import (
     ATTR_BATTERY_CHARGING,
     ATTR_BATTERY_LEVEL,
     ATTR_ENTITY_ID,
     ATTR_SERVICE,
+    EVENT_STATE_CHANGED,
     __version__,
 )
 from homeassistant.core import callback as ha_callback, split_entity_id
-from homeassistant.helpers.event import (
-    async_track_state_change,
-    track_point_in_utc_time,
-)
+from homeassistant.helpers.event import track_point_in_utc_time
 from homeassistant.util import dt as dt_util
 
 from .const import (
@@ -32,6 +32,7 @@ from .const import (
     CHAR_STATUS_LOW_BATTERY,
     CONF_LINKED_BATTERY_SENSOR,
     CONF_LOW_BATTERY_THRESHOLD,
+    DATA_STATE_LISTENERS,
     DEBOUNCE_TIMEOUT,
     DEFAULT_LOW_BATTERY_THRESHOLD,
     EVENT_HOMEKIT_CHANGED,
@@ -74,6 +75,45 @@ def debounce(func):
     return wrapper
 
 
+@ha_callback
+def async_track_accessory_state(hass, entity_id, action):
+    """Track the state of an entity with the listener shared by accessories.
+
+    A single state_changed listener routes each change to the actions
+    registered for its entity_id.
+    """
+    listeners = hass.data.get(DATA_STATE_LISTENERS)
+    if listeners is None:
+        listeners = hass.data[DATA_STATE_LISTENERS] = {}
+
+        @ha_callback
+        def state_change_listener(event):
+            """Route the state change to the accessories of the entity."""
+            entity_id = event.data.get(ATTR_ENTITY_ID)
+            for entity_action in listeners.get(entity_id, ()):
+                hass.async_run_job(
+                    entity_action,
+                    entity_id,
+                    event.data.get("old_state"),
+                    event.data.get("new_state"),
+                )
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, state_change_listener)
+
+    listeners.setdefault(entity_id, []).append(action)
+
+    @ha_callback
+    def remove_listener():
+        """Stop tracking the state of the entity."""
+        actions = listeners.get(entity_id, [])
+        if action in actions:
+            actions.remove(action)
+        if not actions:
+            listeners.pop(entity_id, None)
+
+    return remove_listener
+
+
 class HomeAccessory(Accessory):
     """Adapter class for Accessory."""
 
@@ -143,14 +183,16 @@ class HomeAccessory(Accessory):
         """
         state = self.hass.states.get(self.entity_id)
         self.hass.async_add_job(self.update_state_callback, None, None, state)
-        async_track_state_change(self.hass, self.entity_id, self.update_state_callback)
+        async_track_accessory_state(
+            self.hass, self.entity_id, self.update_state_callback
+        )
 
         if self.linked_battery_sensor:
             battery_state = self.hass.states.get(self.linked_battery_sensor)
             self.hass.async_add_job(
                 self.update_linked_battery, None, None, battery_state
             )
-            async_track_state_change(
+            async_track_accessory_state(
                 self.hass, self.linked_battery_sensor, self.update_linked_battery
             )
 
@@ -245,6 +287,57 @@ class HomeDriver(AccessoryDriver):
         """Initialize a AccessoryDriver object."""
         super().__init__(**kwargs)
         self.hass = hass
+        self._pending_events = []
+        self._pending_lock = threading.Lock()
+
+    def publish(self, data, sender_client_addr=None):
+        """Queue a characteristic change until the next event loop iteration.
+
+        Changes queued in the same iteration are sent as one event per client.
+        """
+        with self._pending_lock:
+            self._pending_events.append((data, sender_client_addr))
+            if len(self._pending_events) > 1:
+                return
+        self.hass.loop.call_soon_threadsafe(self.async_flush_events)
+
+    @ha_callback
+    def async_flush_events(self):
+        """Group the queued characteristic changes by subscribed client."""
+        with self._pending_lock:
+            pending, self._pending_events = self._pending_events, []
+
+        client_chars = {}
+        with self.topic_lock:
+            for data, sender_client_addr in pending:
+                topic = get_topic(data[HAP_REPR_AID], data[HAP_REPR_IID])
+                for client_addr in self.topics.get(topic, ()):
+                    # Clients are not notified about their own changes.
+                    if client_addr != sender_client_addr:
+                        client_chars.setdefault(client_addr, {})[topic] = data
+
+        for client_addr, chars in client_chars.items():
+            bytedata = json.dumps({HAP_REPR_CHARS: list(chars.values())}).encode()
+            self.event_queue.put((client_addr, bytedata))
+
+    def send_events(self):
+        """Send the batched events from the queue to their clients.
+
+        Run inside the event dispatch thread of the accessory driver.
+        """
+        while not self.loop.is_closed():
+            client_addr, bytedata = self.event_queue.get()
+            if not self.http_server.push_event(bytedata, client_addr):
+                _LOGGER.debug("Could not send event to %s", client_addr)
+                with self.topic_lock:
+                    topics = [
+                        topic
+                        for topic, clients in self.topics.items()
+                        if client_addr in clients
+                    ]
+                for topic in topics:
+                    self.subscribe_client_topic(client_addr, topic, False)
+            self.event_queue.task_done()
 
     def pair(self, client_uuid, client_public):
         """Override super function to dismiss setup message if paired."""
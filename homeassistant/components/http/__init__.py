@@ -44,6 +44,7 @@ CONF_USE_X_FORWARDED_FOR = "use_x_forwarded_for"
 CONF_TRUSTED_PROXIES = "trusted_proxies"
 CONF_LOGIN_ATTEMPTS_THRESHOLD = "login_attempts_threshold"
 CONF_IP_BAN_ENABLED = "ip_ban_enabled"
+CONF_IP_BAN_DURATION = "ip_ban_duration"
 CONF_SSL_PROFILE = "ssl_profile"
 
 SSL_MODERN = "modern"
@@ -82,6 +83,9 @@ HTTP_SCHEMA = vol.Schema(
             CONF_LOGIN_ATTEMPTS_THRESHOLD, default=NO_LOGIN_ATTEMPT_THRESHOLD
         ): vol.Any(cv.positive_int, NO_LOGIN_ATTEMPT_THRESHOLD),
         vol.Optional(CONF_IP_BAN_ENABLED, default=True): cv.boolean,
+        vol.Optional(CONF_IP_BAN_DURATION): vol.All(
+            cv.time_period, cv.positive_timedelta
+        ),
         vol.Optional(CONF_SSL_PROFILE, default=SSL_MODERN): vol.In(
             [SSL_INTERMEDIATE, SSL_MODERN]
         ),
@@ -137,6 +141,7 @@ async def async_setup(hass, config):
     use_x_forwarded_for = conf.get(CONF_USE_X_FORWARDED_FOR, False)
     trusted_proxies = conf.get(CONF_TRUSTED_PROXIES, [])
     is_ban_enabled = conf[CONF_IP_BAN_ENABLED]
+    ban_duration = conf.get(CONF_IP_BAN_DURATION)
     login_threshold = conf[CONF_LOGIN_ATTEMPTS_THRESHOLD]
     ssl_profile = conf[CONF_SSL_PROFILE]
 
@@ -152,6 +157,7 @@ async def async_setup(hass, config):
         trusted_proxies=trusted_proxies,
         login_threshold=login_threshold,
         is_ban_enabled=is_ban_enabled,
+        ban_duration=ban_duration,
         ssl_profile=ssl_profile,
     )
 
@@ -167,13 +173,17 @@ async def async_setup(hass, config):
         # If we are set up successful, we store the HTTP settings for safe mode.
         store = storage.Store(hass, STORAGE_VERSION, STORAGE_KEY)
 
+        conf_to_save = dict(conf)
+
         if CONF_TRUSTED_PROXIES in conf:
-            conf_to_save = dict(conf)
             conf_to_save[CONF_TRUSTED_PROXIES] = [
                 str(ip.network_address) for ip in conf_to_save[CONF_TRUSTED_PROXIES]
             ]
-        else:
-            conf_to_save = conf
+
+        if CONF_IP_BAN_DURATION in conf:
+            conf_to_save[CONF_IP_BAN_DURATION] = conf[
+                CONF_IP_BAN_DURATION
+            ].total_seconds()
 
         await store.async_save(conf_to_save)
 
@@ -214,6 +224,7 @@ class HomeAssistantHTTP:
         login_threshold,
         is_ban_enabled,
         ssl_profile,
+        ban_duration=None,
     ):
         """Initialize the HTTP Home Assistant server."""
         app = self.app = web.Application(
@@ -225,7 +236,7 @@ class HomeAssistantHTTP:
         setup_real_ip(app, use_x_forwarded_for, trusted_proxies)
 
         if is_ban_enabled:
-            setup_bans(hass, app, login_threshold)
+            setup_bans(hass, app, login_threshold, ban_duration)
 
         setup_auth(hass, app)
 
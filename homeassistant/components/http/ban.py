@@ -1,9 +1,10 @@
 """Ban logic for HTTP component."""
 from collections import defaultdict
 from datetime import datetime
-from ipaddress import ip_address
+from ipaddress import ip_network
 import logging
-from typing import List, Optional
+import os
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from aiohttp.web import middleware
 from aiohttp.web_exceptions import HTTPForbidden, HTTPUnauthorized
@@ -13,7 +14,8 @@ from homeassistant.config import load_yaml_config_file
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
-from homeassistant.util.yaml import dump
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
 
 from .const import KEY_REAL_IP
 
@@ -22,6 +24,8 @@ from .const import KEY_REAL_IP
 _LOGGER = logging.getLogger(__name__)
 
 KEY_BANNED_IPS = "ha_banned_ips"
+KEY_BAN_DURATION = "ha_ban_duration"
+KEY_BANS_STORE = "ha_bans_store"
 KEY_FAILED_LOGIN_ATTEMPTS = "ha_failed_login_attempts"
 KEY_LOGIN_THRESHOLD = "ha_login_threshold"
 
@@ -30,23 +34,36 @@ NOTIFICATION_ID_LOGIN = "http-login"
 
 IP_BANS_FILE = "ip_bans.yaml"
 ATTR_BANNED_AT = "banned_at"
+ATTR_EXPIRES_AT = "expires_at"
+ATTR_IP_BAN = "ip_ban"
+
+STORAGE_KEY = "http.ip_bans"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
 
 SCHEMA_IP_BAN_ENTRY = vol.Schema(
-    {vol.Optional("banned_at"): vol.Any(None, cv.datetime)}
+    {
+        vol.Optional(ATTR_BANNED_AT): vol.Any(None, cv.datetime),
+        vol.Optional(ATTR_EXPIRES_AT): vol.Any(None, cv.datetime),
+    }
 )
 
 
 @callback
-def setup_bans(hass, app, login_threshold):
+def setup_bans(hass, app, login_threshold, ban_duration=None):
     """Create IP Ban middleware for the app."""
     app.middlewares.append(ban_middleware)
     app[KEY_FAILED_LOGIN_ATTEMPTS] = defaultdict(int)
     app[KEY_LOGIN_THRESHOLD] = login_threshold
+    app[KEY_BAN_DURATION] = ban_duration
+    app[KEY_BANS_STORE] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
 
     async def ban_startup(app):
         """Initialize bans when app starts up."""
-        app[KEY_BANNED_IPS] = await async_load_ip_bans_config(
-            hass, hass.config.path(IP_BANS_FILE)
+        app[KEY_BANNED_IPS] = IpBanIndex(
+            await async_load_ip_bans_config(
+                hass, app[KEY_BANS_STORE], hass.config.path(IP_BANS_FILE)
+            )
         )
 
     app.on_startup.append(ban_startup)
@@ -60,13 +77,17 @@ async def ban_middleware(request, handler):
         return await handler(request)
 
     # Verify if IP is not banned
-    ip_address_ = request[KEY_REAL_IP]
-    is_banned = any(
-        ip_ban.ip_address == ip_address_ for ip_ban in request.app[KEY_BANNED_IPS]
-    )
+    ip_bans = request.app[KEY_BANNED_IPS]
+    ip_ban = ip_bans.async_get(request[KEY_REAL_IP]) if ip_bans else None
+
+    if ip_ban is not None:
+        if not ip_ban.is_expired(dt_util.utcnow()):
+            raise HTTPForbidden()
 
-    if is_banned:
-        raise HTTPForbidden()
+        _LOGGER.info("IP ban for %s expired", ip_ban.ip_network)
+        ip_bans.async_remove(ip_ban)
+        request.app[KEY_FAILED_LOGIN_ATTEMPTS].pop(request[KEY_REAL_IP], None)
+        _async_schedule_save_ip_bans(request.app)
 
     try:
         return await handler(request)
@@ -117,11 +138,10 @@ async def process_wrong_login(request):
         >= request.app[KEY_LOGIN_THRESHOLD]
     ):
         new_ban = IpBan(remote_addr)
-        request.app[KEY_BANNED_IPS].append(new_ban)
-
-        await hass.async_add_job(
-            update_ip_bans_config, hass.config.path(IP_BANS_FILE), new_ban
-        )
+        if request.app[KEY_BAN_DURATION] is not None:
+            new_ban.expires_at = new_ban.banned_at + request.app[KEY_BAN_DURATION]
+        request.app[KEY_BANNED_IPS].async_add(new_ban)
+        _async_schedule_save_ip_bans(request.app)
 
         _LOGGER.warning("Banned IP %s for too many login attempts", remote_addr)
 
@@ -137,7 +157,7 @@ async def process_success_login(request):
 
     Reset failed login attempts counter for remote IP address.
     No release IP address from banned list function, it can only be done by
-    manual modify ip bans config file.
+    manual modify ip bans storage file or by configuring a ban duration.
     """
     remote_addr = request[KEY_REAL_IP]
 
@@ -156,44 +176,206 @@ async def process_success_login(request):
 
 
 class IpBan:
-    """Represents banned IP address."""
-
-    def __init__(self, ip_ban: str, banned_at: Optional[datetime] = None) -> None:
+    """Represents banned IP address or network."""
+
+    def __init__(
+        self,
+        ip_ban: str,
+        banned_at: Optional[datetime] = None,
+        expires_at: Optional[datetime] = None,
+    ) -> None:
         """Initialize IP Ban object."""
-        self.ip_address = ip_address(ip_ban)
-        self.banned_at = banned_at or datetime.utcnow()
+        self.ip_network = ip_network(ip_ban, strict=False)
+        self.banned_at = _ensure_utc(banned_at or dt_util.utcnow())
+        self.expires_at = _ensure_utc(expires_at) if expires_at else None
+
+    @property
+    def ip_address(self):
+        """Return banned IP address if this ban is for a single host."""
+        if self.ip_network.num_addresses != 1:
+            return None
+        return self.ip_network.network_address
+
+    def is_expired(self, now: datetime) -> bool:
+        """Return if the ban has expired."""
+        return self.expires_at is not None and self.expires_at <= now
+
+    def as_dict(self) -> Dict[str, Optional[str]]:
+        """Return a dictionary representation of the ban for storage."""
+        return {
+            ATTR_IP_BAN: str(self.ip_network),
+            ATTR_BANNED_AT: self.banned_at.isoformat(),
+            ATTR_EXPIRES_AT: (
+                self.expires_at.isoformat() if self.expires_at is not None else None
+            ),
+        }
+
+
+def _ensure_utc(value: datetime) -> datetime:
+    """Return datetime as UTC, treating naive values as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=dt_util.UTC)
+    return value
+
+
+class IpBanIndex:
+    """Index of banned IP addresses and networks.
+
+    Single host bans are looked up in a dictionary. Network bans are bucketed
+    by prefix length, so a lookup costs one dictionary probe per distinct
+    prefix length in use instead of a scan over all bans.
+    """
+
+    def __init__(self, ip_bans: Optional[List[IpBan]] = None) -> None:
+        """Initialize the index."""
+        self._hosts: Dict[Any, IpBan] = {}
+        self._networks: Dict[Any, IpBan] = {}
+        # (ip version, prefix length) -> number of network bans
+        self._prefixes: Dict[Tuple[int, int], int] = {}
+        self._prefix_list: List[Tuple[int, int]] = []
+
+        for ip_ban in ip_bans or []:
+            self.async_add(ip_ban)
+
+    def __len__(self) -> int:
+        """Return number of bans."""
+        return len(self._hosts) + len(self._networks)
+
+    def __iter__(self) -> Iterator[IpBan]:
+        """Iterate over all bans."""
+        yield from self._hosts.values()
+        yield from self._networks.values()
+
+    @callback
+    def async_add(self, ip_ban: IpBan) -> None:
+        """Add a ban to the index."""
+        address = ip_ban.ip_address
+
+        if address is not None:
+            self._hosts[address] = ip_ban
+            return
+
+        network = ip_ban.ip_network
+        if network not in self._networks:
+            key = (network.version, network.prefixlen)
+            self._prefixes[key] = self._prefixes.get(key, 0) + 1
+            self._update_prefix_list()
+        self._networks[network] = ip_ban
+
+    @callback
+    def async_remove(self, ip_ban: IpBan) -> None:
+        """Remove a ban from the index."""
+        address = ip_ban.ip_address
+
+        if address is not None:
+            self._hosts.pop(address, None)
+            return
+
+        network = ip_ban.ip_network
+        if self._networks.pop(network, None) is None:
+            return
+
+        key = (network.version, network.prefixlen)
+        self._prefixes[key] -= 1
+        if not self._prefixes[key]:
+            self._prefixes.pop(key)
+        self._update_prefix_list()
+
+    @callback
+    def async_get(self, address) -> Optional[IpBan]:
+        """Return the ban matching an IP address, if any."""
+        ip_ban = self._hosts.get(address)
+
+        if ip_ban is not None or not self._networks:
+            return ip_ban
+
+        for version, prefixlen in self._prefix_list:
+            if version != address.version:
+                continue
+            ip_ban = self._networks.get(ip_network((address, prefixlen), strict=False))
+            if ip_ban is not None:
+                return ip_ban
+
+        return None
+
+    def _update_prefix_list(self) -> None:
+        """Update list of prefixes in use, most specific first."""
+        self._prefix_list = sorted(self._prefixes, key=lambda key: key[1], reverse=True)
+
+    @callback
+    def data_to_save(self) -> Dict[str, List[Dict[str, Optional[str]]]]:
+        """Return data of the index to store in a file."""
+        return {"ip_bans": [ip_ban.as_dict() for ip_ban in self]}
+
+
+@callback
+def _async_schedule_save_ip_bans(app) -> None:
+    """Schedule saving the banned IPs."""
+    app[KEY_BANS_STORE].async_delay_save(app[KEY_BANNED_IPS].data_to_save, SAVE_DELAY)
 
 
-async def async_load_ip_bans_config(hass: HomeAssistant, path: str) -> List[IpBan]:
-    """Load list of banned IPs from config file."""
+def _parse_ip_ban(ip_ban: str, ip_info: Optional[dict]) -> Optional[IpBan]:
+    """Parse a single IP ban entry."""
+    try:
+        ip_info = SCHEMA_IP_BAN_ENTRY(ip_info or {})
+        return IpBan(ip_ban, ip_info.get(ATTR_BANNED_AT), ip_info.get(ATTR_EXPIRES_AT))
+    except (vol.Invalid, ValueError) as err:
+        _LOGGER.error("Failed to load IP ban %s: %s", ip_ban, err)
+        return None
+
+
+def _migrate_yaml_bans(path: str) -> Optional[dict]:
+    """Load the legacy YAML file in the storage format, None if there is none.
+
+    The file is renamed afterwards, so edits to it are not silently lost.
+    """
+    if not os.path.isfile(path):
+        return None
+
+    ip_bans = []
+    for ip_ban, ip_info in (load_yaml_config_file(path) or {}).items():
+        parsed = _parse_ip_ban(ip_ban, ip_info)
+        if parsed is not None:
+            ip_bans.append(parsed.as_dict())
+
+    return {"ip_bans": ip_bans}
+
+
+async def async_load_ip_bans_config(
+    hass: HomeAssistant, store: Store, path: str
+) -> List[IpBan]:
+    """Load list of banned IPs, migrating the legacy YAML file if present."""
     ip_list: List[IpBan] = []
 
     try:
-        list_ = await hass.async_add_executor_job(load_yaml_config_file, path)
-    except FileNotFoundError:
-        return ip_list
+        data = await hass.async_add_executor_job(_migrate_yaml_bans, path)
     except HomeAssistantError as err:
         _LOGGER.error("Unable to load %s: %s", path, str(err))
         return ip_list
 
-    for ip_ban, ip_info in list_.items():
-        try:
-            ip_info = SCHEMA_IP_BAN_ENTRY(ip_info)
-            ip_list.append(IpBan(ip_ban, ip_info["banned_at"]))
-        except vol.Invalid as err:
-            _LOGGER.error("Failed to load IP ban %s: %s", ip_info, err)
-            continue
+    if data is None:
+        data = await store.async_load()
+    else:
+        await store.async_save(data)
+        migrated_path = f"{path}.migrated"
+        await hass.async_add_executor_job(os.replace, path, migrated_path)
+        _LOGGER.warning(
+            "Migrated %s to storage, IP bans are now kept in .storage/%s and "
+            "the file was renamed to %s",
+            path,
+            STORAGE_KEY,
+            migrated_path,
+        )
 
-    return ip_list
+    if data is None:
+        return ip_list
 
+    now = dt_util.utcnow()
 
-def update_ip_bans_config(path: str, ip_ban: IpBan) -> None:
-    """Update config file with new banned IP address."""
-    with open(path, "a") as out:
-        ip_ = {
-            str(ip_ban.ip_address): {
-                ATTR_BANNED_AT: ip_ban.banned_at.strftime("%Y-%m-%dT%H:%M:%S")
-            }
-        }
-        out.write("\n")
-        out.write(dump(ip_))
+    for entry in data["ip_bans"]:
+        entry = dict(entry)
+        ip_ban = _parse_ip_ban(entry.pop(ATTR_IP_BAN), entry)
+        if ip_ban is not None and not ip_ban.is_expired(now):
+            ip_list.append(ip_ban)
+
+    return ip_list
@@ -1,11 +1,20 @@
 """Provides functionality to interact with image processing services."""
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
+import hashlib
 import logging
+from timeit import default_timer as timer
 
 import voluptuous as vol
 
-from homeassistant.const import ATTR_ENTITY_ID, ATTR_NAME, CONF_ENTITY_ID, CONF_NAME
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ATTR_NAME,
+    CONF_ENTITY_ID,
+    CONF_NAME,
+    EVENT_HOMEASSISTANT_STOP,
+)
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
@@ -21,6 +30,8 @@ _LOGGER = logging.getLogger(__name__)
 DOMAIN = "image_processing"
 SCAN_INTERVAL = timedelta(seconds=10)
 
+DATA_POOL = "image_processing_pool"
+
 DEVICE_CLASSES = [
     "alpr",  # Automatic license plate recognition
     "face",  # Face
@@ -37,6 +48,7 @@ ATTR_FACES = "faces"
 ATTR_GENDER = "gender"
 ATTR_GLASSES = "glasses"
 ATTR_MOTION = "motion"
+ATTR_PROCESSING_TIME = "processing_time"
 ATTR_TOTAL_FACES = "total_faces"
 
 CONF_SOURCE = "source"
@@ -45,6 +57,11 @@ CONF_CONFIDENCE = "confidence"
 DEFAULT_TIMEOUT = 10
 DEFAULT_CONFIDENCE = 80
 
+# Frames of the same batch key that arrive within the window share one call
+BATCH_WINDOW = 0.05
+MAX_BATCH_SIZE = 8
+POOL_WORKERS = 2
+
 SOURCE_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_ENTITY_ID): cv.entity_domain("camera"),
@@ -76,6 +93,8 @@ async def async_setup(hass, config):
         update_tasks = []
         for entity in image_entities:
             entity.async_set_context(service.context)
+            # A requested scan processes the frame even if it is unchanged
+            entity.async_reset_frame_gate()
             update_tasks.append(entity.async_update_ha_state(True))
 
         if update_tasks:
@@ -88,10 +107,109 @@ async def async_setup(hass, config):
     return True
 
 
+@callback
+def async_get_pool(hass):
+    """Return the worker pool shared by the image processing entities."""
+    pool = hass.data.get(DATA_POOL)
+    if pool is None:
+        pool = hass.data[DATA_POOL] = ImageProcessingPool(hass)
+    return pool
+
+
+class ImageProcessingPool:
+    """Run image processing on a bounded pool and micro-batch frames.
+
+    Entities that return the same batch_key, such as cameras sharing a loaded
+    model, have their frames combined into one process_image_batch call.
+    """
+
+    def __init__(self, hass, workers=POOL_WORKERS):
+        """Initialize the pool."""
+        self.hass = hass
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="ImageProcessing"
+        )
+        self._pending = {}
+        self._stopped = False
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_shutdown)
+
+    @callback
+    def _async_shutdown(self, event):
+        """Stop accepting work and let the running inference finish."""
+        self._stopped = True
+        self._executor.shutdown(wait=False)
+
+        # Frames still waiting for their batch are not processed anymore
+        for batch in self._pending.values():
+            _async_resolve(batch)
+        self._pending.clear()
+
+    async def async_process(self, entity, image):
+        """Process the image of an entity, batched with its batch key."""
+        if self._stopped:
+            _LOGGER.debug("Not processing a frame of %s, stopping", entity.entity_id)
+            return
+
+        key = entity.batch_key
+        if key is None:
+            await self.hass.loop.run_in_executor(
+                self._executor, entity.process_image, image
+            )
+            return
+
+        future = self.hass.loop.create_future()
+        batch = self._pending.setdefault(key, [])
+        batch.append((entity, image, future))
+        if len(batch) >= MAX_BATCH_SIZE:
+            self._async_flush(key)
+        elif len(batch) == 1:
+            self.hass.loop.call_later(BATCH_WINDOW, self._async_flush, key)
+        await future
+
+    @callback
+    def _async_flush(self, key):
+        """Start processing the pending frames of a batch key."""
+        batch = self._pending.pop(key, None)
+        if batch:
+            self.hass.async_create_task(self._async_process_batch(batch))
+
+    async def _async_process_batch(self, batch):
+        """Process a batch and resolve the futures of its entities."""
+        entity = batch[0][0]
+        frames = [(frame_entity, image) for frame_entity, image, _ in batch]
+        try:
+            await self.hass.loop.run_in_executor(
+                self._executor, entity.process_image_batch, frames
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            _async_resolve(batch, err)
+        else:
+            _async_resolve(batch)
+
+
+@callback
+def _async_resolve(batch, err=None):
+    """Resolve the futures of a batch that are still waited for.
+
+    A caller may have stopped waiting, for example after a timeout.
+    """
+    for _, _, future in batch:
+        if future.done():
+            continue
+        if err is None:
+            future.set_result(None)
+        else:
+            future.set_exception(err)
+
+
 class ImageProcessingEntity(Entity):
     """Base entity class for image processing."""
 
     timeout = DEFAULT_TIMEOUT
+    # Frames identical to the last processed one are not processed again
+    skip_unchanged_frames = True
+    processing_time = None
+    _last_frame_hash = None
 
     @property
     def camera_entity(self):
@@ -103,13 +221,35 @@ class ImageProcessingEntity(Entity):
         """Return minimum confidence for do some things."""
         return None
 
+    @property
+    def batch_key(self):
+        """Return a key shared by entities whose frames can be batched."""
+        return None
+
+    @property
+    def state_attributes(self):
+        """Return the processing time of the last frame."""
+        if self.processing_time is None:
+            return None
+        return {ATTR_PROCESSING_TIME: self.processing_time}
+
+    @callback
+    def async_reset_frame_gate(self):
+        """Process the next frame even if it did not change."""
+        self._last_frame_hash = None
+
     def process_image(self, image):
         """Process image."""
         raise NotImplementedError()
 
+    def process_image_batch(self, frames):
+        """Process a list of (entity, image) frames with the same batch key."""
+        for entity, image in frames:
+            entity.process_image(image)
+
     async def async_process_image(self, image):
         """Process image."""
-        return await self.hass.async_add_job(self.process_image, image)
+        await async_get_pool(self.hass).async_process(self, image)
 
     async def async_update(self):
         """Update image and process it.
@@ -128,8 +268,19 @@ class ImageProcessingEntity(Entity):
             _LOGGER.error("Error on receive image from entity: %s", err)
             return
 
+        if self.skip_unchanged_frames:
+            frame_hash = hashlib.sha1(image.content).digest()
+            if frame_hash == self._last_frame_hash:
+                _LOGGER.debug("Skipping unchanged frame of %s", self.camera_entity)
+                return
+
         # process image data
+        start = timer()
         await self.async_process_image(image.content)
+        self.processing_time = round(timer() - start, 3)
+
+        if self.skip_unchanged_frames:
+            self._last_frame_hash = frame_hash
 
 
 class ImageProcessingFaceEntity(ImageProcessingEntity):
@@ -174,6 +325,7 @@ class ImageProcessingFaceEntity(ImageProcessingEntity):
     def state_attributes(self):
         """Return device specific state attributes."""
         attr = {ATTR_FACES: self.faces, ATTR_TOTAL_FACES: self.total_faces}
+        attr.update(super().state_attributes or {})
 
         return attr
 
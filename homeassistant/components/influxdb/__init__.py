@@ -1,6 +1,9 @@
 """Support for sending data to an Influx database."""
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import math
+import os
 import queue
 import re
 import threading
@@ -29,6 +32,7 @@ from homeassistant.const import (
 from homeassistant.helpers import event as event_helper, state as state_helper
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
+from homeassistant.util import dt as dt_util
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,9 +45,13 @@ CONF_COMPONENT_CONFIG = "component_config"
 CONF_COMPONENT_CONFIG_GLOB = "component_config_glob"
 CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_RETRY_COUNT = "max_retries"
+CONF_SPOOL_SIZE = "spool_size"
+CONF_WORKERS = "workers"
 
 DEFAULT_DATABASE = "home_assistant"
 DEFAULT_VERIFY_SSL = True
+DEFAULT_SPOOL_SIZE = 100000
+DEFAULT_WORKERS = 1
 DOMAIN = "influxdb"
 
 TIMEOUT = 5
@@ -53,6 +61,10 @@ RETRY_INTERVAL = 60  # seconds
 
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+REPLAY_BATCH_SIZE = 1000
+MAX_WORKERS = 8
+
+SPOOL_FILE = ".influxdb_spool"
 
 COMPONENT_CONFIG_SCHEMA_ENTRY = vol.Schema(
     {vol.Optional(CONF_OVERRIDE_MEASUREMENT): cv.string}
@@ -86,6 +98,12 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(CONF_PORT): cv.port,
                     vol.Optional(CONF_SSL): cv.boolean,
                     vol.Optional(CONF_RETRY_COUNT, default=0): cv.positive_int,
+                    vol.Optional(
+                        CONF_SPOOL_SIZE, default=DEFAULT_SPOOL_SIZE
+                    ): cv.positive_int,
+                    vol.Optional(CONF_WORKERS, default=DEFAULT_WORKERS): vol.All(
+                        vol.Coerce(int), vol.Range(min=1, max=MAX_WORKERS)
+                    ),
                     vol.Optional(CONF_DEFAULT_MEASUREMENT): cv.string,
                     vol.Optional(CONF_OVERRIDE_MEASUREMENT): cv.string,
                     vol.Optional(CONF_TAGS, default={}): vol.Schema(
@@ -116,6 +134,8 @@ CONFIG_SCHEMA = vol.Schema(
 RE_DIGIT_TAIL = re.compile(r"^[^\.]*\d+\.?\d+[^\.]*$")
 RE_DECIMAL = re.compile(r"[^\d.]+")
 
+EPOCH = dt_util.utc_from_timestamp(0)
+
 
 def setup(hass, config):
     """Set up the InfluxDB component."""
@@ -175,8 +195,8 @@ def setup(hass, config):
         event_helper.call_later(hass, RETRY_INTERVAL, lambda _: setup(hass, config))
         return True
 
-    def event_to_json(event):
-        """Add an event to the outgoing Influx list."""
+    def event_to_line(event):
+        """Encode an event as an Influx line protocol point."""
         state = event.data.get("new_state")
         if (
             state is None
@@ -222,50 +242,52 @@ def setup(hass, config):
                 else:
                     include_uom = False
 
-        json = {
-            "measurement": measurement,
-            "tags": {"domain": state.domain, "entity_id": state.object_id},
-            "time": event.time_fired,
-            "fields": {},
-        }
+        point_tags = {"domain": state.domain, "entity_id": state.object_id}
+        fields = {}
         if _include_state:
-            json["fields"]["state"] = state.state
+            fields["state"] = state.state
         if _include_value:
-            json["fields"]["value"] = _state_as_value
+            fields["value"] = _state_as_value
 
         for key, value in state.attributes.items():
             if key in tags_attributes:
-                json["tags"][key] = value
+                point_tags[key] = value
             elif key != "unit_of_measurement" or include_uom:
                 # If the key is already in fields
-                if key in json["fields"]:
+                if key in fields:
                     key = key + "_"
                 # Prevent column data errors in influxDB.
                 # For each value we try to cast it as float
                 # But if we can not do it we store the value
                 # as string add "_str" postfix to the field key
                 try:
-                    json["fields"][key] = float(value)
+                    fields[key] = float(value)
                 except (ValueError, TypeError):
                     new_key = f"{key}_str"
                     new_value = str(value)
-                    json["fields"][new_key] = new_value
+                    fields[new_key] = new_value
 
                     if RE_DIGIT_TAIL.match(new_value):
-                        json["fields"][key] = float(RE_DECIMAL.sub("", new_value))
+                        fields[key] = float(RE_DECIMAL.sub("", new_value))
 
                 # Infinity and NaN are not valid floats in InfluxDB
                 try:
-                    if not math.isfinite(json["fields"][key]):
-                        del json["fields"][key]
+                    if not math.isfinite(fields[key]):
+                        del fields[key]
                 except (KeyError, TypeError):
                     pass
 
-        json["tags"].update(tags)
+        point_tags.update(tags)
 
-        return json
+        return _encode_line(measurement, point_tags, fields, event.time_fired)
 
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    spool = None
+    if conf[CONF_SPOOL_SIZE]:
+        spool = InfluxSpool(hass.config.path(SPOOL_FILE), conf[CONF_SPOOL_SIZE])
+
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass, influx, event_to_line, max_tries, conf[CONF_WORKERS], spool
+    )
     instance.start()
 
     def shutdown(event):
@@ -279,18 +301,204 @@ def setup(hass, config):
     return True
 
 
+def _escape_key(value):
+    """Escape a measurement, tag key, tag value or field key."""
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace(" ", "\\ ")
+        .replace(",", "\\,")
+        .replace("=", "\\=")
+        .replace("\n", "\\n")
+    )
+
+
+def _escape_tag_value(value):
+    """Escape a tag value."""
+    if value is None:
+        return ""
+    value = _escape_key(value)
+    if value.endswith("\\"):
+        value += " "
+    return value
+
+
+def _escape_field_value(value):
+    """Encode a field value, which is either a float or a string."""
+    if isinstance(value, str):
+        if value == "":
+            return ""
+        return '"{}"'.format(
+            value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+    return repr(value)
+
+
+def _line_timestamp(time_fired):
+    """Return the time of an event in nanoseconds since the epoch."""
+    if isinstance(time_fired, int):
+        return time_fired
+    delta = time_fired - EPOCH
+    return (delta.days * 86400 + delta.seconds) * 10 ** 9 + delta.microseconds * 1000
+
+
+def _encode_line(measurement, tags, fields, time_fired):
+    """Encode a point in the Influx line protocol.
+
+    Tags and fields are sorted like the Influx client does, tags and fields
+    with an empty key or value are left out.
+    """
+    key_values = [_escape_key(measurement)]
+    for key, value in sorted(tags.items()):
+        key = _escape_key(key)
+        value = _escape_tag_value(value)
+        if key and value:
+            key_values.append(f"{key}={value}")
+
+    field_values = []
+    for key, value in sorted(fields.items()):
+        key = _escape_key(key)
+        value = _escape_field_value(value)
+        if key and value:
+            field_values.append(f"{key}={value}")
+
+    if not field_values:
+        return None
+
+    return "{} {} {}".format(
+        ",".join(key_values), ",".join(field_values), _line_timestamp(time_fired)
+    )
+
+
+class InfluxSpool:
+    """Bounded on-disk spool of points that could not be written.
+
+    Points are kept as line protocol, one point per line, so they survive a
+    restart and can be replayed as is once the database is back.
+    """
+
+    def __init__(self, path, max_points):
+        """Initialize the spool."""
+        self.path = path
+        self.max_points = max_points
+        # Guards the file, writes to the database happen outside of it
+        self._lock = threading.Lock()
+        # Held by the one thread replaying the spool
+        self._replay_lock = threading.Lock()
+        self._count = len(self._read())
+
+    def __len__(self):
+        """Return the number of spooled points."""
+        return self._count
+
+    def _read(self):
+        """Return the spooled points."""
+        if not os.path.isfile(self.path):
+            return []
+        with open(self.path, encoding="utf-8") as fil:
+            return fil.read().splitlines()
+
+    def append(self, lines):
+        """Spool points and return how many were dropped because it is full."""
+        with self._lock:
+            count = self._count
+            kept = lines[: max(self.max_points - count, 0)]
+
+            if kept:
+                with open(self.path, "a", encoding="utf-8") as fil:
+                    fil.write("\n".join(kept) + "\n")
+                self._count = count + len(kept)
+
+            return len(lines) - len(kept)
+
+    def replay(self, write):
+        """Write the spooled points, oldest first, and return how many.
+
+        Stops at the first failing write and keeps the points that are left.
+        A batch the write function returns False for was rejected by the
+        database, it is removed from the spool but not counted. Only one
+        thread replays at a time, others return 0 right away.
+        """
+        if not self._replay_lock.acquire(blocking=False):
+            return 0
+
+        try:
+            with self._lock:
+                if not self._count:
+                    return 0
+                lines = self._read()
+
+            done = 0
+            written = 0
+            try:
+                while done < len(lines):
+                    batch = lines[done : done + REPLAY_BATCH_SIZE]
+                    if write(batch) is not False:
+                        written += len(batch)
+                    done += len(batch)
+            finally:
+                if done:
+                    with self._lock:
+                        # Keep the points spooled while replaying
+                        appended = self._read()[len(lines) :]
+                        self._rewrite(lines[done:] + appended)
+
+            return written
+        finally:
+            self._replay_lock.release()
+
+    def _rewrite(self, lines):
+        """Replace the spool with the given points."""
+        self._count = len(lines)
+
+        if not lines:
+            os.remove(self.path)
+            return
+
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as fil:
+            fil.write("\n".join(lines) + "\n")
+        os.replace(temp_path, self.path)
+
+
+def _is_rejected(err):
+    """Return if the database refused the points, so writing them again fails."""
+    code = getattr(err, "code", None)
+    return (
+        isinstance(err, exceptions.InfluxDBClientError)
+        and code is not None
+        and 400 <= code < 500
+    )
+
+
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(self, hass, influx, event_to_line, max_tries, workers=1, spool=None):
         """Initialize the listener."""
         threading.Thread.__init__(self, name="InfluxDB")
         self.queue = queue.Queue()
         self.influx = influx
-        self.event_to_json = event_to_json
+        self.event_to_line = event_to_line
         self.max_tries = max_tries
+        self.spool = spool
         self.write_errors = 0
         self.shutdown = False
+        # Throughput counters: written, replayed, spooled, dropped, rejected,
+        # write_seconds
+        self.stats = Counter()
+        # Guards the counters and the failure state shared by the workers
+        self._stats_lock = threading.Lock()
+        self._write_failing = False
+        self._executor = None
+        self._in_flight = None
+        if workers > 1:
+            self._executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="InfluxDBWriter"
+            )
+            # Batches wait in the queue, where their age is tracked, instead of
+            # piling up in the executor while the database is slow
+            self._in_flight = threading.BoundedSemaphore(workers)
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
     def _event_listener(self, event):
@@ -303,17 +511,20 @@ class InfluxThread(threading.Thread):
         """Return number of seconds to wait for more events."""
         return BATCH_TIMEOUT
 
-    def get_events_json(self):
-        """Return a batch of events formatted for writing."""
+    def get_events_lines(self):
+        """Return a batch of events encoded for writing.
+
+        Events that waited too long in the queue are returned separately, to
+        be spooled instead of written.
+        """
         queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
 
         count = 0
-        json = []
-
-        dropped = 0
+        lines = []
+        backlog = []
 
         try:
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
+            while len(lines) < BATCH_BUFFER_SIZE and not self.shutdown:
                 timeout = None if count == 0 else self.batch_timeout()
                 item = self.queue.get(timeout=timeout)
                 count += 1
@@ -323,55 +534,145 @@ class InfluxThread(threading.Thread):
                 else:
                     timestamp, event = item
                     age = time.monotonic() - timestamp
+                    line = self.event_to_line(event)
 
+                    if not line:
+                        continue
                     if age < queue_seconds:
-                        event_json = self.event_to_json(event)
-                        if event_json:
-                            json.append(event_json)
+                        lines.append(line)
                     else:
-                        dropped += 1
+                        backlog.append(line)
 
         except queue.Empty:
             pass
 
+        return count, lines, backlog
+
+    def _update_stats(self, **kwargs):
+        """Add to the throughput counters."""
+        with self._stats_lock:
+            self.stats.update(kwargs)
+
+    def spool_lines(self, lines):
+        """Keep points that cannot be written now, drop them without spool."""
+        dropped = len(lines)
+        if self.spool is not None:
+            dropped = self.spool.append(lines)
+        self._update_stats(spooled=len(lines) - dropped, dropped=dropped)
+
         if dropped:
             _LOGGER.warning("Catching up, dropped %d old events", dropped)
+            with self._stats_lock:
+                self.write_errors += dropped
 
-        return count, json
+    def reject_lines(self, lines, err):
+        """Drop points the database refused, spooling them would block replay."""
+        self._update_stats(rejected=len(lines))
+        _LOGGER.error("Dropped %d events rejected by InfluxDB: %s", len(lines), err)
 
-    def write_to_influxdb(self, json):
-        """Write preprocessed events to influxdb, with retry."""
+    def write_to_influxdb(self, lines):
+        """Write encoded events to influxdb, with retry."""
 
         for retry in range(self.max_tries + 1):
             try:
-                self.influx.write_points(json)
-
-                if self.write_errors:
-                    _LOGGER.error("Resumed, lost %d events", self.write_errors)
-                    self.write_errors = 0
-
-                _LOGGER.debug("Wrote %d events", len(json))
+                start = time.monotonic()
+                self.influx.write_points(lines, protocol="line")
                 break
             except (
                 exceptions.InfluxDBClientError,
                 exceptions.InfluxDBServerError,
                 IOError,
             ) as err:
+                if _is_rejected(err):
+                    self.reject_lines(lines, err)
+                    return
+
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
-                else:
-                    if not self.write_errors:
-                        _LOGGER.error("Write error: %s", err)
-                    self.write_errors += len(json)
+                    continue
+
+                with self._stats_lock:
+                    was_failing = self._write_failing
+                    self._write_failing = True
+                if not was_failing:
+                    _LOGGER.error("Write error: %s", err)
+                self.spool_lines(lines)
+                return
+
+        elapsed = time.monotonic() - start
+        with self._stats_lock:
+            self.stats.update(written=len(lines), write_seconds=elapsed)
+            self._write_failing = False
+            write_errors, self.write_errors = self.write_errors, 0
+
+        if write_errors:
+            _LOGGER.error("Resumed, lost %d events", write_errors)
+
+        _LOGGER.debug(
+            "Wrote %d events in %.3fs, %d events written in %.1fs in total",
+            len(lines),
+            elapsed,
+            self.stats["written"],
+            self.stats["write_seconds"],
+        )
+
+        self.replay_spool()
+
+    def replay_spool(self):
+        """Write the spooled points once the database accepts writes again."""
+        if self.spool is None or not len(self.spool):
+            return
+
+        def write(lines):
+            """Write spooled points, dropping those the database refuses."""
+            try:
+                self.influx.write_points(lines, protocol="line")
+            except exceptions.InfluxDBClientError as err:
+                if not _is_rejected(err):
+                    raise
+                self.reject_lines(lines, err)
+                return False
+            return True
+
+        try:
+            replayed = self.spool.replay(write)
+        except (
+            exceptions.InfluxDBClientError,
+            exceptions.InfluxDBServerError,
+            IOError,
+        ) as err:
+            _LOGGER.warning("Replaying spooled events failed: %s", err)
+            return
+
+        self._update_stats(written=replayed, replayed=replayed)
+        if replayed:
+            _LOGGER.info("Replayed %d spooled events", replayed)
+
+    def _write_batch(self, count, lines):
+        """Write a batch and mark its events as processed."""
+        try:
+            if lines:
+                self.write_to_influxdb(lines)
+        finally:
+            if self._in_flight is not None:
+                self._in_flight.release()
+            for _ in range(count):
+                self.queue.task_done()
 
     def run(self):
         """Process incoming events."""
         while not self.shutdown:
-            count, json = self.get_events_json()
-            if json:
-                self.write_to_influxdb(json)
-            for _ in range(count):
-                self.queue.task_done()
+            count, lines, backlog = self.get_events_lines()
+            if backlog:
+                self.spool_lines(backlog)
+            if self._executor is None:
+                self._write_batch(count, lines)
+            else:
+                self._in_flight.acquire()
+                self._executor.submit(self._write_batch, count, lines)
+
+        if self._executor is not None:
+            self._executor.shutdown()
 
     def block_till_done(self):
         """Block till all events processed."""
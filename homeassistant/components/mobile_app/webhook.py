@@ -418,10 +418,9 @@ async def webhook_update_sensor_states(hass, config_entry, data):
 @WEBHOOK_COMMANDS.register("get_zones")
 async def webhook_get_zones(hass, config_entry, data):
     """Handle a get zones webhook."""
-    zones = [
-        hass.states.get(entity_id)
-        for entity_id in sorted(hass.states.async_entity_ids(ZONE_DOMAIN))
-    ]
+    zones = sorted(
+        hass.states.async_all(ZONE_DOMAIN), key=lambda state: state.entity_id
+    )
     return webhook_response(zones, registration=config_entry.data)
 
 
@@ -105,6 +105,7 @@ class ImageProcessingAlprEntity(ImageProcessingEntity):
     def state_attributes(self):
         """Return device specific state attributes."""
         attr = {ATTR_PLATES: self.plates, ATTR_VEHICLES: self.vehicles}
+        attr.update(super().state_attributes or {})
 
         return attr
 
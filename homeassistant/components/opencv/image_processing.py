@@ -156,7 +156,9 @@ class OpenCVImageProcessor(ImageProcessingEntity):
     @property
     def state_attributes(self):
         """Return device specific state attributes."""
-        return {ATTR_MATCHES: self._matches, ATTR_TOTAL_MATCHES: self._total_matches}
+        attr = {ATTR_MATCHES: self._matches, ATTR_TOTAL_MATCHES: self._total_matches}
+        attr.update(super().state_attributes or {})
+        return attr
 
     def process_image(self, image):
         """Process the image."""
@@ -6,7 +6,6 @@ from aiohttp import web
 import prometheus_client
 import voluptuous as vol
 
-from homeassistant import core as hacore
 from homeassistant.components.climate.const import ATTR_CURRENT_TEMPERATURE
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import (
@@ -125,6 +124,10 @@ class PrometheusMetrics:
         else:
             self.metrics_prefix = ""
         self._metrics = {}
+        # Metric children bound to the labels of an entity, per metric
+        self._children = {}
+        self._handlers = {}
+        self._included = {}
         self._climate_units = climate_units
 
     def handle_event(self, event):
@@ -135,20 +138,27 @@ class PrometheusMetrics:
 
         entity_id = state.entity_id
         _LOGGER.debug("Handling state update for %s", entity_id)
-        domain, _ = hacore.split_entity_id(entity_id)
 
-        if not self._filter(state.entity_id):
+        included = self._included.get(entity_id)
+        if included is None:
+            included = self._included[entity_id] = self._filter(entity_id)
+
+        if not included:
             return
 
-        handler = f"_handle_{domain}"
+        domain = state.domain
+        try:
+            handler = self._handlers[domain]
+        except KeyError:
+            handler = self._handlers[domain] = getattr(self, f"_handle_{domain}", None)
 
-        if hasattr(self, handler):
-            getattr(self, handler)(state)
+        if handler is not None:
+            handler(state)
 
         metric = self._metric(
             "state_change", self.prometheus_cli.Counter, "The number of state changes"
         )
-        metric.labels(**self._labels(state)).inc()
+        self._child(metric, state).inc()
 
     def _metric(self, metric, factory, documentation, labels=None):
         if labels is None:
@@ -163,6 +173,27 @@ class PrometheusMetrics:
             self._metrics[metric] = factory(full_metric_name, documentation, labels)
             return self._metrics[metric]
 
+    def _child(self, metric, state):
+        """Return the child of a metric bound to the labels of a state.
+
+        Children are cached per entity and only bound again when the
+        friendly name changes.
+        """
+        key = (metric, state.entity_id)
+        friendly_name = state.attributes.get("friendly_name")
+
+        try:
+            cached_name, child = self._children[key]
+        except KeyError:
+            pass
+        else:
+            if cached_name == friendly_name:
+                return child
+
+        child = metric.labels(**self._labels(state))
+        self._children[key] = (friendly_name, child)
+        return child
+
     @staticmethod
     def _sanitize_metric_name(metric: str) -> str:
         return "".join(
@@ -204,7 +235,7 @@ class PrometheusMetrics:
             )
             try:
                 value = float(state.attributes["battery_level"])
-                metric.labels(**self._labels(state)).set(value)
+                self._child(metric, state).set(value)
             except ValueError:
                 pass
 
@@ -215,7 +246,7 @@ class PrometheusMetrics:
             "State of the binary sensor (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._child(metric, state).set(value)
 
     def _handle_input_boolean(self, state):
         metric = self._metric(
@@ -224,7 +255,7 @@ class PrometheusMetrics:
             "State of the input boolean (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._child(metric, state).set(value)
 
     def _handle_device_tracker(self, state):
         metric = self._metric(
@@ -233,14 +264,14 @@ class PrometheusMetrics:
             "State of the device tracker (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._child(metric, state).set(value)
 
     def _handle_person(self, state):
         metric = self._metric(
             "person_state", self.prometheus_cli.Gauge, "State of the person (0/1)"
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._child(metric, state).set(value)
 
     def _handle_light(self, state):
         metric = self._metric(
@@ -253,7 +284,7 @@ class PrometheusMetrics:
             else:
                 value = self.state_as_number(state)
             value = value * 100
-            metric.labels(**self._labels(state)).set(value)
+            self._child(metric, state).set(value)
         except ValueError:
             pass
 
@@ -262,7 +293,7 @@ class PrometheusMetrics:
             "lock_state", self.prometheus_cli.Gauge, "State of the lock (0/1)"
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        self._child(metric, state).set(value)
 
     def _handle_climate(self, state):
         temp = state.attributes.get(ATTR_TEMPERATURE)
@@ -274,7 +305,7 @@ class PrometheusMetrics:
                 self.prometheus_cli.Gauge,
                 "Temperature in degrees Celsius",
             )
-            metric.labels(**self._labels(state)).set(temp)
+            self._child(metric, state).set(temp)
 
         current_temp = state.attributes.get(ATTR_CURRENT_TEMPERATURE)
         if current_temp:
@@ -285,7 +316,7 @@ class PrometheusMetrics:
                 self.prometheus_cli.Gauge,
                 "Current Temperature in degrees Celsius",
             )
-            metric.labels(**self._labels(state)).set(current_temp)
+            self._child(metric, state).set(current_temp)
 
     def _handle_sensor(self, state):
         unit = self._unit_string(state.attributes.get(ATTR_UNIT_OF_MEASUREMENT))
@@ -304,7 +335,7 @@ class PrometheusMetrics:
                 value = self.state_as_number(state)
                 if unit == TEMP_FAHRENHEIT:
                     value = fahrenheit_to_celsius(value)
-                _metric.labels(**self._labels(state)).set(value)
+                self._child(_metric, state).set(value)
             except ValueError:
                 pass
 
@@ -362,7 +393,7 @@ class PrometheusMetrics:
 
         try:
             value = self.state_as_number(state)
-            metric.labels(**self._labels(state)).set(value)
+            self._child(metric, state).set(value)
         except ValueError:
             pass
 
@@ -376,7 +407,7 @@ class PrometheusMetrics:
             "Count of times an automation has been triggered",
         )
 
-        metric.labels(**self._labels(state)).inc()
+        self._child(metric, state).inc()
 
 
 class PrometheusView(HomeAssistantView):
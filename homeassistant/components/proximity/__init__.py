@@ -114,6 +114,8 @@ class Proximity(Entity):
         self.tolerance = tolerance
         self.proximity_zone = proximity_zone
         self._unit_of_measurement = unit_of_measurement
+        # Last calculated distance per device, keyed by the coordinates used
+        self._distance_cache = {}
 
     @property
     def name(self):
@@ -135,6 +137,22 @@ class Proximity(Entity):
         """Return the state attributes."""
         return {ATTR_DIR_OF_TRAVEL: self.dir_of_travel, ATTR_NEAREST: self.nearest}
 
+    def _distance_to_zone(self, device, zone_lat, zone_lon, device_lat, device_lon):
+        """Return the distance of a device to the zone.
+
+        Distances are only recalculated for devices that moved or when the
+        zone moved.
+        """
+        key = (zone_lat, zone_lon, device_lat, device_lon)
+        cached = self._distance_cache.get(device)
+
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        dist = distance(zone_lat, zone_lon, device_lat, device_lon)
+        self._distance_cache[device] = (key, dist)
+        return dist
+
     def check_proximity_state_change(self, entity, old_state, new_state):
         """Perform the proximity checking."""
         entity_name = new_state.name
@@ -196,7 +214,8 @@ class Proximity(Entity):
                 continue
 
             # Calculate the distance to the proximity zone.
-            dist_to_zone = distance(
+            dist_to_zone = self._distance_to_zone(
+                device,
                 proximity_latitude,
                 proximity_longitude,
                 device_state.attributes["latitude"],
@@ -246,7 +265,8 @@ class Proximity(Entity):
             old_state.attributes["latitude"],
             old_state.attributes["longitude"],
         )
-        new_distance = distance(
+        new_distance = self._distance_to_zone(
+            entity,
             proximity_latitude,
             proximity_longitude,
             new_state.attributes["latitude"],
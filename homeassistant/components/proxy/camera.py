@@ -1,8 +1,10 @@
 """Proxy camera platform that enables image processing of camera data."""
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 import io
 import logging
+from time import monotonic
 
 from PIL import Image
 import voluptuous as vol
@@ -14,7 +16,13 @@ from homeassistant.components.camera import (
     async_get_mjpeg_stream,
     async_get_still_stream,
 )
-from homeassistant.const import CONF_ENTITY_ID, CONF_MODE, CONF_NAME
+from homeassistant.const import (
+    CONF_ENTITY_ID,
+    CONF_MODE,
+    CONF_NAME,
+    EVENT_HOMEASSISTANT_STOP,
+)
+from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 import homeassistant.util.dt as dt_util
@@ -39,6 +47,11 @@ MODE_CROP = "crop"
 DEFAULT_BASENAME = "Camera Proxy"
 DEFAULT_QUALITY = 75
 
+DATA_EXECUTOR = "proxy_camera_executor"
+
+# Maximum number of images that are resized or cropped at the same time
+MAX_TRANSFORM_WORKERS = 2
+
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
         vol.Required(CONF_ENTITY_ID): cv.entity_id,
@@ -64,6 +77,26 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     async_add_entities([ProxyCamera(hass, config)])
 
 
+@callback
+def _async_get_executor(hass):
+    """Return the executor shared by all proxy cameras to transform images."""
+    executor = hass.data.get(DATA_EXECUTOR)
+
+    if executor is None:
+        executor = hass.data[DATA_EXECUTOR] = ThreadPoolExecutor(
+            max_workers=MAX_TRANSFORM_WORKERS, thread_name_prefix="ProxyCamera"
+        )
+
+        @callback
+        def _async_shutdown_executor(event):
+            """Shut down the executor."""
+            hass.data.pop(DATA_EXECUTOR).shutdown(wait=False)
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_shutdown_executor)
+
+    return executor
+
+
 def _precheck_image(image, opts):
     """Perform some pre-checks on the given image."""
     if not opts:
@@ -180,6 +213,59 @@ class ImageOpts:
         return bool(self.max_width or self.quality)
 
 
+class FrameCache:
+    """Transformed frames of a camera, shared between all requests.
+
+    Concurrent requests wait for the same fetch of the source camera, a
+    transformed frame is reused until it is older than the time to live,
+    and an unchanged source frame is never transformed twice.
+    """
+
+    def __init__(self, hass, entity_id, job, opts, ttl):
+        """Initialize the frame cache."""
+        self.hass = hass
+        self._entity_id = entity_id
+        self._job = job
+        self._opts = opts
+        self._ttl = ttl
+        self._source = None
+        self._image = None
+        self._time = None
+        self._pending = None
+
+    async def async_get_image(self):
+        """Return the transformed image of the latest frame."""
+        if self._time is not None and monotonic() - self._time < self._ttl:
+            return self._image
+
+        if self._pending is None:
+            self._pending = self.hass.async_create_task(self._async_fetch_image())
+
+        # Shield so a viewer disconnecting doesn't cancel the fetch for others
+        return await asyncio.shield(self._pending)
+
+    async def _async_fetch_image(self):
+        """Fetch and transform a new frame of the source camera."""
+        try:
+            image = await async_get_image(self.hass, self._entity_id)
+            if not image:
+                return None
+
+            if image.content != self._source:
+                self._image = await self.hass.loop.run_in_executor(
+                    _async_get_executor(self.hass),
+                    self._job,
+                    image.content,
+                    self._opts,
+                )
+                self._source = image.content
+
+            self._time = monotonic()
+            return self._image
+        finally:
+            self._pending = None
+
+
 class ProxyCamera(Camera):
     """The representation of a Proxy camera."""
 
@@ -217,6 +303,14 @@ class ProxyCamera(Camera):
         self._last_image = None
         self._mode = config.get(CONF_MODE)
 
+        job = _resize_image if self._mode == MODE_RESIZE else _crop_image
+        self._image_cache = FrameCache(
+            hass, self._proxied_camera, job, self._image_opts, 0
+        )
+        self._stream_cache = FrameCache(
+            hass, self._proxied_camera, job, self._stream_opts, self.frame_interval
+        )
+
     def camera_image(self):
         """Return camera image."""
         return asyncio.run_coroutine_threadsafe(
@@ -233,19 +327,11 @@ class ProxyCamera(Camera):
             return self._last_image
 
         self._last_image_time = now
-        image = await async_get_image(self.hass, self._proxied_camera)
+        image = await self._image_cache.async_get_image()
         if not image:
             _LOGGER.error("Error getting original camera image")
             return self._last_image
 
-        if self._mode == MODE_RESIZE:
-            job = _resize_image
-        else:
-            job = _crop_image
-        image = await self.hass.async_add_executor_job(
-            job, image.content, self._image_opts
-        )
-
         if self._cache_images:
             self._last_image = image
         return image
@@ -269,16 +355,6 @@ class ProxyCamera(Camera):
     async def _async_stream_image(self):
         """Return a still image response from the camera."""
         try:
-            image = await async_get_image(self.hass, self._proxied_camera)
-            if not image:
-                return None
+            return await self._stream_cache.async_get_image()
         except HomeAssistantError:
             raise asyncio.CancelledError()
-
-        if self._mode == MODE_RESIZE:
-            job = _resize_image
-        else:
-            job = _crop_image
-        return await self.hass.async_add_executor_job(
-            job, image.content, self._stream_opts
-        )
@@ -1,7 +1,8 @@
 """Support for statistics for sensor values."""
 from collections import deque
+import heapq
 import logging
-import statistics
+import math
 
 import voluptuous as vol
 
@@ -91,8 +92,7 @@ class StatisticsSensor(Entity):
         self._max_age = max_age
         self._precision = precision
         self._unit_of_measurement = None
-        self.states = deque(maxlen=self._sampling_size)
-        self.ages = deque(maxlen=self._sampling_size)
+        self._window = WindowStatistics(self._sampling_size, not self.is_binary)
 
         self.count = 0
         self.mean = self.median = self.stdev = self.variance = None
@@ -139,11 +139,9 @@ class StatisticsSensor(Entity):
 
         try:
             if self.is_binary:
-                self.states.append(new_state.state)
+                self._window.add(new_state.state, new_state.last_updated)
             else:
-                self.states.append(float(new_state.state))
-
-            self.ages.append(new_state.last_updated)
+                self._window.add(float(new_state.state), new_state.last_updated)
         except ValueError:
             _LOGGER.error(
                 "%s: parsing error, expected number and received %s",
@@ -208,23 +206,18 @@ class StatisticsSensor(Entity):
             self._max_age,
         )
 
-        while self.ages and (now - self.ages[0]) > self._max_age:
-            _LOGGER.debug(
-                "%s: purging record with datetime %s(%s)",
-                self.entity_id,
-                dt_util.as_local(self.ages[0]),
-                (now - self.ages[0]),
-            )
-            self.ages.popleft()
-            self.states.popleft()
+        purged = self._window.purge_older_than(now - self._max_age)
+
+        if purged:
+            _LOGGER.debug("%s: purged %d records", self.entity_id, purged)
 
     def _next_to_purge_timestamp(self):
         """Find the timestamp when the next purge would occur."""
-        if self.ages and self._max_age:
+        if self._window.ages and self._max_age:
             # Take the oldest entry from the ages list and add the configured max_age.
             # If executed after purging old states, the result is the next timestamp
             # in the future when the oldest state will expire.
-            return self.ages[0] + self._max_age
+            return self._window.ages[0] + self._max_age
         return None
 
     async def async_update(self):
@@ -233,37 +226,38 @@ class StatisticsSensor(Entity):
         if self._max_age is not None:
             self._purge_old()
 
-        self.count = len(self.states)
+        window = self._window
+        self.count = len(window)
 
         if not self.is_binary:
-            try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
-                self.median = round(statistics.median(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if window:  # require only one data point
+                self.mean = round(window.mean, self._precision)
+                self.median = round(window.median, self._precision)
+            else:
+                _LOGGER.debug("%s: no data points", self.entity_id)
                 self.mean = self.median = STATE_UNKNOWN
 
-            try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states), self._precision)
-                self.variance = round(statistics.variance(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if len(window) > 1:  # require at least two data points
+                self.stdev = round(math.sqrt(window.variance), self._precision)
+                self.variance = round(window.variance, self._precision)
+            else:
+                _LOGGER.debug("%s: less than two data points", self.entity_id)
                 self.stdev = self.variance = STATE_UNKNOWN
 
-            if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+            if window:
+                self.total = round(window.total, self._precision)
+                self.min = round(window.min, self._precision)
+                self.max = round(window.max, self._precision)
 
-                self.min_age = self.ages[0]
-                self.max_age = self.ages[-1]
+                self.min_age = window.ages[0]
+                self.max_age = window.ages[-1]
 
-                self.change = self.states[-1] - self.states[0]
+                self.change = window.values[-1] - window.values[0]
                 self.average_change = self.change
                 self.change_rate = 0
 
-                if len(self.states) > 1:
-                    self.average_change /= len(self.states) - 1
+                if len(window) > 1:
+                    self.average_change /= len(window) - 1
 
                     time_diff = (self.max_age - self.min_age).total_seconds()
                     if time_diff > 0:
@@ -312,6 +306,17 @@ class StatisticsSensor(Entity):
 
         _LOGGER.debug("%s: initializing values from the database", self.entity_id)
 
+        states = await self.hass.async_add_executor_job(self._load_states_from_database)
+
+        for state in reversed(states):
+            self._add_state_to_queue(state)
+
+        self.async_schedule_update_ha_state(True)
+
+        _LOGGER.debug("%s: initializing from database completed", self.entity_id)
+
+    def _load_states_from_database(self):
+        """Load the window of states with a single query."""
         with session_scope(hass=self.hass) as session:
             query = session.query(States).filter(
                 States.entity_id == self._entity_id.lower()
@@ -331,11 +336,211 @@ class StatisticsSensor(Entity):
             query = query.order_by(States.last_updated.desc()).limit(
                 self._sampling_size
             )
-            states = execute(query)
+            return execute(query)
+
+
+class WindowStatistics:
+    """Statistics over a sliding window of samples.
+
+    The statistics are updated for every sample that is added or evicted
+    instead of being recalculated over the whole window. The mean and the
+    variance use Welford's algorithm, the minimum and maximum monotonic
+    queues and the median two heaps with lazy deletion.
+
+    Samples are always evicted oldest first, either because the window is
+    full or because they are too old.
+    """
+
+    def __init__(self, size, numeric=True):
+        """Initialize the window."""
+        self.size = size
+        self.numeric = numeric
+        self.values = deque()
+        self.ages = deque()
+        # Sequence number of the oldest and of the next sample
+        self._head = 0
+        self._next = 0
+        self._evicted = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        # Monotonic queues of (value, seq)
+        self._min_queue = deque()
+        self._max_queue = deque()
+        # Max heap of the lower half as (-value, seq), min heap of the upper half
+        self._low = []
+        self._high = []
+        self._low_size = 0
+        self._high_size = 0
+        self._in_low = {}
+
+    def __len__(self):
+        """Return the number of samples in the window."""
+        return len(self.values)
 
-        for state in reversed(states):
-            self._add_state_to_queue(state)
+    @property
+    def mean(self):
+        """Return the mean of the samples."""
+        return self._mean
 
-        self.async_schedule_update_ha_state(True)
+    @property
+    def total(self):
+        """Return the sum of the samples."""
+        return self._mean * len(self.values)
 
-        _LOGGER.debug("%s: initializing from database completed", self.entity_id)
+    @property
+    def variance(self):
+        """Return the sample variance of the samples."""
+        return max(self._m2, 0.0) / (len(self.values) - 1)
+
+    @property
+    def min(self):
+        """Return the smallest sample."""
+        return self._min_queue[0][0]
+
+    @property
+    def max(self):
+        """Return the largest sample."""
+        return self._max_queue[0][0]
+
+    @property
+    def median(self):
+        """Return the median of the samples."""
+        if self._low_size > self._high_size:
+            return -self._low[0][0]
+        return (-self._low[0][0] + self._high[0][0]) / 2
+
+    def add(self, value, age):
+        """Add a sample, evicting the oldest one if the window is full."""
+        if len(self.values) >= self.size:
+            self._evict()
+
+        seq = self._next
+        self._next += 1
+        self.values.append(value)
+        self.ages.append(age)
+
+        if not self.numeric:
+            return
+
+        delta = value - self._mean
+        self._mean += delta / len(self.values)
+        self._m2 += delta * (value - self._mean)
+
+        while self._min_queue and self._min_queue[-1][0] >= value:
+            self._min_queue.pop()
+        self._min_queue.append((value, seq))
+
+        while self._max_queue and self._max_queue[-1][0] <= value:
+            self._max_queue.pop()
+        self._max_queue.append((value, seq))
+
+        if not self._low or value <= -self._low[0][0]:
+            heapq.heappush(self._low, (-value, seq))
+            self._in_low[seq] = True
+            self._low_size += 1
+        else:
+            heapq.heappush(self._high, (value, seq))
+            self._in_low[seq] = False
+            self._high_size += 1
+
+        self._rebalance()
+
+    def purge_older_than(self, cutoff):
+        """Evict the samples older than cutoff and return how many."""
+        purged = 0
+
+        while self.ages and self.ages[0] < cutoff:
+            self._evict()
+            purged += 1
+
+        return purged
+
+    def _evict(self):
+        """Evict the oldest sample."""
+        value = self.values.popleft()
+        self.ages.popleft()
+        seq = self._head
+        self._head += 1
+
+        if not self.numeric:
+            return
+
+        count = len(self.values)
+
+        if not count:
+            self._reset()
+            return
+
+        old_mean = self._mean
+        self._mean = (old_mean * (count + 1) - value) / count
+        self._m2 -= (value - old_mean) * (value - self._mean)
+
+        if self._min_queue[0][1] == seq:
+            self._min_queue.popleft()
+        if self._max_queue[0][1] == seq:
+            self._max_queue.popleft()
+
+        if self._in_low.pop(seq):
+            self._low_size -= 1
+        else:
+            self._high_size -= 1
+
+        self._rebalance()
+
+        self._evicted += 1
+        if self._evicted >= count:
+            self._resync()
+
+    def _rebalance(self):
+        """Balance the heaps so the lower half holds the median."""
+        self._prune()
+
+        while self._low_size > self._high_size + 1:
+            value, seq = heapq.heappop(self._low)
+            heapq.heappush(self._high, (-value, seq))
+            self._in_low[seq] = False
+            self._low_size -= 1
+            self._high_size += 1
+            self._prune()
+
+        while self._high_size > self._low_size:
+            value, seq = heapq.heappop(self._high)
+            heapq.heappush(self._low, (-value, seq))
+            self._in_low[seq] = True
+            self._high_size -= 1
+            self._low_size += 1
+            self._prune()
+
+    def _prune(self):
+        """Drop evicted samples from the top of the heaps."""
+        while self._low and self._low[0][1] < self._head:
+            heapq.heappop(self._low)
+        while self._high and self._high[0][1] < self._head:
+            heapq.heappop(self._high)
+
+    def _resync(self):
+        """Recalculate the running values once per window.
+
+        This bounds the floating point error the removals accumulate and
+        drops the evicted samples that are buried in the heaps.
+        """
+        self._evicted = 0
+        count = len(self.values)
+        self._mean = math.fsum(self.values) / count
+        self._m2 = math.fsum((value - self._mean) ** 2 for value in self.values)
+
+        self._low = [item for item in self._low if item[1] >= self._head]
+        self._high = [item for item in self._high if item[1] >= self._head]
+        heapq.heapify(self._low)
+        heapq.heapify(self._high)
+
+    def _reset(self):
+        """Reset the running values of an empty window."""
+        self._evicted = 0
+        self._mean = self._m2 = 0.0
+        self._min_queue.clear()
+        self._max_queue.clear()
+        self._low.clear()
+        self._high.clear()
+        self._low_size = self._high_size = 0
+        self._in_low.clear()
@@ -13,19 +13,35 @@ from homeassistant.loader import bind_hass
 
 from .const import (
     ATTR_ENDPOINTS,
+    ATTR_SETTINGS,
     ATTR_STREAMS,
     CONF_DURATION,
+    CONF_LL_HLS,
     CONF_LOOKBACK,
+    CONF_PART_DURATION,
     CONF_STREAM_SOURCE,
+    DEFAULT_PART_DURATION,
     DOMAIN,
     SERVICE_RECORD,
 )
-from .core import PROVIDERS
+from .core import PROVIDERS, PacketBuffer
 from .hls import async_setup_hls
 
 _LOGGER = logging.getLogger(__name__)
 
-CONFIG_SCHEMA = vol.Schema({DOMAIN: vol.Schema({})}, extra=vol.ALLOW_EXTRA)
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Optional(CONF_LL_HLS, default=False): cv.boolean,
+                vol.Optional(
+                    CONF_PART_DURATION, default=DEFAULT_PART_DURATION
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.2, max=2.0)),
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
 
 STREAM_SERVICE_SCHEMA = vol.Schema({vol.Required(CONF_STREAM_SOURCE): cv.string})
 
@@ -88,6 +104,7 @@ async def async_setup(hass, config):
     hass.data[DOMAIN] = {}
     hass.data[DOMAIN][ATTR_ENDPOINTS] = {}
     hass.data[DOMAIN][ATTR_STREAMS] = {}
+    hass.data[DOMAIN][ATTR_SETTINGS] = config.get(DOMAIN) or {}
 
     # Setup HLS
     hls_endpoint = async_setup_hls(hass)
@@ -130,6 +147,7 @@ class Stream:
         self._thread = None
         self._thread_quit = None
         self._outputs = {}
+        self.packets = PacketBuffer()
 
         if self.options is None:
             self.options = {}
@@ -222,10 +240,7 @@ async def async_handle_record_service(hass, call):
 
     stream.start()
 
-    # Take advantage of lookback
-    hls = stream.outputs.get("hls")
-    if lookback > 0 and hls:
-        num_segments = min(int(lookback // hls.target_duration), hls.num_segments)
-        # Wait for latest segment, then add the lookback
-        await hls.recv()
-        recorder.prepend(list(hls.get_segment())[-num_segments:])
+    # Record from the packet buffer, starting lookback seconds ago. The buffer
+    # is only filled while the worker runs, a stream that was not being viewed
+    # or kept alive starts recording now.
+    recorder.start(lookback)
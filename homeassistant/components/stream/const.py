@@ -4,10 +4,13 @@ DOMAIN = "stream"
 CONF_STREAM_SOURCE = "stream_source"
 CONF_LOOKBACK = "lookback"
 CONF_DURATION = "duration"
+CONF_LL_HLS = "ll_hls"
+CONF_PART_DURATION = "part_duration"
 
 ATTR_ENDPOINTS = "endpoints"
 ATTR_STREAMS = "streams"
 ATTR_KEEPALIVE = "keepalive"
+ATTR_SETTINGS = "settings"
 
 SERVICE_RECORD = "record"
 
@@ -16,3 +19,9 @@ OUTPUT_FORMATS = ["hls"]
 FORMAT_CONTENT_TYPE = {"hls": "application/vnd.apple.mpegurl"}
 
 AUDIO_SAMPLE_RATE = 44100
+
+# Seconds of packets kept for the lookback of recordings
+PACKET_BUFFER_DURATION = 10
+
+# Target duration in seconds of LL-HLS partial segments
+DEFAULT_PART_DURATION = 1.0
@@ -2,7 +2,8 @@
 import asyncio
 from collections import deque
 import io
-from typing import Any, List
+import threading
+from typing import Any, List, Optional, Tuple, Union
 
 from aiohttp import web
 import attr
@@ -12,7 +13,7 @@ from homeassistant.core import callback
 from homeassistant.helpers.event import async_call_later
 from homeassistant.util.decorator import Registry
 
-from .const import ATTR_STREAMS, DOMAIN
+from .const import ATTR_STREAMS, DOMAIN, PACKET_BUFFER_DURATION
 
 PROVIDERS = Registry()
 
@@ -25,15 +26,158 @@ class StreamBuffer:
     output = attr.ib()  # type=av.OutputContainer
     vstream = attr.ib()  # type=av.VideoStream
     astream = attr.ib(default=None)  # type=av.AudioStream
+    part_target = attr.ib(default=None, type=float)
+    part_start = attr.ib(default=0, type=float)
+    part_offset = attr.ib(default=0, type=int)
+    parts = attr.ib(factory=list)
+
+
+@attr.s(frozen=True)
+class Part:
+    """Represent a partial segment."""
+
+    duration = attr.ib(type=float)
+    independent = attr.ib(type=bool)
+    data = attr.ib(type=Union[bytes, memoryview])
 
 
 @attr.s
 class Segment:
-    """Represent a segment."""
+    """Represent a segment.
+
+    The data is immutable, so a segment is served to all viewers without copies.
+    """
 
     sequence = attr.ib(type=int)
-    segment = attr.ib(type=io.BytesIO)
+    segment = attr.ib(type=bytes)
     duration = attr.ib(type=float)
+    parts = attr.ib(factory=list)
+
+
+def cut_part(buffer, packet):
+    """Cut a partial segment before the packet would exceed the part target.
+
+    The part holds the bytes muxed into the buffer since the previous part.
+    The output flushes after every packet, so these are the whole transport
+    stream packets of the video muxed since then. Only silent audio the muxer
+    still interleaves can end up in the next part.
+    """
+    packet_start = float(packet.pts * packet.time_base)
+    duration = packet_start - buffer.part_start
+    if duration + float(packet.duration * packet.time_base) <= buffer.part_target:
+        return None
+
+    segment = buffer.segment
+    position = segment.tell()
+    segment.seek(buffer.part_offset)
+    data = segment.read(position - buffer.part_offset)
+    segment.seek(position)
+    if not data:
+        return None
+
+    part = Part(duration, not buffer.parts, data)
+    buffer.parts.append(part)
+    buffer.part_offset += len(data)
+    buffer.part_start = packet_start
+    return part
+
+
+def create_segment(buffer, sequence, duration, end):
+    """Create a segment from a closed buffer.
+
+    Its parts become views on the segment bytes, so the data is kept once.
+    """
+    data = buffer.segment.getvalue()
+    parts = []
+    if buffer.part_target:
+        view = memoryview(data)
+        offset = 0
+        for part in buffer.parts:
+            size = len(part.data)
+            parts.append(
+                Part(part.duration, part.independent, view[offset : offset + size])
+            )
+            offset += size
+        if offset < len(data):
+            parts.append(Part(end - buffer.part_start, not parts, view[offset:]))
+    return Segment(sequence, data, duration, parts)
+
+
+class PacketBuffer:
+    """Keep the latest video packets of a stream, grouped by keyframe.
+
+    Packets are appended by the stream worker and read by the recorder, so
+    the groups are guarded by a lock. Groups older than the duration are
+    dropped unless they are held for a recording.
+    """
+
+    def __init__(self, duration: float = PACKET_BUFFER_DURATION) -> None:
+        """Initialize a packet buffer."""
+        self.duration = duration
+        self.hold: Optional[float] = None
+        self.video_stream = None  # type=av.VideoStream
+        self.latest: Optional[float] = None
+        self._groups = deque()
+        self._lock = threading.Lock()
+
+    def clear(self, video_stream=None) -> Tuple[Any, list]:
+        """Drop all packets when the stream (re)starts.
+
+        Returns the previous video stream and the packets held for a
+        recording, a recording cannot continue with the timestamps of the
+        new stream.
+        """
+        with self._lock:
+            previous = self.video_stream
+            held = self._release()
+            self.video_stream = video_stream
+            self.latest = None
+            self._groups.clear()
+        return previous, held
+
+    def release(self) -> Tuple[Any, list]:
+        """Stop holding packets, return the video stream and the held packets."""
+        with self._lock:
+            return self.video_stream, self._release()
+
+    def _release(self) -> list:
+        """Return the held packets and stop holding them."""
+        if self.hold is None:
+            return []
+        start, self.hold = self.hold, None
+        return self._packets_from(start)
+
+    def append(self, packet, time: float) -> None:
+        """Add a packet at the given stream time in seconds."""
+        with self._lock:
+            if packet.is_keyframe:
+                self._groups.append((time, [packet]))
+            elif self._groups:
+                self._groups[-1][1].append(packet)
+            else:
+                # Nothing can be decoded before the first keyframe
+                return
+            self.latest = time
+
+            keep_from = time - self.duration
+            if self.hold is not None:
+                keep_from = min(keep_from, self.hold)
+            while len(self._groups) > 1 and self._groups[1][0] <= keep_from:
+                self._groups.popleft()
+
+    def get(self, start: float = 0) -> list:
+        """Return the packets from the keyframe at or before start."""
+        with self._lock:
+            return self._packets_from(start)
+
+    def _packets_from(self, start: float) -> list:
+        """Return the packets from the keyframe at or before start."""
+        first = 0
+        for index, (time, _) in enumerate(self._groups):
+            if time <= start:
+                first = index
+        groups = list(self._groups)[first:]
+        return [packet for _, packets in groups for packet in packets]
 
 
 class StreamOutput:
@@ -48,7 +192,10 @@ class StreamOutput:
         self._stream = stream
         self._cursor = None
         self._event = asyncio.Event()
+        self._part_event = asyncio.Event()
         self._segments = deque(maxlen=self.num_segments)
+        self._part_sequence = None
+        self._parts = []
         self._unsub = None
 
     @property
@@ -71,6 +218,11 @@ class StreamOutput:
         """Return desired video codec."""
         return None
 
+    @property
+    def part_target(self) -> Optional[float]:
+        """Return the target duration of partial segments, if enabled."""
+        return None
+
     @property
     def segments(self) -> List[int]:
         """Return current sequence from segments."""
@@ -98,6 +250,56 @@ class StreamOutput:
                 return segment
         return None
 
+    @property
+    def parts(self) -> List[Part]:
+        """Return the parts of the segment in progress."""
+        return self._parts
+
+    @property
+    def part_sequence(self) -> int:
+        """Return the sequence of the segment in progress."""
+        if self._part_sequence is not None:
+            return self._part_sequence
+        return max(self.segments, default=0) + 1
+
+    def get_part(self, sequence: int, index: int) -> Optional[Part]:
+        """Retrieve a part of a finished segment or the segment in progress."""
+        segment = self.get_segment(sequence)
+        if segment is not None:
+            parts = segment.parts
+        elif sequence == self._part_sequence:
+            parts = self._parts
+        else:
+            return None
+        return parts[index] if index < len(parts) else None
+
+    def has_part(self, sequence: int, index: Optional[int] = None) -> bool:
+        """Return if the playlist contains a segment, or a part of it."""
+        if sequence <= max(self.segments, default=0):
+            return True
+        if index is None or self._part_sequence is None:
+            return False
+        return self._part_sequence > sequence or (
+            self._part_sequence == sequence and index < len(self._parts)
+        )
+
+    async def async_wait_for_part(
+        self, sequence: int, index: Optional[int], timeout: float
+    ) -> bool:
+        """Wait until a segment or part is available, used for blocking reloads."""
+        loop = self._stream.hass.loop
+        end = loop.time() + timeout
+        while not self.has_part(sequence, index):
+            remaining = end - loop.time()
+            if remaining <= 0:
+                return False
+            try:
+                # Each notification replaces the event, it cannot be missed
+                await asyncio.wait_for(self._part_event.wait(), remaining)
+            except asyncio.TimeoutError:
+                return False
+        return True
+
     async def recv(self) -> Segment:
         """Wait for and retrieve the latest segment."""
         last_segment = max(self.segments, default=0)
@@ -129,8 +331,27 @@ class StreamOutput:
             return
 
         self._segments.append(segment)
+        if segment.sequence == self._part_sequence:
+            self._part_sequence = None
+            self._parts = []
         self._event.set()
         self._event.clear()
+        self._notify_parts()
+
+    @callback
+    def _notify_parts(self) -> None:
+        """Wake up the requests waiting for a segment or part."""
+        self._part_event.set()
+        self._part_event = asyncio.Event()
+
+    @callback
+    def put_part(self, sequence: int, part: Part) -> None:
+        """Store a part of the segment in progress."""
+        if sequence != self._part_sequence:
+            self._part_sequence = sequence
+            self._parts = []
+        self._parts.append(part)
+        self._notify_parts()
 
     @callback
     def _timeout(self, _now=None):
@@ -145,6 +366,8 @@ class StreamOutput:
     def cleanup(self):
         """Handle cleanup."""
         self._segments = deque(maxlen=self.num_segments)
+        self._part_sequence = None
+        self._parts = []
         self._stream.remove_provider(self)
 
 
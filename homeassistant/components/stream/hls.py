@@ -4,7 +4,13 @@ from aiohttp import web
 from homeassistant.core import callback
 from homeassistant.util.dt import utcnow
 
-from .const import FORMAT_CONTENT_TYPE
+from .const import (
+    ATTR_SETTINGS,
+    CONF_LL_HLS,
+    CONF_PART_DURATION,
+    DOMAIN,
+    FORMAT_CONTENT_TYPE,
+)
 from .core import PROVIDERS, StreamOutput, StreamView
 
 
@@ -13,6 +19,7 @@ def async_setup_hls(hass):
     """Set up api endpoints."""
     hass.http.register_view(HlsPlaylistView())
     hass.http.register_view(HlsSegmentView())
+    hass.http.register_view(HlsPartView())
     return "/api/hls/{}/playlist.m3u8"
 
 
@@ -31,6 +38,24 @@ class HlsPlaylistView(StreamView):
         # Wait for a segment to be ready
         if not track.segments:
             await track.recv()
+
+        # Blocking playlist reload, wait until the requested part is available
+        if track.part_target and "_HLS_msn" in request.query:
+            try:
+                msn = int(request.query["_HLS_msn"])
+                part = request.query.get("_HLS_part")
+                part = int(part) if part is not None else None
+            except ValueError:
+                return web.HTTPBadRequest()
+            if msn > max(track.segments, default=0) + 2:
+                return web.HTTPBadRequest()
+            if not await track.async_wait_for_part(
+                msn, part, 3 * track.target_duration
+            ):
+                return web.HTTPServiceUnavailable()
+            if not track.segments:
+                return web.HTTPNotFound()
+
         headers = {"Content-Type": FORMAT_CONTENT_TYPE["hls"]}
         return web.Response(
             body=renderer.render(track, utcnow()).encode("utf-8"), headers=headers
@@ -51,7 +76,35 @@ class HlsSegmentView(StreamView):
         if not segment:
             return web.HTTPNotFound()
         headers = {"Content-Type": "video/mp2t"}
-        return web.Response(body=segment.segment.getvalue(), headers=headers)
+        return web.Response(body=segment.segment, headers=headers)
+
+
+class HlsPartView(StreamView):
+    """Stream view to serve a MPEG2TS partial segment."""
+
+    url = r"/api/hls/{token:[a-f0-9]+}/segment/{sequence:\d+}.{part:\d+}.ts"
+    name = "api:stream:hls:part"
+    cors_allowed = True
+
+    async def get(self, request, token, sequence=None, part=None):
+        """Start a GET request."""
+        return await super().get(request, token, sequence)
+
+    async def handle(self, request, stream, sequence):
+        """Return mpegts partial segment, waiting for a hinted part."""
+        track = stream.add_provider("hls")
+        sequence = int(sequence)
+        index = int(request.match_info["part"])
+        if not track.part_target:
+            return web.HTTPNotFound()
+        # Preload hints reference the next part, hold the request until it exists
+        if sequence == track.part_sequence and index == len(track.parts):
+            await track.async_wait_for_part(sequence, index, 3 * track.part_target)
+        part = track.get_part(sequence, index)
+        if not part:
+            return web.HTTPNotFound()
+        headers = {"Content-Type": "video/mp2t"}
+        return web.Response(body=part.data, headers=headers)
 
 
 class M3U8Renderer:
@@ -64,10 +117,34 @@ class M3U8Renderer:
     @staticmethod
     def render_preamble(track):
         """Render preamble."""
-        return ["#EXT-X-VERSION:3", f"#EXT-X-TARGETDURATION:{track.target_duration}"]
+        if not track.part_target:
+            return [
+                "#EXT-X-VERSION:3",
+                f"#EXT-X-TARGETDURATION:{track.target_duration}",
+            ]
+        return [
+            "#EXT-X-VERSION:6",
+            f"#EXT-X-TARGETDURATION:{track.target_duration}",
+            "#EXT-X-SERVER-CONTROL:CAN-BLOCK-RELOAD=YES,"
+            "PART-HOLD-BACK={:.03f}".format(3 * track.part_target),
+            "#EXT-X-PART-INF:PART-TARGET={:.03f}".format(track.part_target),
+        ]
 
     @staticmethod
-    def render_playlist(track, start_time):
+    def render_parts(sequence, parts):
+        """Render the partial segments of a segment."""
+        return [
+            '#EXT-X-PART:DURATION={:.03f},URI="./segment/{}.{}.ts"{}'.format(
+                part.duration,
+                sequence,
+                index,
+                ",INDEPENDENT=YES" if part.independent else "",
+            )
+            for index, part in enumerate(parts)
+        ]
+
+    @classmethod
+    def render_playlist(cls, track, start_time):
         """Render playlist."""
         segments = track.segments
 
@@ -78,6 +155,8 @@ class M3U8Renderer:
 
         for sequence in segments:
             segment = track.get_segment(sequence)
+            if track.part_target:
+                playlist.extend(cls.render_parts(segment.sequence, segment.parts))
             playlist.extend(
                 [
                     "#EXTINF:{:.04f},".format(float(segment.duration)),
@@ -85,6 +164,15 @@ class M3U8Renderer:
                 ]
             )
 
+        if track.part_target:
+            sequence = track.part_sequence
+            playlist.extend(cls.render_parts(sequence, track.parts))
+            playlist.append(
+                '#EXT-X-PRELOAD-HINT:TYPE=PART,URI="./segment/{}.{}.ts"'.format(
+                    sequence, len(track.parts)
+                )
+            )
+
         return playlist
 
     def render(self, track, start_time):
@@ -120,3 +208,11 @@ class HlsStreamOutput(StreamOutput):
     def video_codec(self) -> str:
         """Return desired video codec."""
         return "h264"
+
+    @property
+    def part_target(self) -> float:
+        """Return the target duration of partial segments in LL-HLS mode."""
+        settings = self._stream.hass.data[DOMAIN].get(ATTR_SETTINGS, {})
+        if not settings.get(CONF_LL_HLS):
+            return None
+        return settings[CONF_PART_DURATION]
@@ -6,8 +6,9 @@ from typing import List
 import av
 
 from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
 
-from .core import PROVIDERS, Segment, StreamOutput
+from .core import PROVIDERS, StreamOutput
 
 
 @callback
@@ -15,26 +16,15 @@ def async_setup_recorder(hass):
     """Only here so Provider Registry works."""
 
 
-def recorder_save_worker(file_out: str, segments: List[Segment]):
+def recorder_save_worker(file_out: str, video_stream, packets: List[av.Packet]):
     """Handle saving stream."""
     output = av.open(file_out, "w", options={"movflags": "frag_keyframe"})
-    output_v = None
+    output_v = output.add_stream(template=video_stream)
 
-    for segment in segments:
-        # Seek to beginning and open segment
-        segment.segment.seek(0)
-        source = av.open(segment.segment, "r", format="mpegts")
-        source_v = source.streams.video[0]
-
-        # Add output streams
-        if not output_v:
-            output_v = output.add_stream(template=source_v)
-
-        # Remux video
-        for packet in source.demux(source_v):
-            if packet is not None and packet.dts is not None:
-                packet.stream = output_v
-                output.mux(packet)
+    # Mux the buffered video packets directly
+    for packet in packets:
+        packet.stream = output_v
+        output.mux(packet)
 
     output.close()
 
@@ -47,33 +37,32 @@ class RecorderOutput(StreamOutput):
         """Initialize recorder output."""
         super().__init__(stream, timeout)
         self.video_path = None
-        self._segments = []
+        self._start = None
 
     @property
     def name(self) -> str:
         """Return provider name."""
         return "recorder"
 
-    @property
-    def format(self) -> str:
-        """Return container format."""
-        return "mpegts"
-
-    @property
-    def audio_codec(self) -> str:
-        """Return desired audio codec."""
-        return "aac"
-
     @property
     def video_codec(self) -> str:
         """Return desired video codec."""
         return "h264"
 
-    def prepend(self, segments: List[Segment]) -> None:
-        """Prepend segments to existing list."""
-        own_segments = self.segments
-        segments = [s for s in segments if s.sequence not in own_segments]
-        self._segments = segments + self._segments
+    @callback
+    def start(self, lookback: int = 0) -> None:
+        """Hold the stream packets from the lookback until the recording ends.
+
+        The recorder has no container format, the stream worker keeps its
+        packets in the packet buffer of the stream instead of segments. The
+        buffer only has packets while the worker runs, so the lookback is
+        limited to how long the stream was already being viewed or kept alive.
+        """
+        packets = self._stream.packets
+        latest = packets.latest
+        self._start = max(latest - lookback, 0) if latest is not None else 0
+        packets.hold = self._start
+        self._unsub = async_call_later(self._stream.hass, self.timeout, self._timeout)
 
     @callback
     def _timeout(self, _now=None):
@@ -81,14 +70,30 @@ class RecorderOutput(StreamOutput):
         self._unsub = None
         self.cleanup()
 
+    @callback
+    def end(self, video_stream, recording: List[av.Packet]) -> None:
+        """End the recording early with the packets held so far.
+
+        Called when the stream restarts and the held packets are dropped.
+        """
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        self._finish(video_stream, recording)
+
     def cleanup(self):
         """Write recording and clean up."""
-        thread = threading.Thread(
-            name="recorder_save_worker",
-            target=recorder_save_worker,
-            args=(self.video_path, self._segments),
-        )
-        thread.start()
-
-        self._segments = []
-        self._stream.remove_provider(self)
+        self._finish(*self._stream.packets.release())
+
+    def _finish(self, video_stream, recording: List[av.Packet]) -> None:
+        """Write the recorded packets and remove the recorder from the stream."""
+        if recording:
+            thread = threading.Thread(
+                name="recorder_save_worker",
+                target=recorder_save_worker,
+                args=(self.video_path, video_stream, recording),
+            )
+            thread.start()
+
+        if self._stream.outputs.get(self.name) is self:
+            self._stream.remove_provider(self)
@@ -6,7 +6,7 @@ import logging
 import av
 
 from .const import AUDIO_SAMPLE_RATE
-from .core import Segment, StreamBuffer
+from .core import StreamBuffer, create_segment, cut_part
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,7 +29,17 @@ def create_stream_buffer(stream_output, video_stream, audio_frame):
 
     a_packet = None
     segment = io.BytesIO()
-    output = av.open(segment, mode="w", format=stream_output.format)
+    container_options = None
+    if stream_output.part_target:
+        # Flush the muxer's I/O buffer after every packet, so the bytes of all
+        # packets muxed so far are in the segment when a part is cut
+        container_options = {"flush_packets": "1"}
+    output = av.open(
+        segment,
+        mode="w",
+        format=stream_output.format,
+        container_options=container_options,
+    )
     vstream = output.add_stream(template=video_stream)
     # Check if audio is requested
     astream = None
@@ -40,7 +50,12 @@ def create_stream_buffer(stream_output, video_stream, audio_frame):
             a_packets = astream.encode(audio_frame)
             if a_packets:
                 a_packet = a_packets[0]
-    return (a_packet, StreamBuffer(segment, output, vstream, astream))
+    return (
+        a_packet,
+        StreamBuffer(
+            segment, output, vstream, astream, part_target=stream_output.part_target
+        ),
+    )
 
 
 def stream_worker(hass, stream, quit_event):
@@ -55,6 +70,13 @@ def stream_worker(hass, stream, quit_event):
 
     audio_frame = generate_audio_frame()
 
+    # A running recording cannot continue over the timestamps of the new
+    # container, end it with the packets it holds before they are dropped
+    previous_stream, recording = stream.packets.clear(video_stream)
+    recorder = stream.outputs.get("recorder")
+    if recording and recorder is not None:
+        hass.loop.call_soon_threadsafe(recorder.end, previous_stream, recording)
+
     first_packet = True
     # Holds the buffers for each stream provider
     outputs = {}
@@ -77,8 +99,8 @@ def stream_worker(hass, stream, quit_event):
                 raise StopIteration("No dts in packet")
         except (av.AVError, StopIteration) as ex:
             # End of stream, clear listeners and stop thread
-            for fmt, _ in outputs.items():
-                hass.loop.call_soon_threadsafe(stream.outputs[fmt].put, None)
+            for stream_output in list(stream.outputs.values()):
+                hass.loop.call_soon_threadsafe(stream_output.put, None)
             _LOGGER.error("Error demuxing stream: %s", str(ex))
             break
 
@@ -98,6 +120,7 @@ def stream_worker(hass, stream, quit_event):
             # By then dividing by the sequence, we can calculate how long
             # each segment is, assuming the stream starts from 0.
             segment_duration = (packet.pts * packet.time_base) / sequence
+            segment_end = float(packet.pts * packet.time_base)
             # Save segment to outputs
             for fmt, buffer in outputs.items():
                 buffer.output.close()
@@ -105,7 +128,7 @@ def stream_worker(hass, stream, quit_event):
                 if stream.outputs.get(fmt):
                     hass.loop.call_soon_threadsafe(
                         stream.outputs[fmt].put,
-                        Segment(sequence, buffer.segment, segment_duration),
+                        create_segment(buffer, sequence, segment_duration, segment_end),
                     )
 
             # Clear outputs and increment sequence
@@ -113,9 +136,12 @@ def stream_worker(hass, stream, quit_event):
             if not first_packet:
                 sequence += 1
 
-            # Initialize outputs
+            # Initialize outputs, formatless outputs use the packet buffer
             for stream_output in stream.outputs.values():
-                if video_stream.name != stream_output.video_codec:
+                if (
+                    video_stream.name != stream_output.video_codec
+                    or stream_output.format is None
+                ):
                     continue
 
                 a_packet, buffer = create_stream_buffer(
@@ -137,7 +163,17 @@ def stream_worker(hass, stream, quit_event):
             first_packet = False
 
         # Store packets on each output
-        for buffer in outputs.values():
+        for fmt, buffer in outputs.items():
+            if buffer.part_target:
+                if packet.is_keyframe:
+                    buffer.part_start = float(packet.pts * packet.time_base)
+                else:
+                    part = cut_part(buffer, packet)
+                    if part and stream.outputs.get(fmt):
+                        hass.loop.call_soon_threadsafe(
+                            stream.outputs[fmt].put_part, sequence, part
+                        )
+
             # Check if the format requires audio
             if audio_packets.get(buffer.astream):
                 a_packet = audio_packets[buffer.astream]
@@ -164,3 +200,6 @@ def stream_worker(hass, stream, quit_event):
             # Assign the video packet to the new stream & mux
             packet.stream = buffer.vstream
             buffer.output.mux(packet)
+
+        # Keep the packet for recordings once the outputs are done with it
+        stream.packets.append(packet, float(packet.pts * packet.time_base))
@@ -277,36 +277,41 @@ class TensorFlowImageProcessor(ImageProcessingEntity):
             _LOGGER.info("Saving results image to %s", path)
             img.save(path)
 
+    @property
+    def batch_key(self):
+        """Return the session shared by the cameras of this model."""
+        return self._session
+
     def process_image(self, image):
         """Process the image."""
+        self.process_image_batch([(self, image)])
 
-        try:
-            import cv2  # pylint: disable=import-error
-
-            img = cv2.imdecode(np.asarray(bytearray(image)), cv2.IMREAD_UNCHANGED)
-            inp = img[:, :, [2, 1, 0]]  # BGR->RGB
-            inp_expanded = inp.reshape(1, inp.shape[0], inp.shape[1], 3)
-        except ImportError:
-            img = Image.open(io.BytesIO(bytearray(image))).convert("RGB")
-            img.thumbnail((460, 460), Image.ANTIALIAS)
-            img_width, img_height = img.size
-            inp = (
-                np.array(img.getdata())
-                .reshape((img_height, img_width, 3))
-                .astype(np.uint8)
-            )
-            inp_expanded = np.expand_dims(inp, axis=0)
+    def process_image_batch(self, frames):
+        """Process images of several cameras, one session run per image size."""
+        batches = {}
+        for entity, image in frames:
+            inp = prepare_image(image)
+            batches.setdefault(inp.shape, []).append((entity, image, inp))
 
         image_tensor = self._graph.get_tensor_by_name("image_tensor:0")
         boxes = self._graph.get_tensor_by_name("detection_boxes:0")
         scores = self._graph.get_tensor_by_name("detection_scores:0")
         classes = self._graph.get_tensor_by_name("detection_classes:0")
-        boxes, scores, classes = self._session.run(
-            [boxes, scores, classes], feed_dict={image_tensor: inp_expanded}
-        )
-        boxes, scores, classes = map(np.squeeze, [boxes, scores, classes])
-        classes = classes.astype(int)
+        for batch in batches.values():
+            inp_batch = np.stack([inp for _, _, inp in batch])
+            batch_boxes, batch_scores, batch_classes = self._session.run(
+                [boxes, scores, classes], feed_dict={image_tensor: inp_batch}
+            )
+            for index, (entity, image, _) in enumerate(batch):
+                entity.process_detections(
+                    image,
+                    batch_boxes[index],
+                    batch_scores[index],
+                    batch_classes[index].astype(int),
+                )
 
+    def process_detections(self, image, boxes, scores, classes):
+        """Filter the detections of an image and store the matches."""
         matches = {}
         total_matches = 0
         for box, score, obj_class in zip(boxes, scores, classes):
@@ -361,3 +366,19 @@ class TensorFlowImageProcessor(ImageProcessingEntity):
 
         self._matches = matches
         self._total_matches = total_matches
+
+
+def prepare_image(image):
+    """Decode an image into an RGB array for the detection graph."""
+    try:
+        import cv2  # pylint: disable=import-error
+
+        img = cv2.imdecode(np.asarray(bytearray(image)), cv2.IMREAD_UNCHANGED)
+        return img[:, :, [2, 1, 0]]  # BGR->RGB
+    except ImportError:
+        img = Image.open(io.BytesIO(bytearray(image))).convert("RGB")
+        img.thumbnail((460, 460), Image.ANTIALIAS)
+        img_width, img_height = img.size
+        return (
+            np.array(img.getdata()).reshape((img_height, img_width, 3)).astype(np.uint8)
+        )
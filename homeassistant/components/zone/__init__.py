@@ -17,6 +17,7 @@ from homeassistant.const import (
     CONF_NAME,
     CONF_RADIUS,
     EVENT_CORE_CONFIG_UPDATE,
+    EVENT_STATE_CHANGED,
     SERVICE_RELOAD,
 )
 from homeassistant.core import Event, HomeAssistant, ServiceCall, State, callback
@@ -29,6 +30,7 @@ from homeassistant.helpers import (
     service,
     storage,
 )
+from homeassistant.helpers.location import LocationIndex
 from homeassistant.loader import bind_hass
 from homeassistant.util.location import distance
 
@@ -74,6 +76,8 @@ RELOAD_SERVICE_SCHEMA = vol.Schema({})
 STORAGE_KEY = DOMAIN
 STORAGE_VERSION = 1
 
+DATA_ZONE_INDEX = "zone_index"
+
 
 @bind_hass
 def async_active_zone(
@@ -83,11 +87,24 @@ def async_active_zone(
 
     This method must be run in the event loop.
     """
+    zone_index = hass.data.get(DATA_ZONE_INDEX)
+
+    if zone_index is None:
+        zones = hass.states.async_all(DOMAIN)
+    else:
+        zones = [
+            state
+            for state in (
+                hass.states.get(entity_id)
+                for entity_id in zone_index.async_candidates(
+                    latitude, longitude, radius
+                )
+            )
+            if state is not None
+        ]
+
     # Sort entity IDs so that we are deterministic if equal distance to 2 zones
-    zones = (
-        cast(State, hass.states.get(entity_id))
-        for entity_id in sorted(hass.states.async_entity_ids(DOMAIN))
-    )
+    zones.sort(key=lambda state: state.entity_id)
 
     min_dist = None
     closest = None
@@ -179,8 +196,54 @@ class IDLessCollection(collection.ObservableCollection):
             await self.notify_change(collection.CHANGE_ADDED, item_id, item)
 
 
+@callback
+def _async_update_zone_index(zone_index: LocationIndex, zone: State) -> None:
+    """Update a zone in the zone index."""
+    if zone.attributes.get(ATTR_PASSIVE):
+        zone_index.async_remove(zone.entity_id)
+        return
+
+    try:
+        zone_index.async_set(
+            zone.entity_id,
+            float(zone.attributes[ATTR_LATITUDE]),
+            float(zone.attributes[ATTR_LONGITUDE]),
+            float(zone.attributes[ATTR_RADIUS]),
+        )
+    except (KeyError, TypeError, ValueError):
+        zone_index.async_remove(zone.entity_id)
+
+
+@callback
+def _async_setup_zone_index(hass: HomeAssistant) -> None:
+    """Set up a spatial index of the active zones."""
+    zone_index = hass.data[DATA_ZONE_INDEX] = LocationIndex()
+
+    for zone in hass.states.async_all(DOMAIN):
+        _async_update_zone_index(zone_index, zone)
+
+    @callback
+    def _async_zone_state_changed(event: Event) -> None:
+        """Keep the zone index up to date."""
+        entity_id = event.data["entity_id"]
+
+        if not entity_id.startswith(f"{DOMAIN}."):
+            return
+
+        new_state = event.data.get("new_state")
+
+        if new_state is None:
+            zone_index.async_remove(entity_id)
+        else:
+            _async_update_zone_index(zone_index, new_state)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _async_zone_state_changed)
+
+
 async def async_setup(hass: HomeAssistant, config: Dict) -> bool:
     """Set up configured zones as well as Home Assistant zone if necessary."""
+    _async_setup_zone_index(hass)
+
     component = entity_component.EntityComponent(_LOGGER, DOMAIN, hass)
     id_manager = collection.IDManager()
 
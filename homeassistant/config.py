@@ -1,7 +1,9 @@
 """Module to help with parsing and generating configuration files."""
 # pylint: disable=no-name-in-module
 from collections import OrderedDict
+import copy
 from distutils.version import LooseVersion  # pylint: disable=import-error
+import hashlib
 import logging
 import os
 import re
@@ -64,6 +66,11 @@ YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
+DATA_VALIDATION_CACHE = "config_validation_cache"
+
+# Validated sections kept before the cache is rebuilt
+VALIDATION_CACHE_SIZE = 4096
+_MISSING = object()
 
 GROUP_CONFIG_PATH = "groups.yaml"
 AUTOMATION_CONFIG_PATH = "automations.yaml"
@@ -701,7 +708,9 @@ async def async_process_component_config(
     # No custom config validator, proceed with schema validation
     if hasattr(component, "CONFIG_SCHEMA"):
         try:
-            return component.CONFIG_SCHEMA(config)  # type: ignore
+            return async_validate_cached(  # type: ignore
+                hass, component.CONFIG_SCHEMA, config, domain  # type: ignore
+            )
         except vol.Invalid as ex:
             async_log_exception(ex, domain, config, hass, integration.documentation)
             return None
@@ -717,7 +726,9 @@ async def async_process_component_config(
     for p_name, p_config in config_per_platform(config, domain):
         # Validate component specific platform schema
         try:
-            p_validated = component_platform_schema(p_config)
+            p_validated = async_validate_cached(
+                hass, component_platform_schema, p_config
+            )
         except vol.Invalid as ex:
             async_log_exception(ex, domain, p_config, hass, integration.documentation)
             continue
@@ -744,8 +755,8 @@ async def async_process_component_config(
         # Validate platform specific schema
         if hasattr(platform, "PLATFORM_SCHEMA"):
             try:
-                p_validated = platform.PLATFORM_SCHEMA(  # type: ignore
-                    p_config
+                p_validated = async_validate_cached(
+                    hass, platform.PLATFORM_SCHEMA, p_config  # type: ignore
                 )
             except vol.Invalid as ex:
                 async_log_exception(
@@ -767,6 +778,60 @@ async def async_process_component_config(
     return config
 
 
+@callback
+def async_validate_cached(
+    hass: HomeAssistant,
+    schema: Callable[[Any], Any],
+    config: Any,
+    domain: Optional[str] = None,
+) -> Any:
+    """Validate config with a schema, reusing earlier results for unchanged config.
+
+    When a domain is passed the schema is called with the full config, but
+    only the section of that domain is cached. Results are copied so callers
+    can modify them. Raises vol.Invalid like the schema.
+    """
+    cache = hass.data.setdefault(DATA_VALIDATION_CACHE, {})
+    raw = config if domain is None else config.get(domain, _MISSING)
+    digest = hashlib.sha1(repr(raw).encode()).hexdigest()
+
+    # The cache entry keeps the schema alive, so its id can't be reused
+    key = (id(schema), domain, digest)
+    if key in cache:
+        section = cache[key][1]
+        if domain is None:
+            return copy.deepcopy(section)
+        result = {name: value for name, value in config.items() if name != domain}
+        if section is not _MISSING:
+            result[domain] = copy.deepcopy(section)
+        return result
+
+    result = schema(config)
+
+    if domain is None:
+        section = result
+    elif (
+        not isinstance(result, dict)
+        or result.keys() - {domain} != config.keys() - {domain}
+        or any(result[name] is not config[name] for name in result if name != domain)
+    ):
+        # Schema touched other sections, those can't be taken from the cache
+        return result
+    else:
+        section = result.get(domain, _MISSING)
+
+    if section is not _MISSING:
+        try:
+            section = copy.deepcopy(section)
+        except (copy.Error, TypeError):
+            return result
+
+    if len(cache) >= VALIDATION_CACHE_SIZE:
+        cache.clear()
+    cache[key] = (schema, section)
+    return result
+
+
 @callback
 def config_without_domain(config: Dict, domain: str) -> Dict:
     """Return a config with all configuration for a domain removed."""
@@ -827,6 +827,7 @@ class StateMachine:
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: Dict[str, State] = {}
+        self._domain_index: Dict[str, Dict[str, State]] = {}
         self._bus = bus
         self._loop = loop
 
@@ -846,27 +847,35 @@ class StateMachine:
         if domain_filter is None:
             return list(self._states.keys())
 
-        domain_filter = domain_filter.lower()
+        return list(self._domain_index.get(domain_filter.lower(), {}).keys())
 
-        return [
-            state.entity_id
-            for state in self._states.values()
-            if state.domain == domain_filter
-        ]
+    @callback
+    def async_entity_ids_count(self, domain_filter: Optional[str] = None) -> int:
+        """Count the entity ids that are being tracked.
+
+        This method must be run in the event loop.
+        """
+        if domain_filter is None:
+            return len(self._states)
 
-    def all(self) -> List[State]:
+        return len(self._domain_index.get(domain_filter.lower(), {}))
+
+    def all(self, domain_filter: Optional[str] = None) -> List[State]:
         """Create a list of all states."""
         return run_callback_threadsafe(  # type: ignore
-            self._loop, self.async_all
+            self._loop, self.async_all, domain_filter
         ).result()
 
     @callback
-    def async_all(self) -> List[State]:
-        """Create a list of all states.
+    def async_all(self, domain_filter: Optional[str] = None) -> List[State]:
+        """Create a list of all states, optionally of a single domain.
 
         This method must be run in the event loop.
         """
-        return list(self._states.values())
+        if domain_filter is None:
+            return list(self._states.values())
+
+        return list(self._domain_index.get(domain_filter.lower(), {}).values())
 
     def get(self, entity_id: str) -> Optional[State]:
         """Retrieve state of entity_id or None if not found.
@@ -906,6 +915,11 @@ class StateMachine:
         if old_state is None:
             return False
 
+        domain_states = self._domain_index[old_state.domain]
+        del domain_states[entity_id]
+        if not domain_states:
+            del self._domain_index[old_state.domain]
+
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": None},
@@ -976,6 +990,7 @@ class StateMachine:
 
         state = State(entity_id, new_state, attributes, last_changed, None, context)
         self._states[entity_id] = state
+        self._domain_index.setdefault(state.domain, {})[entity_id] = state
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
@@ -13,6 +13,7 @@ from homeassistant.config import (
     CORE_CONFIG_SCHEMA,
     YAML_CONFIG_FILE,
     _format_config_error,
+    async_validate_cached,
     config_per_platform,
     extract_domain_configs,
     load_yaml_config_file,
@@ -126,7 +127,7 @@ async def async_check_ha_config_file(hass: HomeAssistant) -> HomeAssistantConfig
         config_schema = getattr(component, "CONFIG_SCHEMA", None)
         if config_schema is not None:
             try:
-                config = config_schema(config)
+                config = async_validate_cached(hass, config_schema, config, domain)
                 result[domain] = config[domain]
             except vol.Invalid as ex:
                 _comp_error(ex, domain, config)
@@ -145,7 +146,9 @@ async def async_check_ha_config_file(hass: HomeAssistant) -> HomeAssistantConfig
         for p_name, p_config in config_per_platform(config, domain):
             # Validate component specific platform schema
             try:
-                p_validated = component_platform_schema(p_config)
+                p_validated = async_validate_cached(
+                    hass, component_platform_schema, p_config
+                )
             except vol.Invalid as ex:
                 _comp_error(ex, domain, config)
                 continue
@@ -174,7 +177,9 @@ async def async_check_ha_config_file(hass: HomeAssistant) -> HomeAssistantConfig
             platform_schema = getattr(platform, "PLATFORM_SCHEMA", None)
             if platform_schema is not None:
                 try:
-                    p_validated = platform_schema(p_validated)
+                    p_validated = async_validate_cached(
+                        hass, platform_schema, p_validated
+                    )
                 except vol.Invalid as ex:
                     _comp_error(ex, f"{domain}.{p_name}", p_validated)
                     continue
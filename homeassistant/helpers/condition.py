@@ -1,7 +1,7 @@
 """Offer reusable conditions."""
 import asyncio
 from collections import deque
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import functools as ft
 import logging
 import sys
@@ -29,8 +29,6 @@ from homeassistant.const import (
     CONF_ZONE,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
-    SUN_EVENT_SUNRISE,
-    SUN_EVENT_SUNSET,
     WEEKDAYS,
 )
 from homeassistant.core import HomeAssistant, State, callback
@@ -170,11 +168,32 @@ def async_numeric_state(
     variables: TemplateVarsType = None,
 ) -> bool:
     """Test a numeric state condition."""
+    fvalue = _async_numeric_value(hass, entity, value_template, variables)
+
+    if fvalue is None:
+        return False
+
+    if below is not None and fvalue >= below:
+        return False
+
+    if above is not None and fvalue <= above:
+        return False
+
+    return True
+
+
+def _async_numeric_value(
+    hass: HomeAssistant,
+    entity: Union[None, str, State],
+    value_template: Optional[Template],
+    variables: TemplateVarsType,
+) -> Optional[float]:
+    """Return the numeric value of an entity, None if it has none."""
     if isinstance(entity, str):
         entity = hass.states.get(entity)
 
     if entity is None:
-        return False
+        return None
 
     if value_template is None:
         value = entity.state
@@ -185,28 +204,33 @@ def async_numeric_state(
             value = value_template.async_render(variables)
         except TemplateError as ex:
             _LOGGER.error("Template error: %s", ex)
-            return False
+            return None
 
     if value in (STATE_UNAVAILABLE, STATE_UNKNOWN):
-        return False
+        return None
 
     try:
-        fvalue = float(value)
+        return float(value)
     except ValueError:
         _LOGGER.warning(
             "Value cannot be processed as a number: %s (Offending entity: %s)",
             entity,
             value,
         )
-        return False
-
-    if below is not None and fvalue >= below:
-        return False
+        return None
 
-    if above is not None and fvalue <= above:
-        return False
 
-    return True
+def _numeric_range(
+    below: Optional[float], above: Optional[float]
+) -> Callable[[float], bool]:
+    """Return a check of a value against the given thresholds."""
+    if below is not None and above is not None:
+        return lambda value: above < value < below  # type: ignore
+    if below is not None:
+        return lambda value: value < below  # type: ignore
+    if above is not None:
+        return lambda value: value > above  # type: ignore
+    return lambda value: True
 
 
 def async_numeric_state_from_config(
@@ -216,9 +240,8 @@ def async_numeric_state_from_config(
     if config_validation:
         config = cv.NUMERIC_STATE_CONDITION_SCHEMA(config)
     entity_id = config.get(CONF_ENTITY_ID)
-    below = config.get(CONF_BELOW)
-    above = config.get(CONF_ABOVE)
     value_template = config.get(CONF_VALUE_TEMPLATE)
+    in_range = _numeric_range(config.get(CONF_BELOW), config.get(CONF_ABOVE))
 
     def if_numeric_state(
         hass: HomeAssistant, variables: TemplateVarsType = None
@@ -227,9 +250,8 @@ def async_numeric_state_from_config(
         if value_template is not None:
             value_template.hass = hass
 
-        return async_numeric_state(
-            hass, entity_id, below, above, value_template, variables
-        )
+        fvalue = _async_numeric_value(hass, entity_id, value_template, variables)
+        return fvalue is not None and in_range(fvalue)
 
     return if_numeric_state
 
@@ -284,51 +306,56 @@ def sun(
     after_offset: Optional[timedelta] = None,
 ) -> bool:
     """Test if current time matches sun requirements."""
-    utcnow = dt_util.utcnow()
-    today = dt_util.as_local(utcnow).date()
-    before_offset = before_offset or timedelta(0)
-    after_offset = after_offset or timedelta(0)
-
-    sunrise_today = get_astral_event_date(hass, SUN_EVENT_SUNRISE, today)
-    sunset_today = get_astral_event_date(hass, SUN_EVENT_SUNSET, today)
-
-    sunrise = sunrise_today
-    sunset = sunset_today
-    if today > dt_util.as_local(
-        cast(datetime, sunrise_today)
-    ).date() and SUN_EVENT_SUNRISE in (before, after):
-        tomorrow = dt_util.as_local(utcnow + timedelta(days=1)).date()
-        sunrise_tomorrow = get_astral_event_date(hass, SUN_EVENT_SUNRISE, tomorrow)
-        sunrise = sunrise_tomorrow
+    return _sun_checker(before, after, before_offset, after_offset)(hass)
 
-    if today > dt_util.as_local(
-        cast(datetime, sunset_today)
-    ).date() and SUN_EVENT_SUNSET in (before, after):
-        tomorrow = dt_util.as_local(utcnow + timedelta(days=1)).date()
-        sunset_tomorrow = get_astral_event_date(hass, SUN_EVENT_SUNSET, tomorrow)
-        sunset = sunset_tomorrow
 
-    if sunrise is None and SUN_EVENT_SUNRISE in (before, after):
-        # There is no sunrise today
-        return False
+def _sun_checker(
+    before: Optional[str],
+    after: Optional[str],
+    before_offset: Optional[timedelta],
+    after_offset: Optional[timedelta],
+) -> Callable[[HomeAssistant], bool]:
+    """Return a check for the current time against sun events."""
+    checks = []
+    if before is not None:
+        checks.append((before, before_offset or timedelta(0), True))
+    if after is not None:
+        checks.append((after, after_offset or timedelta(0), False))
 
-    if sunset is None and SUN_EVENT_SUNSET in (before, after):
-        # There is no sunset today
-        return False
+    def check(hass: HomeAssistant) -> bool:
+        """Test if current time matches sun requirements."""
+        utcnow = dt_util.utcnow()
+        today = dt_util.as_local(utcnow).date()
 
-    if before == SUN_EVENT_SUNRISE and utcnow > cast(datetime, sunrise) + before_offset:
-        return False
+        for event, offset, is_before in checks:
+            event_time = _sun_event(hass, event, utcnow, today)
 
-    if before == SUN_EVENT_SUNSET and utcnow > cast(datetime, sunset) + before_offset:
-        return False
+            if event_time is None:
+                # The event does not occur today
+                return False
 
-    if after == SUN_EVENT_SUNRISE and utcnow < cast(datetime, sunrise) + after_offset:
-        return False
+            if is_before and utcnow > event_time + offset:
+                return False
 
-    if after == SUN_EVENT_SUNSET and utcnow < cast(datetime, sunset) + after_offset:
-        return False
+            if not is_before and utcnow < event_time + offset:
+                return False
 
-    return True
+        return True
+
+    return check
+
+
+def _sun_event(
+    hass: HomeAssistant, event: str, utcnow: datetime, today: date
+) -> Optional[datetime]:
+    """Return today's sun event, or tomorrow's if it fell on yesterday."""
+    event_time = get_astral_event_date(hass, event, today)
+
+    if event_time is not None and today > dt_util.as_local(event_time).date():
+        tomorrow = dt_util.as_local(utcnow + timedelta(days=1)).date()
+        event_time = get_astral_event_date(hass, event, tomorrow)
+
+    return event_time
 
 
 def sun_from_config(
@@ -337,14 +364,16 @@ def sun_from_config(
     """Wrap action method with sun based condition."""
     if config_validation:
         config = cv.SUN_CONDITION_SCHEMA(config)
-    before = config.get("before")
-    after = config.get("after")
-    before_offset = config.get("before_offset")
-    after_offset = config.get("after_offset")
+    check = _sun_checker(
+        config.get("before"),
+        config.get("after"),
+        config.get("before_offset"),
+        config.get("after_offset"),
+    )
 
     def time_if(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Validate time based if-condition."""
-        return sun(hass, before, after, before_offset, after_offset)
+        return check(hass)
 
     return time_if
 
@@ -403,32 +432,39 @@ def time(
     for the opposite. "(23:59 <= now < 00:01)" would be the same as
     "not (00:01 <= now < 23:59)".
     """
-    now = dt_util.now()
-    now_time = now.time()
+    return _time_checker(before, after, weekday)()
+
 
+def _time_checker(
+    before: Optional[dt_util.dt.time],
+    after: Optional[dt_util.dt.time],
+    weekday: Union[None, str, Container[str]],
+) -> Callable[[], bool]:
+    """Return a check for the local time against a window and weekdays."""
     if after is None:
         after = dt_util.dt.time(0)
     if before is None:
         before = dt_util.dt.time(23, 59, 59, 999999)
 
-    if after < before:
-        if not after <= now_time < before:
-            return False
-    else:
-        if before <= now_time < after:
-            return False
+    crosses_midnight = not after < before
+    weekdays: Optional[Container[str]] = (
+        {weekday} if isinstance(weekday, str) else weekday
+    )
 
-    if weekday is not None:
-        now_weekday = WEEKDAYS[now.weekday()]
+    def check() -> bool:
+        """Test if local time condition matches."""
+        now = dt_util.now()
+        now_time = now.time()
 
-        if (
-            isinstance(weekday, str)
-            and weekday != now_weekday
-            or now_weekday not in weekday
-        ):
+        if crosses_midnight:
+            if before <= now_time < after:  # type: ignore
+                return False
+        elif not after <= now_time < before:  # type: ignore
             return False
 
-    return True
+        return weekdays is None or WEEKDAYS[now.weekday()] in weekdays
+
+    return check
 
 
 def time_from_config(
@@ -437,13 +473,13 @@ def time_from_config(
     """Wrap action method with time based condition."""
     if config_validation:
         config = cv.TIME_CONDITION_SCHEMA(config)
-    before = config.get(CONF_BEFORE)
-    after = config.get(CONF_AFTER)
-    weekday = config.get(CONF_WEEKDAY)
+    check = _time_checker(
+        config.get(CONF_BEFORE), config.get(CONF_AFTER), config.get(CONF_WEEKDAY)
+    )
 
     def time_if(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Validate time based if-condition."""
-        return time(before, after, weekday)
+        return check()
 
     return time_if
 
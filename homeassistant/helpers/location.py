@@ -1,11 +1,24 @@
 """Location helpers for Home Assistant."""
-
-from typing import Optional, Sequence
+import math
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
-from homeassistant.core import State
+from homeassistant.core import State, callback
 from homeassistant.util import location as loc_util
 
+# Size of a grid cell of the location index in degrees (about 11 km)
+GRID_CELL_SIZE = 0.1
+
+# Entries that cover more cells are not put in the grid but always checked
+MAX_GRID_CELLS = 64
+
+METERS_PER_DEGREE = 111320
+EARTH_MEAN_RADIUS = 6371008.8
+
+# Relative difference we allow between the spherical approximation and the
+# ellipsoidal distance, well above the real maximum of about 0.6%.
+APPROXIMATION_MARGIN = 0.01
+
 
 def has_location(state: State) -> bool:
     """Test if state contains a valid location.
@@ -20,6 +33,25 @@ def has_location(state: State) -> bool:
     )
 
 
+def approximate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Calculate the spherical distance in meters between two points.
+
+    This is a lot cheaper than the exact distance and within a fraction of a
+    percent of it.
+
+    Async friendly.
+    """
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    hav = (
+        math.sin((lat2_rad - lat1_rad) / 2) ** 2
+        + math.cos(lat1_rad)
+        * math.cos(lat2_rad)
+        * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_MEAN_RADIUS * math.asin(min(1.0, math.sqrt(hav)))
+
+
 def closest(
     latitude: float, longitude: float, states: Sequence[State]
 ) -> Optional[State]:
@@ -27,13 +59,32 @@ def closest(
 
     Async friendly.
     """
-    with_location = [state for state in states if has_location(state)]
+    with_location = [
+        (
+            approximate_distance(
+                latitude,
+                longitude,
+                state.attributes[ATTR_LATITUDE],
+                state.attributes[ATTR_LONGITUDE],
+            ),
+            state,
+        )
+        for state in states
+        if has_location(state)
+    ]
 
     if not with_location:
         return None
 
+    # Only calculate the exact distance for states that can be the closest
+    bound = min(dist for dist, _ in with_location) * (1 + 2 * APPROXIMATION_MARGIN)
+    candidates = [state for dist, state in with_location if dist <= bound + 1]
+
+    if len(candidates) == 1:
+        return candidates[0]
+
     return min(
-        with_location,
+        candidates,
         key=lambda state: loc_util.distance(
             state.attributes.get(ATTR_LATITUDE),
             state.attributes.get(ATTR_LONGITUDE),
@@ -41,3 +92,113 @@ def closest(
             longitude,
         ),
     )
+
+
+class LocationIndex:
+    """Grid index of circular areas, like zones.
+
+    Every area is added to the grid cells its bounding box covers. A lookup
+    only returns the areas in the cells covered by the bounding box of the
+    looked up point, so the exact distance only has to be calculated for a
+    few nearby areas.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._cells: Dict[Tuple[int, int], Set[str]] = {}
+        self._entries: Dict[str, Optional[List[Tuple[int, int]]]] = {}
+        # Areas that are too big for the grid
+        self._large: Set[str] = set()
+
+    def __len__(self) -> int:
+        """Return number of indexed areas."""
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """Return if an area is indexed."""
+        return key in self._entries
+
+    @callback
+    def async_set(
+        self, key: str, latitude: float, longitude: float, radius: float = 0
+    ) -> None:
+        """Add or update an area."""
+        self.async_remove(key)
+        cells = _grid_cells(latitude, longitude, radius)
+        self._entries[key] = cells
+
+        if cells is None:
+            self._large.add(key)
+            return
+
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(key)
+
+    @callback
+    def async_remove(self, key: str) -> None:
+        """Remove an area."""
+        if key not in self._entries:
+            return
+
+        cells = self._entries.pop(key)
+
+        if cells is None:
+            self._large.discard(key)
+            return
+
+        for cell in cells:
+            keys = self._cells[cell]
+            keys.discard(key)
+            if not keys:
+                del self._cells[cell]
+
+    @callback
+    def async_candidates(
+        self, latitude: float, longitude: float, radius: float = 0
+    ) -> Set[str]:
+        """Return areas that may overlap with the circle around a point."""
+        cells = _grid_cells(latitude, longitude, radius)
+
+        if cells is None:
+            return set(self._entries)
+
+        candidates = set(self._large)
+        for cell in cells:
+            candidates.update(self._cells.get(cell, ()))
+        return candidates
+
+
+def _grid_cells(
+    latitude: float, longitude: float, radius: float
+) -> Optional[List[Tuple[int, int]]]:
+    """Return the grid cells covered by the bounding box of a circle.
+
+    Returns None if the circle covers too many cells.
+    """
+    # Grow the box a bit so it always contains the exact circle
+    radius = radius * (1 + APPROXIMATION_MARGIN) + 1
+    delta_lat = radius / METERS_PER_DEGREE
+    max_lat = abs(latitude) + delta_lat
+
+    if max_lat >= 89:
+        return None
+
+    delta_lon = delta_lat / math.cos(math.radians(max_lat))
+
+    if longitude - delta_lon < -180 or longitude + delta_lon > 180:
+        return None
+
+    lat_cells = _cell_range(latitude - delta_lat, latitude + delta_lat)
+    lon_cells = _cell_range(longitude - delta_lon, longitude + delta_lon)
+
+    if len(lat_cells) * len(lon_cells) > MAX_GRID_CELLS:
+        return None
+
+    return [(lat, lon) for lat in lat_cells for lon in lon_cells]
+
+
+def _cell_range(low: float, high: float) -> range:
+    """Return range of grid cells between two coordinates."""
+    return range(
+        math.floor(low / GRID_CELL_SIZE), math.floor(high / GRID_CELL_SIZE) + 1
+    )
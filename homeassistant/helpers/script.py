@@ -4,7 +4,8 @@ from contextlib import suppress
 from datetime import datetime
 from itertools import islice
 import logging
-from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
 
 import voluptuous as vol
 
@@ -83,6 +84,68 @@ def _determine_action(action):
     return ACTION_CALL_SERVICE
 
 
+def _render_static(value: Any) -> Any:
+    """Render the static templates in a value, leaving the others in place."""
+    if isinstance(value, list):
+        return [_render_static(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _render_static(item) for key, item in value.items()}
+    if isinstance(value, template.Template) and value.is_static:
+        with suppress(exceptions.TemplateError):
+            return value.async_render()
+    return value
+
+
+def _has_template(value: Any) -> bool:
+    """Return if a value contains templates."""
+    if isinstance(value, list):
+        return any(_has_template(item) for item in value)
+    if isinstance(value, dict):
+        return any(_has_template(item) for item in value.values())
+    return isinstance(value, template.Template)
+
+
+def _compile_action(action: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the action with the templates that never change rendered.
+
+    Templates that fail to render are kept so the error is raised when
+    the step runs, like before.
+    """
+    action_type = _determine_action(action)
+
+    if action_type == ACTION_CALL_SERVICE:
+        data_key, template_key = (
+            service.CONF_SERVICE_DATA,
+            service.CONF_SERVICE_DATA_TEMPLATE,
+        )
+    elif action_type == ACTION_FIRE_EVENT:
+        data_key, template_key = CONF_EVENT_DATA, CONF_EVENT_DATA_TEMPLATE
+    else:
+        return action
+
+    compiled = dict(action)
+
+    service_template = compiled.get(service.CONF_SERVICE_TEMPLATE)
+    if action_type == ACTION_CALL_SERVICE and isinstance(
+        service_template, template.Template
+    ):
+        rendered = _render_static(service_template)
+        with suppress(vol.Invalid):
+            if isinstance(rendered, str):
+                compiled[CONF_SERVICE] = cv.service(rendered)
+                del compiled[service.CONF_SERVICE_TEMPLATE]
+
+    if template_key in compiled:
+        data_template = _render_static(compiled[template_key])
+        if _has_template(data_template):
+            compiled[template_key] = data_template
+        else:
+            compiled[data_key] = {**compiled.get(data_key, {}), **data_template}
+            del compiled[template_key]
+
+    return compiled
+
+
 def call_from_config(
     hass: HomeAssistant,
     config: ConfigType,
@@ -146,7 +209,7 @@ class Script:
             for action in self.sequence
         )
         self._async_listener: List[CALLBACK_TYPE] = []
-        self._config_cache: Dict[Set[Tuple], Callable[..., bool]] = {}
+        self._config_cache: Dict[int, Callable[..., bool]] = {}
         self._actions = {
             ACTION_DELAY: self._async_delay,
             ACTION_WAIT_TEMPLATE: self._async_wait_template,
@@ -156,6 +219,14 @@ class Script:
             ACTION_DEVICE_AUTOMATION: self._async_device_automation,
             ACTION_ACTIVATE_SCENE: self._async_activate_scene,
         }
+        # Each step is resolved to its handler and compiled action once
+        self._steps = [
+            (self._actions[_determine_action(action)], _compile_action(action))
+            for action in self.sequence
+        ]
+        # Number of runs and total seconds spent in each step, for profiling
+        self.step_runs: List[int] = [0] * len(self.sequence)
+        self.step_durations: List[float] = [0.0] * len(self.sequence)
         self._referenced_entities: Optional[Set[str]] = None
         self._referenced_devices: Optional[Set[str]] = None
 
@@ -242,9 +313,10 @@ class Script:
         # called again. In that case we just continue execution.
         self._async_remove_listener()
 
-        for cur, action in islice(enumerate(self.sequence), self._cur, None):
+        for cur, (handler, action) in islice(enumerate(self._steps), self._cur, None):
+            start = perf_counter()
             try:
-                await self._handle_action(action, variables, context)
+                await handler(action, variables, context)
             except _SuspendScript:
                 # Store next step to take and notify change listeners
                 self._cur = cur + 1
@@ -261,6 +333,9 @@ class Script:
                 self.last_action = None
                 # Pass exception on.
                 raise
+            finally:
+                self.step_runs[cur] += 1
+                self.step_durations[cur] += perf_counter() - start
 
         # Set script to not-running.
         self._cur = -1
@@ -326,10 +401,6 @@ class Script:
             error,
         )
 
-    async def _handle_action(self, action, variables, context):
-        """Handle an action."""
-        await self._actions[_determine_action(action)](action, variables, context)
-
     async def _async_delay(self, action, variables, context):
         """Handle delay."""
         # Call ourselves in the future to continue work
@@ -459,11 +530,11 @@ class Script:
 
     async def _async_check_condition(self, action, variables, context):
         """Test if condition is matching."""
-        config_cache_key = frozenset((k, str(v)) for k, v in action.items())
-        config = self._config_cache.get(config_cache_key)
+        # Steps are kept by the script, so their id identifies the condition
+        config = self._config_cache.get(id(action))
         if not config:
             config = await condition.async_from_config(self.hass, action, False)
-            self._config_cache[config_cache_key] = config
+            self._config_cache[id(action)] = config
 
         self.last_action = action.get(CONF_ALIAS, action[CONF_CONDITION])
         check = config(self.hass, variables)
@@ -1,9 +1,13 @@
 """Helpers for sun events."""
 import datetime
-from typing import TYPE_CHECKING, Optional, Union
-
-from homeassistant.const import SUN_EVENT_SUNRISE, SUN_EVENT_SUNSET
-from homeassistant.core import callback
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union
+
+from homeassistant.const import (
+    EVENT_CORE_CONFIG_UPDATE,
+    SUN_EVENT_SUNRISE,
+    SUN_EVENT_SUNSET,
+)
+from homeassistant.core import Event, callback
 from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util
 
@@ -14,6 +18,14 @@ if TYPE_CHECKING:
 
 DATA_LOCATION_CACHE = "astral_location_cache"
 
+# Days of events calculated at once, next event lookups walk forward in time
+EPHEMERIS_PRECOMPUTE_DAYS = 3
+# Enough for every event type over a few days before the cache is rebuilt
+EPHEMERIS_CACHE_SIZE = 256
+
+# Calculated events keyed by coordinates, solar depression, event and date
+_EPHEMERIS: Dict[Tuple, Optional[datetime.datetime]] = {}
+
 
 @callback
 @bind_hass
@@ -31,6 +43,14 @@ def get_astral_location(hass: HomeAssistantType) -> "astral.Location":
     if DATA_LOCATION_CACHE not in hass.data:
         hass.data[DATA_LOCATION_CACHE] = {}
 
+        @callback
+        def async_clear_locations(event: Event) -> None:
+            """Drop locations and their events when the core config changes."""
+            hass.data[DATA_LOCATION_CACHE].clear()
+            _EPHEMERIS.clear()
+
+        hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, async_clear_locations)
+
     if info not in hass.data[DATA_LOCATION_CACHE]:
         hass.data[DATA_LOCATION_CACHE][info] = Location(info)
 
@@ -58,30 +78,63 @@ def get_location_astral_event_next(
     offset: Optional[datetime.timedelta] = None,
 ) -> datetime.datetime:
     """Calculate the next specified solar event."""
-    from astral import AstralError
-
     if offset is None:
         offset = datetime.timedelta()
 
     if utc_point_in_time is None:
         utc_point_in_time = dt_util.utcnow()
 
+    local_date = dt_util.as_local(utc_point_in_time).date()
     mod = -1
     while True:
+        event_dt = get_location_astral_event_date(
+            location, event, local_date + datetime.timedelta(days=mod)
+        )
+        if event_dt is not None and event_dt + offset > utc_point_in_time:
+            return event_dt + offset
+        mod += 1
+
+
+@callback
+def get_location_astral_event_date(
+    location: "astral.Location", event: str, date: datetime.date
+) -> Optional[datetime.datetime]:
+    """Return the astral event of a location for a date.
+
+    Events are calculated a few days at a time and cached per location,
+    taking the solar depression used for dawn and dusk into account.
+    """
+    from astral import Astral, AstralError
+
+    if location.astral is None:
+        # Created on first use by astral, needed to read the depression
+        location.astral = Astral()
+    prefix = (
+        location.latitude,
+        location.longitude,
+        location.elevation,
+        location.solar_depression,
+        event,
+    )
+    key = prefix + (date,)
+    if key in _EPHEMERIS:
+        return _EPHEMERIS[key]
+
+    if len(_EPHEMERIS) >= EPHEMERIS_CACHE_SIZE:
+        _EPHEMERIS.clear()
+
+    for day in range(EPHEMERIS_PRECOMPUTE_DAYS):
+        day_date = date + datetime.timedelta(days=day)
+        if prefix + (day_date,) in _EPHEMERIS:
+            continue
         try:
-            next_dt: datetime.datetime = (
-                getattr(location, event)(
-                    dt_util.as_local(utc_point_in_time).date()
-                    + datetime.timedelta(days=mod),
-                    local=False,
-                )
-                + offset
-            )
-            if next_dt > utc_point_in_time:
-                return next_dt
+            event_dt = getattr(location, event)(day_date, local=False)
         except AstralError:
-            pass
-        mod += 1
+            # Event never occurs for specified date.
+            event_dt = None
+        _EPHEMERIS[prefix + (day_date,)] = event_dt
+
+    return _EPHEMERIS[key]
 
 
 @callback
@@ -92,8 +145,6 @@ def get_astral_event_date(
     date: Union[datetime.date, datetime.datetime, None] = None,
 ) -> Optional[datetime.datetime]:
     """Calculate the astral event time for the specified date."""
-    from astral import AstralError
-
     location = get_astral_location(hass)
 
     if date is None:
@@ -102,11 +153,7 @@ def get_astral_event_date(
     if isinstance(date, datetime.datetime):
         date = dt_util.as_local(date).date()
 
-    try:
-        return getattr(location, event)(date, local=False)  # type: ignore
-    except AstralError:
-        # Event never occurs for specified date.
-        return None
+    return get_location_astral_event_date(location, event, date)
 
 
 @callback
@@ -181,6 +181,11 @@ class Template:
             ret = self.hass.data[_ENVIRONMENT] = TemplateEnvironment(self.hass)
         return ret
 
+    @property
+    def is_static(self) -> bool:
+        """Return if the template renders the same regardless of state."""
+        return _RE_JINJA_DELIMITERS.search(self.template) is None
+
     def ensure_valid(self):
         """Return if template is valid."""
         if self._compiled_code is not None:
@@ -351,7 +356,7 @@ class AllStates:
     def __len__(self):
         """Return number of states."""
         self._collect_all()
-        return len(self._hass.states.async_entity_ids())
+        return self._hass.states.async_entity_ids_count()
 
     def __call__(self, entity_id):
         """Return the states."""
@@ -391,8 +396,7 @@ class DomainStates:
             sorted(
                 (
                     _wrap_state(self._hass, state)
-                    for state in self._hass.states.async_all()
-                    if state.domain == self._domain
+                    for state in self._hass.states.async_all(self._domain)
                 ),
                 key=lambda state: state.entity_id,
             )
@@ -401,7 +405,7 @@ class DomainStates:
     def __len__(self):
         """Return number of states."""
         self._collect_domain()
-        return len(self._hass.states.async_entity_ids(self._domain))
+        return self._hass.states.async_entity_ids_count(self._domain)
 
     def __repr__(self):
         """Representation of Domain States."""
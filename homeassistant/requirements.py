@@ -1,11 +1,14 @@
 """Module to handle installing requirements."""
 import asyncio
+import hashlib
 import logging
 import os
 from pathlib import Path
+import site
+import sys
 from typing import Any, Dict, Iterable, List, Optional, Set
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import Integration, async_get_integration
 import homeassistant.util.package as pkg_util
@@ -14,6 +17,9 @@ DATA_PIP_LOCK = "pip_lock"
 DATA_PKG_CACHE = "pkg_cache"
 CONSTRAINT_FILE = "package_constraints.txt"
 PROGRESS_FILE = ".pip_progress"
+STORAGE_KEY = "core.requirements"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
 _LOGGER = logging.getLogger(__name__)
 DISCOVERY_INTEGRATIONS: Dict[str, Iterable[str]] = {
     "ssdp": ("ssdp",),
@@ -80,6 +86,74 @@ async def async_get_integration_with_requirements(
     return integration
 
 
+def _package_dirs(config_dir: Optional[str]) -> List[str]:
+    """Return the directories distributions are installed into."""
+    dirs = list(getattr(site, "getsitepackages", list)())
+    if site.ENABLE_USER_SITE:
+        dirs.append(site.getusersitepackages())
+    if config_dir is not None:
+        deps_dir = os.path.join(config_dir, "deps") + os.sep
+        dirs.extend(path for path in sys.path if path.startswith(deps_dir))
+    return dirs
+
+
+def _site_fingerprint(config_dir: Optional[str]) -> Optional[str]:
+    """Return a fingerprint of the directories packages are installed into.
+
+    Installing, upgrading or removing a distribution changes the modification
+    time of its site-packages directory. Other directories on the path, like
+    the config dir, change for unrelated reasons and are left out. Returns
+    None if no package directory was found, changes cannot be detected then.
+    """
+    entries = []
+    for path in _package_dirs(config_dir):
+        try:
+            entries.append(f"{path}:{os.stat(path).st_mtime_ns}")
+        except OSError:
+            continue
+    if not entries:
+        return None
+    return hashlib.sha1("\n".join(entries).encode()).hexdigest()
+
+
+class RequirementsCache:
+    """Persist the requirements known to be satisfied by the installed packages."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the requirements cache."""
+        self.satisfied: Set[str] = set()
+        self._fingerprint: Optional[str] = None
+        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+
+    async def async_load(self, hass: HomeAssistant) -> None:
+        """Load the satisfied requirements if the packages did not change."""
+        self._fingerprint = await hass.async_add_executor_job(
+            _site_fingerprint, hass.config.config_dir
+        )
+        if self._fingerprint is None:
+            # Requirements are only remembered until the next restart
+            return
+
+        data = await self._store.async_load()
+        if data is not None and data["fingerprint"] == self._fingerprint:
+            self.satisfied = set(data["requirements"])
+
+    @callback
+    def async_add(self, req: str) -> None:
+        """Mark a requirement as satisfied."""
+        self.satisfied.add(req)
+        if self._fingerprint is not None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the data to store."""
+        return {
+            "fingerprint": self._fingerprint,
+            "requirements": sorted(self.satisfied),
+        }
+
+
 async def async_process_requirements(
     hass: HomeAssistant, name: str, requirements: List[str]
 ) -> None:
@@ -95,8 +169,17 @@ async def async_process_requirements(
     kwargs = pip_kwargs(hass.config.config_dir)
 
     async with pip_lock:
+        cache = hass.data.get(DATA_PKG_CACHE)
+        if cache is None:
+            cache = hass.data[DATA_PKG_CACHE] = RequirementsCache(hass)
+            await cache.async_load(hass)
+
         for req in requirements:
+            if req in cache.satisfied:
+                continue
+
             if pkg_util.is_installed(req):
+                cache.async_add(req)
                 continue
 
             ret = await hass.async_add_executor_job(_install, hass, req, kwargs)
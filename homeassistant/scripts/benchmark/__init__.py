@@ -2,7 +2,7 @@
 import argparse
 import asyncio
 from contextlib import suppress
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 from timeit import default_timer as timer
 from typing import Callable, Dict
@@ -185,3 +185,108 @@ def _logbook_filtering(hass, last_changed, last_updated):
     list(logbook.humanify(None, yield_events(event)))
 
     return timer() - start
+
+
+@benchmark
+async def filter_chain_streaming(hass):
+    """Run history through a filter chain one state at a time."""
+    return _filter_chain(False)
+
+
+@benchmark
+async def filter_chain_batch(hass):
+    """Run history through a filter chain as one batch."""
+    return _filter_chain(True)
+
+
+def _filter_chain(batch):
+    from homeassistant.components.filter import sensor as filter_sensor
+
+    filters = [
+        filter_sensor.RangeFilter(entity=None, lower_bound=0, upper_bound=100),
+        filter_sensor.OutlierFilter(
+            window_size=50, precision=2, entity=None, radius=4.0
+        ),
+        filter_sensor.LowPassFilter(
+            window_size=1, precision=2, entity=None, time_constant=10
+        ),
+    ]
+
+    timestamp = dt_util.utcnow()
+    states = []
+    for idx in range(10 ** 5):
+        states.append(
+            core.State("sensor.test", (idx * 7919) % 1000 / 10, last_updated=timestamp)
+        )
+        timestamp += timedelta(seconds=1)
+
+    start = timer()
+
+    if batch:
+        filter_states = [filter_sensor.FilterState(state) for state in states]
+        for filt in filters:
+            filter_states = [
+                state
+                for state in filt.filter_states(filter_states)
+                if state is not None
+            ]
+    else:
+        for state in states:
+            for filt in filters:
+                state = filt.filter_state(state)
+                if filt.skip_processing:
+                    break
+
+    return timer() - start
+
+
+@benchmark
+async def condition_evaluation(hass):
+    """Evaluate common condition types."""
+    from homeassistant.helpers import condition
+
+    hass.states.async_set("sensor.power", "150")
+    hass.states.async_set("binary_sensor.motion", "on")
+
+    checks = [
+        await condition.async_from_config(hass, config)
+        for config in (
+            {"condition": "state", "entity_id": "binary_sensor.motion", "state": "on"},
+            {
+                "condition": "numeric_state",
+                "entity_id": "sensor.power",
+                "above": 100,
+                "below": 200,
+            },
+            {"condition": "time", "after": "06:00:00", "before": "23:00:00"},
+            {"condition": "sun", "after": "sunrise", "before": "sunset"},
+            {
+                "condition": "template",
+                "value_template": "{{ states('sensor.power') | float > 100 }}",
+            },
+        )
+    ]
+
+    start = timer()
+
+    for _ in range(10 ** 4):
+        for check in checks:
+            check(hass)
+
+    return timer() - start
+
+
+@benchmark
+async def parse_datetime(hass):
+    """Parse ISO 8601 timestamps like those in stored states."""
+    timestamp = dt_util.utcnow()
+    timestamps = []
+    for idx in range(10 ** 5):
+        timestamps.append((timestamp + timedelta(seconds=idx)).isoformat())
+
+    start = timer()
+
+    for value in timestamps:
+        dt_util.parse_datetime(value)
+
+    return timer() - start
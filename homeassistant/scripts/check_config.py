@@ -188,6 +188,9 @@ def check(config_dir, secrets=False):
         mock_function = locals()["mock_" + key.replace("*", "")]
         PATCHES[key] = patch(val[0], side_effect=mock_function)
 
+    # Parse every file again so all loaded files and secrets are reported
+    yaml_loader.clear_parse_cache()
+
     # Start all patches
     for pat in PATCHES.values():
         pat.start()
@@ -24,6 +24,9 @@ DATETIME_RE = re.compile(
     r"(?P<tzinfo>Z|[+-]\d{2}(?::?\d{2})?)?$"
 )
 
+# Shared fixed offset time zones for parsed timestamps
+_FIXED_OFFSET_ZONES: Dict[dt.timedelta, dt.timezone] = {}
+
 
 def set_default_time_zone(time_zone: dt.tzinfo) -> None:
     """Set a default time zone to be used when none is specified.
@@ -122,6 +125,10 @@ def parse_datetime(dt_str: str) -> Optional[dt.datetime]:
     Raises ValueError if the input is well formatted but not a valid datetime.
     Returns None if the input isn't well formatted.
     """
+    parsed = _parse_iso_datetime(dt_str)
+    if parsed is not None:
+        return parsed
+
     match = DATETIME_RE.match(dt_str)
     if not match:
         return None
@@ -139,12 +146,58 @@ def parse_datetime(dt_str: str) -> Optional[dt.datetime]:
         offset = dt.timedelta(hours=offset_hours, minutes=offset_mins)
         if tzinfo_str[0] == "-":
             offset = -offset
-        tzinfo = dt.timezone(offset)
+        tzinfo = _fixed_offset_zone(offset)
     kws = {k: int(v) for k, v in kws.items() if v is not None}
     kws["tzinfo"] = tzinfo
     return dt.datetime(**kws)
 
 
+def _parse_iso_datetime(dt_str: str) -> Optional[dt.datetime]:
+    """Parse a canonical ISO 8601 string like those made by isoformat.
+
+    Returns None for anything else, those are left to the regex.
+    """
+    body = dt_str
+    is_utc = body[-1:] == "Z"
+    if is_utc:
+        body = body[:-1]
+    elif len(body) >= 22 and body[-6] in "+-" and body[-3] == ":":
+        body = body[:-6]
+
+    # fromisoformat is more lenient than the regex, only pass it the shapes
+    # YYYY-MM-DDTHH:MM[:SS[.fff[fff]]] the regex would accept as well
+    if (
+        len(body) not in (16, 19, 23, 26)
+        or body[4] != "-"
+        or body[7] != "-"
+        or body[10] not in "T "
+        or body[13] != ":"
+        or (len(body) > 16 and body[16] != ":")
+        or (len(body) > 19 and body[19] != ".")
+    ):
+        return None
+
+    try:
+        parsed = dt.datetime.fromisoformat(dt_str[:-1] if is_utc else dt_str)
+    except ValueError:
+        return None
+
+    if is_utc:
+        return parsed.replace(tzinfo=UTC)
+    offset = parsed.utcoffset()
+    if offset is None:
+        return parsed
+    return parsed.replace(tzinfo=_fixed_offset_zone(offset))
+
+
+def _fixed_offset_zone(offset: dt.timedelta) -> dt.timezone:
+    """Return a shared time zone with a fixed offset from UTC."""
+    zone = _FIXED_OFFSET_ZONES.get(offset)
+    if zone is None:
+        zone = _FIXED_OFFSET_ZONES[offset] = dt.timezone(offset)
+    return zone
+
+
 def parse_date(dt_str: str) -> Optional[dt.date]:
     """Convert a date string to a date object."""
     try:
@@ -1,10 +1,12 @@
 """Custom loader."""
 from collections import OrderedDict
+import copy
 import fnmatch
 import logging
 import os
 import sys
-from typing import Dict, Iterator, List, TypeVar, Union, overload
+import threading
+from typing import IO, Dict, Iterator, List, Optional, Tuple, TypeVar, Union, overload
 
 import yaml
 
@@ -41,6 +43,80 @@ def clear_secret_cache() -> None:
     __SECRET_CACHE.clear()
 
 
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """Return the modification time and size of a path, None if missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _handle_signature(handle: IO) -> Optional[Tuple[int, int]]:
+    """Return the modification time and size of an open file, if it has one."""
+    try:
+        stat = os.fstat(handle.fileno())
+    except (AttributeError, OSError, TypeError, ValueError):
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class _Dependencies:
+    """Files, directories and environment variables a YAML tree was built from."""
+
+    __slots__ = ("files", "env", "cacheable")
+
+    def __init__(self) -> None:
+        """Initialize an empty set of dependencies."""
+        self.files: Dict[str, Optional[Tuple[int, int]]] = {}
+        self.env: Dict[str, Optional[str]] = {}
+        self.cacheable = True
+
+    def update(self, other: "_Dependencies") -> None:
+        """Merge the dependencies of an included tree."""
+        self.files.update(other.files)
+        self.env.update(other.env)
+        self.cacheable = self.cacheable and other.cacheable
+
+    def is_current(self) -> bool:
+        """Return if none of the dependencies changed since parsing."""
+        return all(
+            _file_signature(path) == signature for path, signature in self.files.items()
+        ) and all(os.getenv(name) == value for name, value in self.env.items())
+
+
+_PARSE_CACHE: Dict[str, Tuple[_Dependencies, JSON_TYPE]] = {}
+_PARSE_STATE = threading.local()
+
+
+def clear_parse_cache() -> None:
+    """Clear the cache of parsed YAML files.
+
+    Async friendly.
+    """
+    _PARSE_CACHE.clear()
+
+
+def _current_dependencies() -> Optional[_Dependencies]:
+    """Return the dependencies of the file being parsed in this thread."""
+    stack: List[_Dependencies] = getattr(_PARSE_STATE, "stack", [])
+    return stack[-1] if stack else None
+
+
+def _track_path(path: str) -> None:
+    """Record that the file being parsed depends on a file or directory."""
+    dependencies = _current_dependencies()
+    if dependencies is not None:
+        dependencies.files[path] = _file_signature(path)
+
+
+def _track_uncacheable() -> None:
+    """Record that the file being parsed can not be served from the cache."""
+    dependencies = _current_dependencies()
+    if dependencies is not None:
+        dependencies.cacheable = False
+
+
 # pylint: disable=too-many-ancestors
 class SafeLineLoader(yaml.SafeLoader):
     """Loader class that keeps track of line numbers."""
@@ -53,13 +129,63 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
+if hasattr(yaml, "CSafeLoader"):
+
+    class CSafeLineLoader(yaml.CSafeLoader):  # type: ignore
+        """LibYAML loader that keeps track of file names.
+
+        Line numbers are read from the node start marks, which LibYAML fills in.
+        """
+
+        def __init__(self, stream: IO) -> None:
+            """Initialize the loader and expose the stream like SafeLineLoader."""
+            super().__init__(stream)
+            self.name = getattr(stream, "name", "<file>")
+            self.stream = stream
+
+    _LOADER = CSafeLineLoader
+else:
+    _LOADER = SafeLineLoader
+
+
 def load_yaml(fname: str) -> JSON_TYPE:
-    """Load a YAML file."""
+    """Load a YAML file.
+
+    Parsed trees are cached until one of the files, directories or
+    environment variables they were built from changes.
+    """
+    cached = _PARSE_CACHE.get(fname)
+    if cached is not None and cached[0].is_current():
+        dependencies = cached[0]
+        result = copy.deepcopy(cached[1])
+    else:
+        dependencies = _Dependencies()
+        stack = _PARSE_STATE.__dict__.setdefault("stack", [])
+        stack.append(dependencies)
+        try:
+            result = _parse_yaml(fname, dependencies)
+        finally:
+            stack.pop()
+        if dependencies.cacheable:
+            _PARSE_CACHE[fname] = (dependencies, copy.deepcopy(result))
+
+    parent = _current_dependencies()
+    if parent is not None:
+        parent.update(dependencies)
+    return result
+
+
+def _parse_yaml(fname: str, dependencies: _Dependencies) -> JSON_TYPE:
+    """Parse a YAML file and record its signature."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
+            signature = _handle_signature(conf_file)
+            dependencies.files[fname] = signature
+            if signature is None:
+                dependencies.cacheable = False
             # If configuration file is empty YAML returns None
             # We convert that to an empty dict
-            return yaml.load(conf_file, Loader=SafeLineLoader) or OrderedDict()
+            return yaml.load(conf_file, Loader=_LOADER) or OrderedDict()
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc)
@@ -127,6 +253,7 @@ def _is_file_valid(name: str) -> bool:
 def _find_files(directory: str, pattern: str) -> Iterator[str]:
     """Recursively load files in a directory."""
     for root, dirs, files in os.walk(directory, topdown=True):
+        _track_path(root)
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
         for basename in sorted(files):
             if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern):
@@ -231,6 +358,9 @@ def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
 def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    dependencies = _current_dependencies()
+    if dependencies is not None:
+        dependencies.env[args[0]] = os.getenv(args[0])
 
     # Check for a default value
     if len(args) > 1:
@@ -244,6 +374,7 @@ def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
 def _load_secret_yaml(secret_path: str) -> JSON_TYPE:
     """Load the secrets yaml from path."""
     secret_path = os.path.join(secret_path, SECRET_YAML)
+    _track_path(secret_path)
     if secret_path in __SECRET_CACHE:
         return __SECRET_CACHE[secret_path]
 
@@ -289,6 +420,9 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
         if not os.path.exists(secret_path) or len(secret_path) < 5:
             break  # Somehow we got past the .homeassistant config folder
 
+    # Keyring and credstash secrets can change without any file changing
+    _track_uncacheable()
+
     if keyring:
         # do some keyring stuff
         pwd = keyring.get_password(_SECRET_NAMESPACE, node.value)
@@ -329,3 +463,5 @@ yaml.SafeLoader.add_constructor("!include_dir_named", _include_dir_named_yaml)
 yaml.SafeLoader.add_constructor(
     "!include_dir_merge_named", _include_dir_merge_named_yaml
 )
+# Share the registry so constructors added to SafeLoader later on apply to both
+_LOADER.yaml_constructors = yaml.SafeLoader.yaml_constructors
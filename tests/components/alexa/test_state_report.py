@@ -1,8 +1,23 @@
 """Test report state."""
+from datetime import timedelta
+from unittest.mock import patch
+
 from homeassistant.components.alexa import state_report
+import homeassistant.util.dt as dt_util
 
 from . import DEFAULT_CONFIG, TEST_URL
 
+from tests.common import async_fire_time_changed, mock_coro
+
+
+async def _async_fire_report_window(hass):
+    """Fire time changed to send the collected ChangeReports."""
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=state_report.CHANGE_REPORT_WINDOW)
+    )
+    await hass.async_block_till_done()
+
 
 async def test_report_state(hass, aioclient_mock):
     """Test proactive state reports."""
@@ -23,7 +38,7 @@ async def test_report_state(hass, aioclient_mock):
     )
 
     # To trigger event listener
-    await hass.async_block_till_done()
+    await _async_fire_report_window(hass)
 
     assert len(aioclient_mock.mock_calls) == 1
     call = aioclient_mock.mock_calls
@@ -38,6 +53,94 @@ async def test_report_state(hass, aioclient_mock):
     assert call_json["event"]["endpoint"]["endpointId"] == "binary_sensor#test_contact"
 
 
+async def test_report_state_coalesced(hass, aioclient_mock):
+    """Test state changes within the report window are sent once."""
+    aioclient_mock.post(TEST_URL, text="", status=202)
+    now = dt_util.utcnow()
+
+    hass.states.async_set(
+        "binary_sensor.test_contact",
+        "on",
+        {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+    )
+
+    await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+
+    with patch("homeassistant.util.dt.utcnow", return_value=now):
+        for state in ("off", "on", "off"):
+            hass.states.async_set(
+                "binary_sensor.test_contact",
+                state,
+                {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+            )
+
+        await _async_fire_report_window(hass)
+
+    assert len(aioclient_mock.mock_calls) == 1
+    call_json = aioclient_mock.mock_calls[0][2]
+    assert (
+        call_json["event"]["payload"]["change"]["properties"][0]["value"]
+        == "NOT_DETECTED"
+    )
+
+    # Unchanged properties are not reported again, even with a later sample time
+    later = now + timedelta(seconds=state_report.CHANGE_REPORT_WINDOW + 5)
+    with patch("homeassistant.util.dt.utcnow", return_value=later):
+        hass.states.async_set(
+            "binary_sensor.test_contact",
+            "off",
+            {"friendly_name": "Test Contact Sensor", "device_class": "door", "a": 1},
+        )
+        await _async_fire_report_window(hass)
+
+    assert len(aioclient_mock.mock_calls) == 1
+
+    # Changed properties are reported
+    later += timedelta(seconds=state_report.CHANGE_REPORT_WINDOW + 5)
+    with patch("homeassistant.util.dt.utcnow", return_value=later):
+        hass.states.async_set(
+            "binary_sensor.test_contact",
+            "on",
+            {"friendly_name": "Test Contact Sensor", "device_class": "door", "a": 1},
+        )
+        await _async_fire_report_window(hass)
+
+    assert len(aioclient_mock.mock_calls) == 2
+    call_json = aioclient_mock.mock_calls[1][2]
+    assert (
+        call_json["event"]["payload"]["change"]["properties"][0]["value"] == "DETECTED"
+    )
+
+
+async def test_report_state_throttled(hass, aioclient_mock):
+    """Test ChangeReports are retried with a backoff when throttled."""
+    aioclient_mock.post(
+        TEST_URL,
+        status=429,
+        json={"payload": {"code": "THROTTLED", "description": "Slow down"}},
+    )
+
+    hass.states.async_set(
+        "binary_sensor.test_contact",
+        "on",
+        {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+    )
+    alexa_entity = state_report.ENTITY_ADAPTERS["binary_sensor"](
+        hass, DEFAULT_CONFIG, hass.states.get("binary_sensor.test_contact")
+    )
+
+    with patch(
+        "homeassistant.components.alexa.state_report.asyncio.sleep",
+        side_effect=mock_coro,
+    ) as mock_sleep:
+        await state_report.async_send_changereport_message(
+            hass, DEFAULT_CONFIG, alexa_entity
+        )
+
+    assert len(aioclient_mock.mock_calls) == state_report.MAX_THROTTLE_RETRIES + 1
+    assert [call[1][0] for call in mock_sleep.mock_calls] == [1, 2, 4]
+
+
 async def test_report_state_instance(hass, aioclient_mock):
     """Test proactive state reports with instance."""
     aioclient_mock.post(TEST_URL, text="", status=202)
@@ -69,7 +172,7 @@ async def test_report_state_instance(hass, aioclient_mock):
     )
 
     # To trigger event listener
-    await hass.async_block_till_done()
+    await _async_fire_report_window(hass)
 
     assert len(aioclient_mock.mock_calls) == 1
     call = aioclient_mock.mock_calls
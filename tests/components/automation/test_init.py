@@ -561,6 +561,61 @@ async def test_reload_config_when_invalid_config(hass, calls):
     assert len(calls) == 1
 
 
+async def test_reload_config_keeps_unchanged_automations(hass, calls):
+    """Test reload only rebuilds the automations that changed."""
+    hello = {
+        "id": "hello",
+        "alias": "hello",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"service": "test.automation"},
+    }
+    bye = {
+        "id": "bye",
+        "alias": "bye",
+        "trigger": {"platform": "event", "event_type": "test_event2"},
+        "action": {"service": "test.automation"},
+    }
+    assert await async_setup_component(
+        hass, automation.DOMAIN, {automation.DOMAIN: [hello, bye]}
+    )
+    component = hass.data[automation.DOMAIN]
+    hello_entity = component.get_entity("automation.hello")
+    bye_entity = component.get_entity("automation.bye")
+
+    changed_bye = dict(bye, trigger={"platform": "event", "event_type": "test_event3"})
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={automation.DOMAIN: [hello, changed_bye]},
+    ):
+        await common.async_reload(hass)
+        await hass.async_block_till_done()
+
+    assert component.get_entity("automation.hello") is hello_entity
+    assert component.get_entity("automation.bye") is not bye_entity
+    listeners = hass.bus.async_listeners()
+    assert listeners.get("test_event") == 1
+    assert listeners.get("test_event2") is None
+    assert listeners.get("test_event3") == 1
+
+    hass.bus.async_fire("test_event")
+    hass.bus.async_fire("test_event3")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={automation.DOMAIN: [changed_bye]},
+    ):
+        await common.async_reload(hass)
+        await hass.async_block_till_done()
+
+    assert hass.states.get("automation.hello") is None
+    assert hass.states.get("automation.bye") is not None
+    assert hass.bus.async_listeners().get("test_event") is None
+
+
 async def test_reload_config_handles_load_fails(hass, calls):
     """Test the reload config service."""
     assert await async_setup_component(
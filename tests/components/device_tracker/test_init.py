@@ -126,6 +126,128 @@ async def test_reading_yaml_config(hass, yaml_devices):
     assert device.icon == config.icon
 
 
+async def test_known_devices_storage_migration(hass, hass_storage, yaml_devices):
+    """Test known devices are migrated once from YAML into storage."""
+    device = legacy.Device(
+        hass, timedelta(seconds=180), True, "test", "AB:CD:EF:GH:IJ", "Test name"
+    )
+    await hass.async_add_executor_job(
+        legacy.update_config, yaml_devices, "test", device
+    )
+    config = {device_tracker.DOMAIN: [{const.CONF_KNOWN_DEVICES_STORAGE: True}]}
+
+    tracker = await legacy.get_tracker(hass, config)
+    assert list(tracker.devices) == ["test"]
+    assert tracker.mac_to_dev["AB:CD:EF:GH:IJ"].name == "Test name"
+    stored = hass_storage[legacy.STORAGE_KEY]["data"]["devices"]
+    assert stored["test"]["mac"] == "AB:CD:EF:GH:IJ"
+
+    # Storage wins over YAML after the migration.
+    os.remove(yaml_devices)
+    stored["other"] = {"name": "Other", "mac": "12:34", "track": True}
+    tracker = await legacy.get_tracker(hass, config)
+    assert sorted(tracker.devices) == ["other", "test"]
+    assert tracker.mac_to_dev["12:34"].track
+
+
+async def test_known_devices_storage_migration_retried(
+    hass, hass_storage, yaml_devices
+):
+    """Test a YAML file that fails to load is migrated once it is fixed."""
+    with open(yaml_devices, "w") as fil:
+        fil.write("test:\n  name: [unclosed\n")
+    config = {device_tracker.DOMAIN: [{const.CONF_KNOWN_DEVICES_STORAGE: True}]}
+
+    tracker = await legacy.get_tracker(hass, config)
+    assert tracker.devices == {}
+    await tracker.async_see(mac="AA:BB")
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=legacy.SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    assert legacy.STORAGE_KEY not in hass_storage
+
+    # The next start migrates the fixed file
+    os.remove(yaml_devices)
+    device = legacy.Device(
+        hass, timedelta(seconds=180), True, "test", "AB:CD:EF:GH:IJ", "Test name"
+    )
+    await hass.async_add_executor_job(
+        legacy.update_config, yaml_devices, "test", device
+    )
+
+    tracker = await legacy.get_tracker(hass, config)
+    assert list(tracker.devices) == ["test"]
+    stored = hass_storage[legacy.STORAGE_KEY]["data"]["devices"]
+    assert stored["test"]["mac"] == "AB:CD:EF:GH:IJ"
+
+
+async def test_known_devices_storage_yaml_changed(
+    hass, hass_storage, yaml_devices, caplog
+):
+    """Test a warning is logged once when YAML changes after the migration."""
+    device = legacy.Device(
+        hass, timedelta(seconds=180), True, "test", "AB:CD:EF:GH:IJ", "Test name"
+    )
+    await hass.async_add_executor_job(
+        legacy.update_config, yaml_devices, "test", device
+    )
+    config = {device_tracker.DOMAIN: [{const.CONF_KNOWN_DEVICES_STORAGE: True}]}
+
+    await legacy.get_tracker(hass, config)
+    await legacy.get_tracker(hass, config)
+    assert "changes are ignored" not in caplog.text
+
+    # Edit the YAML file after the migration
+    other = legacy.Device(
+        hass, timedelta(seconds=180), True, "other", "12:34", "Other name"
+    )
+    await hass.async_add_executor_job(
+        legacy.update_config, yaml_devices, "other", other
+    )
+    mtime = os.path.getmtime(yaml_devices) + 10
+    os.utime(yaml_devices, (mtime, mtime))
+
+    tracker = await legacy.get_tracker(hass, config)
+    assert list(tracker.devices) == ["test"]
+    assert caplog.text.count("changes are ignored") == 1
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=legacy.SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    assert hass_storage[legacy.STORAGE_KEY]["data"]["yaml_mtime"] == mtime
+
+    await legacy.get_tracker(hass, config)
+    assert caplog.text.count("changes are ignored") == 1
+
+
+async def test_known_devices_storage_batched_save(hass, hass_storage, yaml_devices):
+    """Test new devices are saved to storage with a delay."""
+    config = {device_tracker.DOMAIN: [{const.CONF_KNOWN_DEVICES_STORAGE: True}]}
+    tracker = await legacy.get_tracker(hass, config)
+
+    with patch(
+        "homeassistant.components.device_tracker.legacy.update_config"
+    ) as mock_update:
+        await tracker.async_see(mac="AA:BB")
+        await tracker.async_see(dev_id="phone", icon="mdi:phone")
+        await hass.async_block_till_done()
+
+    assert not mock_update.called
+    assert hass_storage[legacy.STORAGE_KEY]["data"]["devices"] == {}
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=legacy.SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    stored = hass_storage[legacy.STORAGE_KEY]["data"]["devices"]
+    assert stored["aa_bb"]["mac"] == "AA:BB"
+    assert stored["phone"]["icon"] == "mdi:phone"
+    assert not os.path.isfile(yaml_devices)
+
+
 @patch("homeassistant.components.device_tracker.const.LOGGER.warning")
 async def test_duplicate_mac_dev_id(mock_warning, hass):
     """Test adding duplicate MACs or device IDs to DeviceTracker."""
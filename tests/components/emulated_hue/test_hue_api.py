@@ -231,6 +231,46 @@ async def test_discover_lights(hue_client):
     assert "00:57:77:a1:6a:8e:ef:b3-6c" not in devices  # climate.ecobee
 
 
+async def test_discover_lights_cached(hass_hue, hue_client):
+    """Test the list of lights is cached and supports conditional requests."""
+    result = await hue_client.get("/api/username/lights")
+    etag = result.headers["ETag"]
+    result_json = await result.json()
+    assert result_json["light.ceiling_lights"]["state"][HUE_API_STATE_ON] is True
+
+    result = await hue_client.get(
+        "/api/username/lights", headers={"If-None-Match": etag}
+    )
+    assert result.status == 304
+
+    # A state change of a non exposed entity keeps the cached table
+    hass_hue.states.async_set("sensor.not_exposed", "1")
+    await hass_hue.async_block_till_done()
+
+    result = await hue_client.get(
+        "/api/username/lights", headers={"If-None-Match": etag}
+    )
+    assert result.status == 304
+
+    hass_hue.states.async_set("light.ceiling_lights", STATE_OFF)
+    await hass_hue.async_block_till_done()
+
+    result = await hue_client.get(
+        "/api/username/lights", headers={"If-None-Match": etag}
+    )
+    assert result.status == 200
+    assert result.headers["ETag"] != etag
+    result_json = await result.json()
+    assert result_json["light.ceiling_lights"]["state"][HUE_API_STATE_ON] is False
+
+    hass_hue.states.async_remove("light.ceiling_lights")
+    await hass_hue.async_block_till_done()
+
+    result = await hue_client.get("/api/username/lights")
+    result_json = await result.json()
+    assert "light.ceiling_lights" not in result_json
+
+
 async def test_light_without_brightness_supported(hass_hue, hue_client):
     """Test that light without brightness is supported."""
     light_without_brightness_json = await perform_get_light_state(
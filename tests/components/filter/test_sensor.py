@@ -1,9 +1,11 @@
 """The test for the data filter sensor platform."""
 from datetime import timedelta
+import random
 import unittest
 from unittest.mock import patch
 
 from homeassistant.components.filter.sensor import (
+    FilterState,
     LowPassFilter,
     OutlierFilter,
     RangeFilter,
@@ -286,3 +288,60 @@ class TestFilterSensor(unittest.TestCase):
         for state in self.values:
             filtered = filt.filter_state(state)
         assert 21.5 == filtered.state
+
+    def test_batch_matches_streaming(self):
+        """Test filtering a batch gives the same result as one by one."""
+
+        def make_filters():
+            return [
+                RangeFilter(entity=None, lower_bound=10, upper_bound=90),
+                OutlierFilter(window_size=5, precision=2, entity=None, radius=4.0),
+                LowPassFilter(window_size=1, precision=2, entity=None, time_constant=4),
+                TimeSMAFilter(
+                    window_size=timedelta(minutes=3),
+                    precision=2,
+                    entity=None,
+                    type="last",
+                ),
+                ThrottleFilter(window_size=2, precision=2, entity=None),
+            ]
+
+        rng = random.Random(1)
+        timestamp = dt_util.utcnow()
+        states = []
+        for _ in range(200):
+            states.append(
+                ha.State(
+                    "sensor.test_monitored",
+                    round(rng.gauss(50, 20), 1),
+                    last_updated=timestamp,
+                )
+            )
+            timestamp += timedelta(seconds=rng.randint(1, 60))
+
+        streamed = []
+        filters = make_filters()
+        for state in states:
+            new_state = ha.State(
+                state.entity_id, state.state, last_updated=state.last_updated
+            )
+            for filt in filters:
+                new_state = filt.filter_state(new_state)
+                if filt.skip_processing:
+                    break
+            else:
+                streamed.append(new_state.state)
+
+        filters = make_filters()
+        batch = [FilterState(state) for state in states[:50]]
+        for filt in filters:
+            batch = [state for state in filt.filter_states(batch) if state is not None]
+        batched = [state.state for state in batch]
+
+        # Continue from the windows the batch left behind
+        batch = [FilterState(state) for state in states[50:]]
+        for filt in filters:
+            batch = [state for state in filt.filter_states(batch) if state is not None]
+        batched.extend(state.state for state in batch)
+
+        assert batched == streamed
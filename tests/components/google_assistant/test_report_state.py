@@ -1,4 +1,5 @@
 """Test Google report state."""
+from datetime import timedelta
 from unittest.mock import patch
 
 from homeassistant.components.google_assistant import error, report_state
@@ -39,11 +40,35 @@ async def test_report_state(hass, caplog):
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
 
+        # States are collected and reported together after a short window
+        assert len(mock_report.mock_calls) == 0
+
+        await _async_fire_report_window(hass)
+
     assert len(mock_report.mock_calls) == 1
     assert mock_report.mock_calls[0][1][0] == {
         "devices": {"states": {"light.kitchen": {"on": True, "online": True}}}
     }
 
+    # Test that changes within the window are batched, keeping the latest state
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", side_effect=mock_coro
+    ) as mock_report:
+        hass.states.async_set("light.kitchen", "off")
+        hass.states.async_set("light.ceiling", "on")
+        hass.states.async_set("light.kitchen", "on")
+        await _async_fire_report_window(hass)
+
+    assert len(mock_report.mock_calls) == 1
+    assert mock_report.mock_calls[0][1][0] == {
+        "devices": {
+            "states": {
+                "light.kitchen": {"on": True, "online": True},
+                "light.ceiling": {"on": True, "online": True},
+            }
+        }
+    }
+
     # Test that state changes that change something that Google doesn't care about
     # do not trigger a state report.
     with patch.object(
@@ -52,7 +77,7 @@ async def test_report_state(hass, caplog):
         hass.states.async_set(
             "light.kitchen", "on", {"irrelevant": "should_be_ignored"}
         )
-        await hass.async_block_till_done()
+        await _async_fire_report_window(hass)
 
     assert len(mock_report.mock_calls) == 0
 
@@ -64,7 +89,7 @@ async def test_report_state(hass, caplog):
         side_effect=error.SmartHomeError("mock-error", "mock-msg"),
     ):
         hass.states.async_set("light.kitchen", "off")
-        await hass.async_block_till_done()
+        await _async_fire_report_window(hass)
 
     assert "Not reporting state for light.kitchen: mock-error"
     assert len(mock_report.mock_calls) == 0
@@ -75,6 +100,15 @@ async def test_report_state(hass, caplog):
         BASIC_CONFIG, "async_report_state_all", side_effect=mock_coro
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
-        await hass.async_block_till_done()
+        await _async_fire_report_window(hass)
 
     assert len(mock_report.mock_calls) == 0
+
+
+async def _async_fire_report_window(hass):
+    """Fire time changed to flush the report state window."""
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+    )
+    await hass.async_block_till_done()
@@ -191,6 +191,85 @@ async def test_attributes(hass):
     assert state.attributes[ATTR_ASSUMED_STATE] is True
 
 
+async def test_position_member_changes(hass):
+    """Test the positions follow members being added, removed and changed."""
+    config = {
+        DOMAIN: {
+            "platform": "group",
+            CONF_ENTITIES: [DEMO_COVER, DEMO_COVER_POS, DEMO_COVER_TILT],
+        }
+    }
+
+    with assert_setup_component(1, DOMAIN):
+        await async_setup_component(hass, DOMAIN, config)
+
+    for entity_id in (DEMO_COVER, DEMO_COVER_POS):
+        hass.states.async_set(
+            entity_id,
+            STATE_OPEN,
+            {
+                ATTR_SUPPORTED_FEATURES: 4 | 128,
+                ATTR_CURRENT_POSITION: 50,
+                ATTR_CURRENT_TILT_POSITION: 20,
+            },
+        )
+    await hass.async_block_till_done()
+    state = hass.states.get(COVER_GROUP)
+    assert ATTR_ASSUMED_STATE not in state.attributes
+    assert state.attributes[ATTR_CURRENT_POSITION] == 50
+    assert state.attributes[ATTR_CURRENT_TILT_POSITION] == 20
+
+    hass.states.async_set(
+        DEMO_COVER_TILT,
+        STATE_OPEN,
+        {
+            ATTR_SUPPORTED_FEATURES: 4 | 128,
+            ATTR_CURRENT_POSITION: 70,
+            ATTR_CURRENT_TILT_POSITION: 20,
+        },
+    )
+    await hass.async_block_till_done()
+    state = hass.states.get(COVER_GROUP)
+    assert state.attributes[ATTR_ASSUMED_STATE] is True
+    assert state.attributes[ATTR_CURRENT_POSITION] == 100
+    assert state.attributes[ATTR_CURRENT_TILT_POSITION] == 20
+
+    # A removed member no longer counts
+    hass.states.async_remove(DEMO_COVER_TILT)
+    await hass.async_block_till_done()
+    state = hass.states.get(COVER_GROUP)
+    assert ATTR_ASSUMED_STATE not in state.attributes
+    assert state.attributes[ATTR_CURRENT_POSITION] == 50
+
+    # Neither does a member that stops supporting positions
+    hass.states.async_set(
+        DEMO_COVER_TILT, "unavailable", {ATTR_CURRENT_POSITION: 70},
+    )
+    hass.states.async_set(
+        DEMO_COVER_POS, STATE_OPEN, {ATTR_SUPPORTED_FEATURES: 3},
+    )
+    hass.states.async_set(
+        DEMO_COVER,
+        STATE_OPEN,
+        {
+            ATTR_SUPPORTED_FEATURES: 4 | 128,
+            ATTR_CURRENT_POSITION: 30,
+            ATTR_CURRENT_TILT_POSITION: 40,
+        },
+    )
+    await hass.async_block_till_done()
+    state = hass.states.get(COVER_GROUP)
+    assert ATTR_ASSUMED_STATE not in state.attributes
+    assert state.attributes[ATTR_CURRENT_POSITION] == 30
+    assert state.attributes[ATTR_CURRENT_TILT_POSITION] == 40
+
+    hass.states.async_remove(DEMO_COVER)
+    await hass.async_block_till_done()
+    state = hass.states.get(COVER_GROUP)
+    assert ATTR_CURRENT_POSITION not in state.attributes
+    assert ATTR_CURRENT_TILT_POSITION not in state.attributes
+
+
 async def test_open_covers(hass, setup_comp):
     """Test open cover function."""
     await hass.services.async_call(
@@ -150,6 +150,26 @@ class TestComponentsGroup(unittest.TestCase):
         group_state = self.hass.states.get(test_group.entity_id)
         assert STATE_ON == group_state.state
 
+    def test_allgroup_counts_member_changes(self):
+        """Group with all: true, follow members turning on, off and leaving."""
+        self.hass.states.set("light.Bowl", STATE_ON)
+        self.hass.states.set("light.Ceiling", STATE_OFF)
+        test_group = group.Group.create_group(
+            self.hass, "init_group", ["light.Bowl", "light.Ceiling"], False, mode=True
+        )
+
+        self.hass.states.set("light.Ceiling", STATE_ON)
+        self.hass.block_till_done()
+        assert self.hass.states.get(test_group.entity_id).state == STATE_ON
+
+        self.hass.states.set("light.Bowl", STATE_OFF)
+        self.hass.block_till_done()
+        assert self.hass.states.get(test_group.entity_id).state == STATE_OFF
+
+        self.hass.states.remove("light.Bowl")
+        self.hass.block_till_done()
+        assert self.hass.states.get(test_group.entity_id).state == STATE_ON
+
     def test_is_on(self):
         """Test is_on method."""
         self.hass.states.set("light.Bowl", STATE_ON)
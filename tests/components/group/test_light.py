@@ -394,6 +394,95 @@ async def test_supported_features(hass):
     assert state.attributes["supported_features"] == 41
 
 
+async def test_member_changes(hass):
+    """Test the aggregate follows members being added, removed and unavailable."""
+    await async_setup_component(
+        hass,
+        "light",
+        {
+            "light": {
+                "platform": "group",
+                "entities": ["light.test1", "light.test2", "light.test3"],
+            }
+        },
+    )
+
+    for entity_id, brightness, hue, effect in (
+        ("light.test1", 100, 10, "Rainbow"),
+        ("light.test2", 200, 20, "Rainbow"),
+        ("light.test3", 60, 60, "Colorloop"),
+    ):
+        hass.states.async_set(
+            entity_id,
+            "on",
+            {
+                "brightness": brightness,
+                "hs_color": (hue, 100),
+                "effect_list": [effect, "None"],
+                "effect": effect,
+                "supported_features": 1 | 4 | 16,
+            },
+        )
+    await hass.async_block_till_done()
+    state = hass.states.get("light.light_group")
+    assert state.attributes["brightness"] == 120
+    assert state.attributes["hs_color"] == (30, 100)
+    assert set(state.attributes["effect_list"]) == {"Rainbow", "Colorloop", "None"}
+    assert state.attributes["effect"] == "Rainbow"
+    assert state.attributes["supported_features"] == 1 | 4 | 16
+
+    hass.states.async_set("light.test3", "unavailable")
+    await hass.async_block_till_done()
+    state = hass.states.get("light.light_group")
+    assert state.state == "on"
+    assert state.attributes["brightness"] == 150
+    assert state.attributes["hs_color"] == (15, 100)
+    assert set(state.attributes["effect_list"]) == {"Rainbow", "None"}
+
+    hass.states.async_remove("light.test1")
+    await hass.async_block_till_done()
+    state = hass.states.get("light.light_group")
+    assert state.attributes["brightness"] == 200
+    assert state.attributes["hs_color"] == (20, 100)
+
+    hass.states.async_set(
+        "light.test1", "on", {"brightness": 50, "hs_color": (40, 50)},
+    )
+    await hass.async_block_till_done()
+    state = hass.states.get("light.light_group")
+    assert state.attributes["brightness"] == 125
+    assert state.attributes["hs_color"] == (30, 75)
+
+    hass.states.async_remove("light.test1")
+    hass.states.async_remove("light.test2")
+    hass.states.async_set("light.test3", "off")
+    await hass.async_block_till_done()
+    state = hass.states.get("light.light_group")
+    assert state.state == "off"
+    assert state.attributes.get("brightness") is None
+    assert state.attributes.get("hs_color") is None
+    assert state.attributes.get("effect_list") is None
+    assert state.attributes["supported_features"] == 0
+
+
+def test_running_mean_resync():
+    """Test the running mean does not keep the error of removed values."""
+    mean = group._RunningMean()
+    mean.async_set("light.test1", (1.0, 1.0))
+    mean.async_set("light.test2", (1.0, 1.0))
+
+    # Adding and removing a huge value loses the small ones in the total
+    mean.async_set("light.test3", (1e17, 1e17))
+    mean.async_remove("light.test3")
+    mean.async_set("light.test1", (1.0, 1.0))
+    assert mean.value == (1.0, 1.0)
+
+    for hue in (30.1, 29.7, 30.2, 29.9, 30.1) * 20:
+        mean.async_set("light.test1", (hue, 0.0))
+        mean.async_set("light.test2", (60 - hue, 0.0))
+    assert mean.value == (30.0, 0.0)
+
+
 async def test_service_calls(hass):
     """Test service calls."""
     await async_setup_component(
@@ -3,6 +3,9 @@
 This includes tests for all mock object types.
 """
 from datetime import datetime, timedelta
+import json
+import queue
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
@@ -11,6 +14,7 @@ from homeassistant.components.homekit.accessories import (
     HomeAccessory,
     HomeBridge,
     HomeDriver,
+    async_track_accessory_state,
     debounce,
 )
 from homeassistant.components.homekit.const import (
@@ -26,6 +30,7 @@ from homeassistant.components.homekit.const import (
     CHAR_SERIAL_NUMBER,
     CONF_LINKED_BATTERY_SENSOR,
     CONF_LOW_BATTERY_THRESHOLD,
+    DATA_STATE_LISTENERS,
     MANUFACTURER,
     SERV_ACCESSORY_INFO,
 )
@@ -358,3 +363,54 @@ def test_home_driver():
 
     mock_unpair.assert_called_with("client_uuid")
     mock_show_msg.assert_called_with("hass", pin)
+
+
+async def test_shared_state_listener(hass):
+    """Test accessories share one state listener routed by entity_id."""
+    calls = []
+    remove = async_track_accessory_state(
+        hass, "light.one", lambda *args: calls.append(args)
+    )
+    async_track_accessory_state(hass, "light.two", lambda *args: calls.append(args))
+    assert hass.bus.async_listeners()["state_changed"] == 1
+
+    hass.states.async_set("light.one", "on")
+    hass.states.async_set("light.three", "on")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert calls[0][0] == "light.one"
+    assert calls[0][2].state == "on"
+
+    remove()
+    hass.states.async_set("light.one", "off")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert "light.one" not in hass.data[DATA_STATE_LISTENERS]
+
+
+async def test_home_driver_coalesces_events(hass):
+    """Test characteristic changes are sent as one event per client."""
+    with patch("pyhap.accessory_driver.AccessoryDriver.__init__"):
+        driver = HomeDriver(hass)
+    driver.topic_lock = threading.Lock()
+    driver.event_queue = queue.Queue()
+    driver.topics = {"2.9": {"client_a", "client_b"}, "3.9": {"client_a"}}
+
+    driver.publish({"aid": 2, "iid": 9, "value": 1})
+    driver.publish({"aid": 2, "iid": 9, "value": 2}, "client_b")
+    driver.publish({"aid": 3, "iid": 9, "value": 3})
+    driver.publish({"aid": 4, "iid": 9, "value": 4})
+    assert driver.event_queue.empty()
+    await hass.async_block_till_done()
+
+    sent = {}
+    while not driver.event_queue.empty():
+        client_addr, bytedata = driver.event_queue.get()
+        sent[client_addr] = json.loads(bytedata.decode())["characteristics"]
+    assert sent == {
+        "client_a": [
+            {"aid": 2, "iid": 9, "value": 2},
+            {"aid": 3, "iid": 9, "value": 3},
+        ],
+        "client_b": [{"aid": 2, "iid": 9, "value": 1}],
+    }
@@ -1,7 +1,8 @@
 """The tests for the Home Assistant HTTP component."""
 # pylint: disable=protected-access
+from datetime import timedelta
 from ipaddress import ip_address
-from unittest.mock import Mock, mock_open, patch
+from unittest.mock import Mock, call, patch
 
 from aiohttp import web
 from aiohttp.web_exceptions import HTTPUnauthorized
@@ -10,18 +11,21 @@ from aiohttp.web_middlewares import middleware
 import homeassistant.components.http as http
 from homeassistant.components.http import KEY_AUTHENTICATED
 from homeassistant.components.http.ban import (
-    IP_BANS_FILE,
     KEY_BANNED_IPS,
     KEY_FAILED_LOGIN_ATTEMPTS,
+    SAVE_DELAY,
     IpBan,
+    IpBanIndex,
+    async_load_ip_bans_config,
     setup_bans,
 )
 from homeassistant.components.http.view import request_handler_factory
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
 from . import mock_real_ip
 
-from tests.common import mock_coro
+from tests.common import async_fire_time_changed, mock_coro
 
 BANNED_IPS = ["200.201.202.203", "100.64.0.2"]
 
@@ -81,22 +85,131 @@ async def test_ip_bans_file_creation(hass, aiohttp_client):
     ):
         client = await aiohttp_client(app)
 
-    m = mock_open()
-
-    with patch("homeassistant.components.http.ban.open", m, create=True):
+    with patch("homeassistant.helpers.storage.Store._write_data") as mock_write:
         resp = await client.get("/")
         assert resp.status == 401
         assert len(app[KEY_BANNED_IPS]) == len(BANNED_IPS)
-        assert m.call_count == 0
 
         resp = await client.get("/")
         assert resp.status == 401
         assert len(app[KEY_BANNED_IPS]) == len(BANNED_IPS) + 1
-        m.assert_called_once_with(hass.config.path(IP_BANS_FILE), "a")
 
         resp = await client.get("/")
         assert resp.status == 403
-        assert m.call_count == 1
+
+        # Bans are written in a single delayed batch
+        assert mock_write.call_count == 0
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=SAVE_DELAY))
+        await hass.async_block_till_done()
+
+    assert mock_write.call_count == 1
+    data = mock_write.mock_calls[0][1][1]["data"]
+    assert [ban["ip_ban"] for ban in data["ip_bans"]] == [
+        "200.201.202.203/32",
+        "100.64.0.2/32",
+        "200.201.202.204/32",
+    ]
+
+
+async def test_access_from_banned_network(hass, aiohttp_client):
+    """Test accessing to server from an IP inside a banned network."""
+    app = web.Application()
+    setup_bans(hass, app, 5)
+    set_real_ip = mock_real_ip(app)
+
+    with patch(
+        "homeassistant.components.http.ban.async_load_ip_bans_config",
+        return_value=mock_coro([IpBan("10.0.0.0/8"), IpBan("2001:db8::/32")]),
+    ):
+        client = await aiohttp_client(app)
+
+    for remote_addr in ["10.1.2.3", "2001:db8::1"]:
+        set_real_ip(remote_addr)
+        resp = await client.get("/")
+        assert resp.status == 403
+
+    for remote_addr in ["11.1.2.3", "2001:db9::1"]:
+        set_real_ip(remote_addr)
+        resp = await client.get("/")
+        assert resp.status == 404
+
+
+async def test_expired_ban(hass, aiohttp_client):
+    """Test that an expired ban is lifted."""
+    app = web.Application()
+    setup_bans(hass, app, 5)
+    mock_real_ip(app)("200.201.202.204")
+    now = dt_util.utcnow()
+
+    with patch(
+        "homeassistant.components.http.ban.async_load_ip_bans_config",
+        return_value=mock_coro(
+            [IpBan("200.201.202.204", now, now + timedelta(minutes=10))]
+        ),
+    ):
+        client = await aiohttp_client(app)
+
+    resp = await client.get("/")
+    assert resp.status == 403
+
+    with patch(
+        "homeassistant.util.dt.utcnow", return_value=now + timedelta(minutes=11)
+    ), patch("homeassistant.helpers.storage.Store.async_delay_save") as mock_save:
+        resp = await client.get("/")
+
+    assert resp.status == 404
+    assert len(app[KEY_BANNED_IPS]) == 0
+    assert len(mock_save.mock_calls) == 1
+
+
+def test_ip_ban_index():
+    """Test adding, looking up and removing bans in the index."""
+    host_ban = IpBan("192.168.1.10")
+    network_ban = IpBan("10.0.0.0/8")
+    narrow_ban = IpBan("10.1.0.0/16")
+    index = IpBanIndex([host_ban, network_ban, narrow_ban])
+
+    assert len(index) == 3
+    assert index.async_get(ip_address("192.168.1.10")) is host_ban
+    assert index.async_get(ip_address("192.168.1.11")) is None
+    assert index.async_get(ip_address("10.1.2.3")) is narrow_ban
+    assert index.async_get(ip_address("10.2.2.3")) is network_ban
+
+    index.async_remove(narrow_ban)
+    assert index.async_get(ip_address("10.1.2.3")) is network_ban
+
+    index.async_remove(network_ban)
+    index.async_remove(host_ban)
+    assert len(index) == 0
+    assert index.async_get(ip_address("10.1.2.3")) is None
+
+
+async def test_migrate_ip_bans_yaml(hass):
+    """Test migrating the legacy YAML file to storage."""
+    store = Mock(
+        async_load=Mock(return_value=mock_coro(None)),
+        async_save=Mock(return_value=mock_coro()),
+    )
+
+    with patch("os.path.isfile", return_value=True), patch(
+        "homeassistant.components.http.ban.load_yaml_config_file",
+        return_value={
+            "200.201.202.203": {"banned_at": "2016-11-16T19:20:03"},
+            "10.0.0.0/8": {"expires_at": "2100-01-01T00:00:00+00:00"},
+            "not-an-ip": None,
+        },
+    ), patch("os.replace") as mock_replace:
+        ip_bans = await async_load_ip_bans_config(hass, store, "ip_bans.yaml")
+
+    # The file is kept under a new name
+    assert mock_replace.mock_calls == [call("ip_bans.yaml", "ip_bans.yaml.migrated")]
+    assert len(store.async_save.mock_calls) == 1
+    assert [str(ip_ban.ip_network) for ip_ban in ip_bans] == [
+        "200.201.202.203/32",
+        "10.0.0.0/8",
+    ]
+    assert ip_bans[0].banned_at.isoformat() == "2016-11-16T19:20:03+00:00"
+    assert ip_bans[1].expires_at.year == 2100
 
 
 async def test_failed_login_attempts_counter(hass, aiohttp_client):
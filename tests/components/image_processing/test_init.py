@@ -1,9 +1,10 @@
 """The tests for the image_processing component."""
-from unittest.mock import PropertyMock, patch
+import asyncio
+from unittest.mock import Mock, PropertyMock, patch
 
 import homeassistant.components.http as http
 import homeassistant.components.image_processing as ip
-from homeassistant.const import ATTR_ENTITY_PICTURE
+from homeassistant.const import ATTR_ENTITY_PICTURE, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.setup import setup_component
@@ -12,6 +13,7 @@ from tests.common import (
     assert_setup_component,
     get_test_home_assistant,
     get_test_instance_port,
+    mock_coro,
 )
 from tests.components.image_processing import common
 
@@ -292,3 +294,104 @@ class TestImageProcessingFace:
         assert event_data[0]["confidence"] == 98.34
         assert event_data[0]["gender"] == "male"
         assert event_data[0]["entity_id"] == "image_processing.demo_face"
+
+
+class MockImageProcessing(ip.ImageProcessingEntity):
+    """Image processing entity recording the processed images."""
+
+    def __init__(self, hass, key=None):
+        """Initialize the entity."""
+        self.hass = hass
+        self.key = key
+        self.images = []
+        self.batches = []
+
+    @property
+    def camera_entity(self):
+        """Return camera entity id from process pictures."""
+        return "camera.demo_camera"
+
+    @property
+    def batch_key(self):
+        """Return the batch key."""
+        return self.key
+
+    def process_image(self, image):
+        """Process image."""
+        self.images.append(image)
+
+    def process_image_batch(self, frames):
+        """Process a batch of frames."""
+        self.batches.append(frames)
+        super().process_image_batch(frames)
+
+
+async def test_unchanged_frames_are_skipped(hass):
+    """Test that an unchanged frame is only processed once."""
+    entity = MockImageProcessing(hass)
+    image = Mock(content=b"frame")
+
+    with patch(
+        "homeassistant.components.camera.async_get_image",
+        side_effect=lambda *args, **kwargs: mock_coro(image),
+    ):
+        await entity.async_update()
+        await entity.async_update()
+        assert entity.images == [b"frame"]
+        assert entity.state_attributes[ip.ATTR_PROCESSING_TIME] >= 0
+
+        image.content = b"other"
+        await entity.async_update()
+        assert entity.images == [b"frame", b"other"]
+
+        entity.async_reset_frame_gate()
+        await entity.async_update()
+        assert entity.images == [b"frame", b"other", b"other"]
+
+
+async def test_frames_are_batched(hass):
+    """Test that frames with the same batch key are processed together."""
+    entities = [MockImageProcessing(hass, "model") for _ in range(3)]
+    single = MockImageProcessing(hass)
+
+    await asyncio.gather(
+        *(
+            entity.async_process_image(str(index).encode())
+            for index, entity in enumerate(entities + [single])
+        )
+    )
+
+    assert len(entities[0].batches) == 1
+    assert [frame[0] for frame in entities[0].batches[0]] == entities
+    assert [entity.images for entity in entities] == [[b"0"], [b"1"], [b"2"]]
+    assert single.images == [b"3"]
+    assert not single.batches
+
+
+async def test_batch_with_cancelled_frame(hass):
+    """Test a batch resolves the other frames when one caller stopped waiting."""
+    entities = [MockImageProcessing(hass, "model") for _ in range(2)]
+
+    cancelled = hass.async_create_task(entities[0].async_process_image(b"0"))
+    waiting = hass.async_create_task(entities[1].async_process_image(b"1"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    await asyncio.wait_for(waiting, 1)
+    assert len(entities[0].batches) == 1
+    assert entities[1].images == [b"1"]
+
+
+async def test_no_processing_after_stop(hass):
+    """Test frames are skipped once Home Assistant stops."""
+    entities = [MockImageProcessing(hass, "model"), MockImageProcessing(hass)]
+
+    pending = hass.async_create_task(entities[0].async_process_image(b"0"))
+    await asyncio.sleep(0)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    await asyncio.wait_for(pending, 1)
+    for entity in entities:
+        await entity.async_process_image(b"1")
+        assert not entity.images
@@ -1,8 +1,11 @@
 """The tests for the InfluxDB component."""
 import datetime
+import os
 import unittest
 from unittest import mock
 
+from influxdb.line_protocol import make_lines
+
 import homeassistant.components.influxdb as influxdb
 from homeassistant.const import EVENT_STATE_CHANGED, STATE_OFF, STATE_ON, STATE_STANDBY
 from homeassistant.setup import setup_component
@@ -10,6 +13,18 @@ from homeassistant.setup import setup_component
 from tests.common import get_test_home_assistant
 
 
+def _line_call(body):
+    """Return the expected write for points in the JSON format."""
+    for point in body:
+        point["fields"] = {
+            key: float(value)
+            if isinstance(value, int) and not isinstance(value, bool)
+            else value
+            for key, value in point["fields"].items()
+        }
+    return mock.call(make_lines({"points": body}).splitlines(), protocol="line")
+
+
 @mock.patch("homeassistant.components.influxdb.InfluxDBClient")
 @mock.patch(
     "homeassistant.components.influxdb.InfluxThread.batch_timeout",
@@ -27,6 +42,9 @@ class TestInfluxDB(unittest.TestCase):
     def tearDown(self):
         """Clear data."""
         self.hass.stop()
+        spool_path = self.hass.config.path(influxdb.SPOOL_FILE)
+        if os.path.isfile(spool_path):
+            os.remove(spool_path)
 
     def test_setup_config_full(self, mock_client):
         """Test the setup with full configuration."""
@@ -145,7 +163,7 @@ class TestInfluxDB(unittest.TestCase):
             self.hass.data[influxdb.DOMAIN].block_till_done()
 
             assert mock_client.return_value.write_points.call_count == 1
-            assert mock_client.return_value.write_points.call_args == mock.call(body)
+            assert mock_client.return_value.write_points.call_args == _line_call(body)
             mock_client.return_value.write_points.reset_mock()
 
     def test_event_listener_no_units(self, mock_client):
@@ -176,7 +194,7 @@ class TestInfluxDB(unittest.TestCase):
             self.handler_method(event)
             self.hass.data[influxdb.DOMAIN].block_till_done()
             assert mock_client.return_value.write_points.call_count == 1
-            assert mock_client.return_value.write_points.call_args == mock.call(body)
+            assert mock_client.return_value.write_points.call_args == _line_call(body)
             mock_client.return_value.write_points.reset_mock()
 
     def test_event_listener_inf(self, mock_client):
@@ -203,7 +221,7 @@ class TestInfluxDB(unittest.TestCase):
         self.handler_method(event)
         self.hass.data[influxdb.DOMAIN].block_till_done()
         assert mock_client.return_value.write_points.call_count == 1
-        assert mock_client.return_value.write_points.call_args == mock.call(body)
+        assert mock_client.return_value.write_points.call_args == _line_call(body)
         mock_client.return_value.write_points.reset_mock()
 
     def test_event_listener_states(self, mock_client):
@@ -231,7 +249,7 @@ class TestInfluxDB(unittest.TestCase):
             self.hass.data[influxdb.DOMAIN].block_till_done()
             if state_state == 1:
                 assert mock_client.return_value.write_points.call_count == 1
-                assert mock_client.return_value.write_points.call_args == mock.call(
+                assert mock_client.return_value.write_points.call_args == _line_call(
                     body
                 )
             else:
@@ -263,7 +281,7 @@ class TestInfluxDB(unittest.TestCase):
             self.hass.data[influxdb.DOMAIN].block_till_done()
             if entity_id == "ok":
                 assert mock_client.return_value.write_points.call_count == 1
-                assert mock_client.return_value.write_points.call_args == mock.call(
+                assert mock_client.return_value.write_points.call_args == _line_call(
                     body
                 )
             else:
@@ -295,7 +313,7 @@ class TestInfluxDB(unittest.TestCase):
             self.hass.data[influxdb.DOMAIN].block_till_done()
             if domain == "ok":
                 assert mock_client.return_value.write_points.call_count == 1
-                assert mock_client.return_value.write_points.call_args == mock.call(
+                assert mock_client.return_value.write_points.call_args == _line_call(
                     body
                 )
             else:
@@ -337,7 +355,7 @@ class TestInfluxDB(unittest.TestCase):
             self.hass.data[influxdb.DOMAIN].block_till_done()
             if entity_id == "included":
                 assert mock_client.return_value.write_points.call_count == 1
-                assert mock_client.return_value.write_points.call_args == mock.call(
+                assert mock_client.return_value.write_points.call_args == _line_call(
                     body
                 )
             else:
@@ -379,7 +397,7 @@ class TestInfluxDB(unittest.TestCase):
             self.hass.data[influxdb.DOMAIN].block_till_done()
             if domain == "fake":
                 assert mock_client.return_value.write_points.call_count == 1
-                assert mock_client.return_value.write_points.call_args == mock.call(
+                assert mock_client.return_value.write_points.call_args == _line_call(
                     body
                 )
             else:
@@ -421,7 +439,7 @@ class TestInfluxDB(unittest.TestCase):
             self.hass.data[influxdb.DOMAIN].block_till_done()
             if domain == "fake":
                 assert mock_client.return_value.write_points.call_count == 1
-                assert mock_client.return_value.write_points.call_args == mock.call(
+                assert mock_client.return_value.write_points.call_args == _line_call(
                     body
                 )
             else:
@@ -449,7 +467,7 @@ class TestInfluxDB(unittest.TestCase):
             self.hass.data[influxdb.DOMAIN].block_till_done()
             if entity_id == "one":
                 assert mock_client.return_value.write_points.call_count == 1
-                assert mock_client.return_value.write_points.call_args == mock.call(
+                assert mock_client.return_value.write_points.call_args == _line_call(
                     body
                 )
             else:
@@ -504,7 +522,7 @@ class TestInfluxDB(unittest.TestCase):
             self.handler_method(event)
             self.hass.data[influxdb.DOMAIN].block_till_done()
             assert mock_client.return_value.write_points.call_count == 1
-            assert mock_client.return_value.write_points.call_args == mock.call(body)
+            assert mock_client.return_value.write_points.call_args == _line_call(body)
             mock_client.return_value.write_points.reset_mock()
 
     def test_event_listener_default_measurement(self, mock_client):
@@ -543,7 +561,7 @@ class TestInfluxDB(unittest.TestCase):
             self.hass.data[influxdb.DOMAIN].block_till_done()
             if entity_id == "ok":
                 assert mock_client.return_value.write_points.call_count == 1
-                assert mock_client.return_value.write_points.call_args == mock.call(
+                assert mock_client.return_value.write_points.call_args == _line_call(
                     body
                 )
             else:
@@ -584,7 +602,7 @@ class TestInfluxDB(unittest.TestCase):
         self.handler_method(event)
         self.hass.data[influxdb.DOMAIN].block_till_done()
         assert mock_client.return_value.write_points.call_count == 1
-        assert mock_client.return_value.write_points.call_args == mock.call(body)
+        assert mock_client.return_value.write_points.call_args == _line_call(body)
         mock_client.return_value.write_points.reset_mock()
 
     def test_event_listener_tags_attributes(self, mock_client):
@@ -625,7 +643,7 @@ class TestInfluxDB(unittest.TestCase):
         self.handler_method(event)
         self.hass.data[influxdb.DOMAIN].block_till_done()
         assert mock_client.return_value.write_points.call_count == 1
-        assert mock_client.return_value.write_points.call_args == mock.call(body)
+        assert mock_client.return_value.write_points.call_args == _line_call(body)
         mock_client.return_value.write_points.reset_mock()
 
     def test_event_listener_component_override_measurement(self, mock_client):
@@ -676,7 +694,7 @@ class TestInfluxDB(unittest.TestCase):
             self.handler_method(event)
             self.hass.data[influxdb.DOMAIN].block_till_done()
             assert mock_client.return_value.write_points.call_count == 1
-            assert mock_client.return_value.write_points.call_args == mock.call(body)
+            assert mock_client.return_value.write_points.call_args == _line_call(body)
             mock_client.return_value.write_points.reset_mock()
 
     def test_scheduled_write(self, mock_client):
@@ -708,17 +726,78 @@ class TestInfluxDB(unittest.TestCase):
             self.handler_method(event)
             self.hass.data[influxdb.DOMAIN].block_till_done()
             assert mock_sleep.called
-        json_data = mock_client.return_value.write_points.call_args[0][0]
+        lines = mock_client.return_value.write_points.call_args[0][0]
         assert mock_client.return_value.write_points.call_count == 2
-        mock_client.return_value.write_points.assert_called_with(json_data)
+        mock_client.return_value.write_points.assert_called_with(lines, protocol="line")
+        assert self.hass.data[influxdb.DOMAIN].stats["spooled"] == 1
 
-        # Write works again
+        # Write works again and the spooled event is replayed
         mock_client.return_value.write_points.side_effect = None
         with mock.patch.object(influxdb.time, "sleep") as mock_sleep:
             self.handler_method(event)
             self.hass.data[influxdb.DOMAIN].block_till_done()
             assert not mock_sleep.called
+        assert mock_client.return_value.write_points.call_count == 4
+        mock_client.return_value.write_points.assert_called_with(lines, protocol="line")
+        assert self.hass.data[influxdb.DOMAIN].stats["replayed"] == 1
+        assert not os.path.isfile(self.hass.config.path(influxdb.SPOOL_FILE))
+
+    def test_write_rejected(self, mock_client):
+        """Test the event listener to drop points the database refuses."""
+        self._setup(mock_client)
+
+        state = mock.MagicMock(
+            state=1,
+            domain="fake",
+            entity_id="entity.id",
+            object_id="entity",
+            attributes={},
+        )
+        event = mock.MagicMock(data={"new_state": state}, time_fired=12345)
+        mock_client.return_value.write_points.side_effect = influxdb.exceptions.InfluxDBClientError(
+            "field type conflict", 400
+        )
+
+        with mock.patch.object(influxdb.time, "sleep") as mock_sleep:
+            self.handler_method(event)
+            self.hass.data[influxdb.DOMAIN].block_till_done()
+            assert not mock_sleep.called
+
+        assert mock_client.return_value.write_points.call_count == 1
+        assert self.hass.data[influxdb.DOMAIN].stats["rejected"] == 1
+        assert self.hass.data[influxdb.DOMAIN].stats["spooled"] == 0
+        assert not os.path.isfile(self.hass.config.path(influxdb.SPOOL_FILE))
+
+    def test_replay_rejected(self, mock_client):
+        """Test replaying the spool to drop points the database refuses."""
+        self._setup(mock_client)
+        spool = self.hass.data[influxdb.DOMAIN].spool
+        spool.append(["bad value=1", "good value=2"])
+
+        state = mock.MagicMock(
+            state=1,
+            domain="fake",
+            entity_id="entity.id",
+            object_id="entity",
+            attributes={},
+        )
+        event = mock.MagicMock(data={"new_state": state}, time_fired=12345)
+
+        def write_points(lines, protocol):
+            if "bad value=1" in lines:
+                raise influxdb.exceptions.InfluxDBClientError("bad point", 400)
+
+        mock_client.return_value.write_points.side_effect = write_points
+
+        with mock.patch.object(influxdb, "REPLAY_BATCH_SIZE", 1):
+            self.handler_method(event)
+            self.hass.data[influxdb.DOMAIN].block_till_done()
+
         assert mock_client.return_value.write_points.call_count == 3
+        assert self.hass.data[influxdb.DOMAIN].stats["rejected"] == 1
+        assert self.hass.data[influxdb.DOMAIN].stats["replayed"] == 1
+        assert len(spool) == 0
+        assert not os.path.isfile(spool.path)
 
     def test_queue_backlog_full(self, mock_client):
         """Test the event listener to drop old events."""
@@ -749,4 +828,133 @@ class TestInfluxDB(unittest.TestCase):
 
             assert mock_client.return_value.write_points.call_count == 0
 
+        assert self.hass.data[influxdb.DOMAIN].stats["spooled"] == 1
         mock_client.return_value.write_points.reset_mock()
+
+    def test_queue_backlog_full_without_spool(self, mock_client):
+        """Test the event listener to drop old events without spool."""
+        self._setup(mock_client, spool_size=0)
+
+        state = mock.MagicMock(
+            state=1,
+            domain="fake",
+            entity_id="entity.id",
+            object_id="entity",
+            attributes={},
+        )
+        event = mock.MagicMock(data={"new_state": state}, time_fired=12345)
+
+        monotonic_time = 0
+
+        def fast_monotonic():
+            """Monotonic time that ticks fast enough to cause a timeout."""
+            nonlocal monotonic_time
+            monotonic_time += 60
+            return monotonic_time
+
+        with mock.patch(
+            "homeassistant.components.influxdb.time.monotonic", new=fast_monotonic
+        ):
+            self.handler_method(event)
+            self.hass.data[influxdb.DOMAIN].block_till_done()
+
+            assert mock_client.return_value.write_points.call_count == 0
+
+        assert self.hass.data[influxdb.DOMAIN].stats["dropped"] == 1
+
+    def test_event_listener_workers(self, mock_client):
+        """Test writing with several workers."""
+        self._setup(mock_client, workers=3)
+
+        state = mock.MagicMock(
+            state=1,
+            domain="fake",
+            entity_id="fake.entity",
+            object_id="entity",
+            attributes={},
+        )
+        event = mock.MagicMock(data={"new_state": state}, time_fired=12345)
+        body = [
+            {
+                "measurement": "fake.entity",
+                "tags": {"domain": "fake", "entity_id": "entity"},
+                "time": 12345,
+                "fields": {"value": 1},
+            }
+        ]
+
+        self.handler_method(event)
+        self.hass.data[influxdb.DOMAIN].block_till_done()
+        assert mock_client.return_value.write_points.call_count == 1
+        assert mock_client.return_value.write_points.call_args == _line_call(body)
+        assert self.hass.data[influxdb.DOMAIN].stats["written"] == 1
+
+
+def test_spool(tmpdir):
+    """Test the spool keeps points until they are written."""
+    spool = influxdb.InfluxSpool(str(tmpdir.join("spool")), 3)
+    assert len(spool) == 0
+
+    assert spool.append(["a 1", "b 2"]) == 0
+    assert spool.append(["c 3", "d 4"]) == 1
+    assert len(influxdb.InfluxSpool(spool.path, 3)) == 3
+
+    written = []
+
+    def failing_write(lines):
+        written.extend(lines)
+        raise IOError("foo")
+
+    with mock.patch.object(influxdb, "REPLAY_BATCH_SIZE", 2):
+        try:
+            spool.replay(failing_write)
+        except IOError:
+            pass
+        assert written == ["a 1", "b 2"]
+        assert len(spool) == 3
+
+        written.clear()
+        assert spool.replay(written.extend) == 3
+        assert written == ["a 1", "b 2", "c 3"]
+
+    assert len(spool) == 0
+    assert not os.path.isfile(spool.path)
+
+
+def test_spool_append_while_replaying(tmpdir):
+    """Test points spooled during a replay are kept and replays do not overlap."""
+    spool = influxdb.InfluxSpool(str(tmpdir.join("spool")), 10)
+    spool.append(["a 1", "b 2"])
+
+    written = []
+
+    def write(lines):
+        # Other workers spool and check the spool while this one replays
+        assert spool.append(["c 3"]) == 0
+        assert len(spool) == 3
+        assert spool.replay(written.extend) == 0
+        written.extend(lines)
+
+    assert spool.replay(write) == 2
+    assert written == ["a 1", "b 2"]
+    assert len(spool) == 1
+    assert influxdb.InfluxSpool(spool.path, 10)._read() == ["c 3"]
+
+
+def test_spool_rejected(tmpdir):
+    """Test the spool drops batches the write refuses and goes on."""
+    spool = influxdb.InfluxSpool(str(tmpdir.join("spool")), 3)
+    spool.append(["a 1", "b 2", "c 3"])
+
+    written = []
+
+    def write(lines):
+        if "a 1" in lines:
+            return False
+        written.extend(lines)
+
+    with mock.patch.object(influxdb, "REPLAY_BATCH_SIZE", 1):
+        assert spool.replay(write) == 2
+
+    assert written == ["b 2", "c 3"]
+    assert len(spool) == 0
@@ -1,11 +1,19 @@
 """The tests for the Prometheus exporter."""
+from unittest.mock import Mock, call
+
 import pytest
 
 from homeassistant import setup
 from homeassistant.components import climate, sensor
 from homeassistant.components.demo.sensor import DemoSensor
 import homeassistant.components.prometheus as prometheus
-from homeassistant.const import DEVICE_CLASS_POWER, ENERGY_KILO_WATT_HOUR
+from homeassistant.const import (
+    DEVICE_CLASS_POWER,
+    ENERGY_KILO_WATT_HOUR,
+    EVENT_STATE_CHANGED,
+    TEMP_CELSIUS,
+)
+from homeassistant.core import Event, State
 from homeassistant.setup import async_setup_component
 
 
@@ -126,3 +134,27 @@ async def test_view(prometheus_client):  # pylint: disable=redefined-outer-name
         'entity="sensor.sps30_pm_1um_weight_concentration",'
         'friendly_name="SPS30 PM <1µm Weight concentration"} 3.7069' in body
     )
+
+
+def test_bound_children_cached():
+    """Test metric children are only bound again when the labels change."""
+    prometheus_cli = Mock()
+    metrics = prometheus.PrometheusMetrics(
+        prometheus_cli, lambda entity_id: True, None, TEMP_CELSIUS, {}, None, None
+    )
+    counter = prometheus_cli.Counter.return_value
+
+    state = State("switch.kitchen", "on", {"friendly_name": "Kitchen"})
+    metrics.handle_event(Event(EVENT_STATE_CHANGED, {"new_state": state}))
+    metrics.handle_event(Event(EVENT_STATE_CHANGED, {"new_state": state}))
+
+    assert counter.labels.call_count == 1
+    assert counter.labels.return_value.inc.call_count == 2
+
+    state = State("switch.kitchen", "off", {"friendly_name": "Kitchen lights"})
+    metrics.handle_event(Event(EVENT_STATE_CHANGED, {"new_state": state}))
+
+    assert counter.labels.call_count == 2
+    assert counter.labels.call_args == call(
+        entity="switch.kitchen", domain="switch", friendly_name="Kitchen lights"
+    )
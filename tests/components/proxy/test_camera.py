@@ -0,0 +1,98 @@
+"""Test the frame cache of the proxy camera."""
+import asyncio
+import io
+from unittest.mock import Mock, patch
+
+from PIL import Image
+
+from homeassistant.components.proxy import camera as proxy
+
+from tests.common import mock_coro
+
+
+def _mock_source(*contents):
+    """Patch the source camera to return the given images in turn."""
+    images = iter(contents)
+    return patch(
+        "homeassistant.components.proxy.camera.async_get_image",
+        side_effect=lambda hass, entity_id: mock_coro(Mock(content=next(images))),
+    )
+
+
+def _mock_job(calls):
+    """Return a transform job recording the images it was given."""
+
+    def job(image, opts):
+        calls.append(image)
+        return image.upper()
+
+    return job
+
+
+async def test_frame_cache_hit_and_miss(hass):
+    """Test a frame is reused within its time to live."""
+    calls = []
+    cache = proxy.FrameCache(hass, "camera.source", _mock_job(calls), None, 10)
+
+    with _mock_source(b"frame", b"other") as mock_get_image, patch.object(
+        proxy, "monotonic", return_value=100
+    ) as mock_monotonic:
+        assert await cache.async_get_image() == b"FRAME"
+        assert await cache.async_get_image() == b"FRAME"
+        assert mock_get_image.call_count == 1
+
+        mock_monotonic.return_value = 111
+        assert await cache.async_get_image() == b"OTHER"
+        assert mock_get_image.call_count == 2
+
+    assert calls == [b"frame", b"other"]
+
+
+async def test_frame_cache_unchanged_source(hass):
+    """Test an unchanged source frame is not transformed again."""
+    calls = []
+    cache = proxy.FrameCache(hass, "camera.source", _mock_job(calls), None, 0)
+
+    with _mock_source(b"frame", b"frame", b"new") as mock_get_image:
+        assert await cache.async_get_image() == b"FRAME"
+        assert await cache.async_get_image() == b"FRAME"
+        assert calls == [b"frame"]
+
+        # A new source image invalidates the transformed frame
+        assert await cache.async_get_image() == b"NEW"
+        assert calls == [b"frame", b"new"]
+
+    assert mock_get_image.call_count == 3
+
+
+async def test_frame_cache_shared_between_requests(hass):
+    """Test concurrent requests share one fetch and one resize."""
+    source = io.BytesIO()
+    Image.new("RGB", (640, 480)).save(source, "PNG")
+    opts = proxy.ImageOpts(320, None, None, None, None, True)
+    job = Mock(wraps=proxy._resize_image)
+    cache = proxy.FrameCache(hass, "camera.source", job, opts, 0)
+
+    with _mock_source(source.getvalue()) as mock_get_image:
+        images = await asyncio.gather(*(cache.async_get_image() for _ in range(5)))
+
+    assert mock_get_image.call_count == 1
+    assert job.call_count == 1
+    assert all(image is images[0] for image in images)
+    assert Image.open(io.BytesIO(images[0])).size == (320, 240)
+
+
+async def test_frame_cache_cancelled_request(hass):
+    """Test a request going away does not cancel the fetch for the others."""
+    calls = []
+    cache = proxy.FrameCache(hass, "camera.source", _mock_job(calls), None, 0)
+
+    with _mock_source(b"frame"):
+        cancelled = hass.async_create_task(cache.async_get_image())
+        waiting = hass.async_create_task(cache.async_get_image())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert await waiting == b"FRAME"
+
+    assert calls == [b"frame"]
@@ -1,5 +1,6 @@
 """The test for the statistics sensor platform."""
 from datetime import datetime, timedelta
+import random
 import statistics
 import unittest
 from unittest.mock import patch
@@ -7,7 +8,10 @@ from unittest.mock import patch
 import pytest
 
 from homeassistant.components import recorder
-from homeassistant.components.statistics.sensor import StatisticsSensor
+from homeassistant.components.statistics.sensor import (
+    StatisticsSensor,
+    WindowStatistics,
+)
 from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT, STATE_UNKNOWN, TEMP_CELSIUS
 from homeassistant.setup import setup_component
 from homeassistant.util import dt as dt_util
@@ -419,3 +423,34 @@ class TestStatisticsSensor(unittest.TestCase):
         assert mock_data["return_time"] == state.attributes.get("max_age") + timedelta(
             hours=1
         )
+
+
+def test_window_statistics():
+    """Test the running statistics match a full calculation."""
+    rng = random.Random(42)
+    window = WindowStatistics(25)
+    start = datetime(2020, 1, 1, tzinfo=dt_util.UTC)
+    samples = []
+
+    for idx in range(500):
+        value = rng.choice([rng.randint(0, 10), rng.uniform(-50, 50)])
+        age = start + timedelta(seconds=idx)
+        window.add(value, age)
+        samples = (samples + [value])[-25:]
+
+        if idx % 50 == 49:
+            # Evict by age as well
+            window.purge_older_than(age - timedelta(seconds=9))
+            samples = samples[-10:]
+
+        assert list(window.values) == samples
+        assert window.mean == pytest.approx(statistics.mean(samples))
+        assert window.total == pytest.approx(sum(samples))
+        assert window.median == statistics.median(samples)
+        assert window.min == min(samples)
+        assert window.max == max(samples)
+        if len(samples) > 1:
+            assert window.variance == pytest.approx(statistics.variance(samples))
+
+    assert window.purge_older_than(start + timedelta(days=1)) == len(samples)
+    assert len(window) == 0
@@ -1,10 +1,13 @@
 """The tests for hls streams."""
+import asyncio
 from datetime import timedelta
 from urllib.parse import urlparse
 
 import pytest
 
 from homeassistant.components.stream import request_stream
+from homeassistant.components.stream.core import Part, Segment
+from homeassistant.components.stream.hls import M3U8Renderer
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
@@ -113,3 +116,50 @@ async def test_stream_ended(hass):
 
     # Stop stream, if it hasn't quit already
     stream.stop()
+
+
+async def test_ll_hls_parts(hass):
+    """Test LL-HLS partial segments, preload hint and blocking reload."""
+    await async_setup_component(hass, "stream", {"stream": {"ll_hls": True}})
+    stream = preload_stream(hass, "source")
+    track = stream.add_provider("hls")
+    assert track.part_target == 1.0
+
+    track.put_part(1, Part(0.9, True, b"ab"))
+    data = b"abcd"
+    view = memoryview(data)
+    track.put(
+        Segment(1, data, 2, [Part(0.9, True, view[:2]), Part(1.0, False, view[2:])])
+    )
+    track.put_part(2, Part(0.8, True, b"ef"))
+
+    assert track.get_part(1, 1).data == b"cd"
+    assert track.get_part(2, 0).data == b"ef"
+    assert track.get_part(2, 1) is None
+    assert track.has_part(2, 0)
+    assert not track.has_part(2, 1)
+    assert not track.has_part(2)
+
+    playlist = M3U8Renderer(stream).render(track, None).splitlines()
+    assert playlist[1:5] == [
+        "#EXT-X-VERSION:6",
+        "#EXT-X-TARGETDURATION:2",
+        "#EXT-X-SERVER-CONTROL:CAN-BLOCK-RELOAD=YES,PART-HOLD-BACK=3.000",
+        "#EXT-X-PART-INF:PART-TARGET=1.000",
+    ]
+    assert playlist[6:] == [
+        '#EXT-X-PART:DURATION=0.900,URI="./segment/1.0.ts",INDEPENDENT=YES',
+        '#EXT-X-PART:DURATION=1.000,URI="./segment/1.1.ts"',
+        "#EXTINF:2.0000,",
+        "./segment/1.ts",
+        '#EXT-X-PART:DURATION=0.800,URI="./segment/2.0.ts",INDEPENDENT=YES',
+        '#EXT-X-PRELOAD-HINT:TYPE=PART,URI="./segment/2.1.ts"',
+    ]
+
+    # A blocking reload returns once the part is published
+    wait = hass.async_create_task(track.async_wait_for_part(2, 1, 5))
+    await asyncio.sleep(0)
+    assert not wait.done()
+    track.put_part(2, Part(0.8, False, b"gh"))
+    assert await wait
+    assert not await track.async_wait_for_part(3, None, 0.01)
@@ -1,5 +1,7 @@
 """The tests for stream."""
-from unittest.mock import MagicMock, patch
+from fractions import Fraction
+import io
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
@@ -10,12 +12,16 @@ from homeassistant.components.stream.const import (
     DOMAIN,
     SERVICE_RECORD,
 )
+from homeassistant.components.stream.core import (
+    PacketBuffer,
+    StreamBuffer,
+    create_segment,
+    cut_part,
+)
 from homeassistant.const import CONF_FILENAME
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.setup import async_setup_component
 
-from tests.common import mock_coro
-
 
 async def test_record_service_invalid_file(hass):
     """Test record service call with invalid file."""
@@ -73,15 +79,125 @@ async def test_record_service_lookback(hass):
         hass.config, "is_allowed_path", return_value=True
     ):
         # Setup stubs
-        hls_mock = MagicMock()
-        hls_mock.num_segments = 3
-        hls_mock.target_duration = 2
-        hls_mock.recv.return_value = mock_coro()
-        stream_mock.return_value.outputs = {"hls": hls_mock}
+        stream_mock.return_value.outputs = {}
 
         # Call Service
         await hass.services.async_call(DOMAIN, SERVICE_RECORD, data, blocking=True)
 
         assert stream_mock.called
-        stream_mock.return_value.add_provider.assert_called_once_with("recorder")
-        assert hls_mock.recv.called
+        add_provider = stream_mock.return_value.add_provider
+        add_provider.assert_called_once_with("recorder")
+        add_provider.return_value.start.assert_called_once_with(4)
+
+
+def test_packet_buffer():
+    """Test the packet buffer keeps whole keyframe groups for its duration."""
+    buffer = PacketBuffer(duration=4)
+    packets = [Mock(is_keyframe=time % 2 == 0) for time in range(12)]
+
+    # Packets before the first keyframe are dropped
+    buffer.append(Mock(is_keyframe=False), 0)
+    for time, packet in enumerate(packets):
+        buffer.append(packet, time)
+
+    assert buffer.latest == 11
+    assert buffer.get() == packets[6:]
+    assert buffer.get(9) == packets[8:]
+
+    # Held packets are kept past the duration
+    buffer.hold = 7
+    for time in range(12, 16):
+        buffer.append(Mock(is_keyframe=time % 2 == 0), time)
+    assert buffer.get(7)[0] is packets[6]
+
+    # Releasing returns the held packets and stops holding them
+    assert buffer.release() == (None, buffer.get(7))
+    assert buffer.hold is None
+    assert buffer.release() == (None, [])
+
+    buffer.clear()
+    assert buffer.latest is None
+    assert buffer.get() == []
+
+
+def test_packet_buffer_restart():
+    """Test a restart hands the held packets over instead of dropping them."""
+    buffer = PacketBuffer(duration=4)
+    buffer.clear("first stream")
+    packets = [Mock(is_keyframe=time % 2 == 0) for time in range(6)]
+    for time, packet in enumerate(packets):
+        buffer.append(packet, time)
+
+    buffer.hold = 2
+    assert buffer.clear("second stream") == ("first stream", packets[2:])
+    assert buffer.hold is None
+    assert buffer.video_stream == "second stream"
+    assert buffer.get() == []
+
+    # Nothing is handed over when no recording holds packets
+    buffer.append(Mock(is_keyframe=True), 0)
+    assert buffer.clear("third stream") == ("second stream", [])
+
+
+def _mux(buffer, packet, data):
+    """Cut a part before the packet like the worker and write its data."""
+    part = None
+    if packet.is_keyframe:
+        buffer.part_start = float(packet.pts * packet.time_base)
+    else:
+        part = cut_part(buffer, packet)
+    buffer.segment.write(data)
+    return part
+
+
+def test_cut_parts():
+    """Test parts hold the data of their packets and segments reuse it."""
+    buffer = StreamBuffer(io.BytesIO(), None, None, part_target=1.0)
+    packets = [
+        Mock(pts=pts, duration=5, time_base=Fraction(1, 10), is_keyframe=pts == 0)
+        for pts in range(0, 40, 5)
+    ]
+
+    parts = [
+        _mux(buffer, packet, bytes([index]) * 188)
+        for index, packet in enumerate(packets)
+    ]
+
+    # A part is cut before every packet that would exceed one second
+    assert parts[:2] == [None, None]
+    assert parts[2].duration == 1.0
+    assert parts[2].independent
+    assert parts[2].data == bytes([0]) * 188 + bytes([1]) * 188
+    assert parts[4].duration == 1.0
+    assert not parts[4].independent
+    assert parts[4].data == bytes([2]) * 188 + bytes([3]) * 188
+    assert [part is None for part in parts] == [
+        True,
+        True,
+        False,
+        True,
+        False,
+        True,
+        False,
+        True,
+    ]
+
+    segment = create_segment(buffer, 1, 4.0, 4.0)
+    assert segment.segment == buffer.segment.getvalue()
+    assert [part.duration for part in segment.parts] == [1.0, 1.0, 1.0, 1.0]
+    assert [part.independent for part in segment.parts] == [True, False, False, False]
+    assert b"".join(part.data for part in segment.parts) == segment.segment
+    assert all(isinstance(part.data, memoryview) for part in segment.parts)
+    assert bytes(segment.parts[3].data) == bytes([6]) * 188 + bytes([7]) * 188
+
+
+def test_cut_part_without_data():
+    """Test no empty part is cut when nothing was written yet."""
+    buffer = StreamBuffer(io.BytesIO(), None, None, part_target=1.0)
+    packet = Mock(pts=20, duration=5, time_base=Fraction(1, 10), is_keyframe=False)
+
+    assert cut_part(buffer, packet) is None
+    assert buffer.parts == []
+
+    segment = create_segment(buffer, 1, 2.0, 2.0)
+    assert segment.parts == []
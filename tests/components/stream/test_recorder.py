@@ -3,9 +3,9 @@ from datetime import timedelta
 from io import BytesIO
 from unittest.mock import patch
 
+import av
 import pytest
 
-from homeassistant.components.stream.core import Segment
 from homeassistant.components.stream.recorder import recorder_save_worker
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
@@ -24,23 +24,24 @@ async def test_record_stream(hass, hass_client):
     """
     await async_setup_component(hass, "stream", {"stream": {}})
 
-    with patch("homeassistant.components.stream.recorder.recorder_save_worker"):
+    with patch(
+        "homeassistant.components.stream.recorder.recorder_save_worker"
+    ) as mock_save:
         # Setup demo track
         source = generate_h264_video()
         stream = preload_stream(hass, source)
         recorder = stream.add_provider("recorder")
         stream.start()
+        recorder.start()
 
-        segments = 0
-        while True:
-            segment = await recorder.recv()
-            if not segment:
-                break
-            segments += 1
+        # The recording is written when the stream ends
+        stream._thread.join()
+        await hass.async_block_till_done()
 
         stream.stop()
 
-        assert segments > 1
+        assert mock_save.called
+        assert len(mock_save.call_args[0][2]) > 1
 
 
 @pytest.mark.skip("Flaky in CI")
@@ -56,8 +57,7 @@ async def test_recorder_timeout(hass, hass_client):
         stream = preload_stream(hass, source)
         recorder = stream.add_provider("recorder")
         stream.start()
-
-        await recorder.recv()
+        recorder.start()
 
         # Wait a minute
         future = dt_util.utcnow() + timedelta(minutes=1)
@@ -71,12 +71,14 @@ async def test_recorder_timeout(hass, hass_client):
 async def test_recorder_save():
     """Test recorder save."""
     # Setup
-    source = generate_h264_video()
+    source = av.open(generate_h264_video(), "r", format="mpegts")
+    video_stream = source.streams.video[0]
+    packets = [p for p in source.demux(video_stream) if p.dts is not None]
     output = BytesIO()
     output.name = "test.mp4"
 
     # Run
-    recorder_save_worker(output, [Segment(1, source, 4)])
+    recorder_save_worker(output, video_stream, packets)
 
     # Assert
     assert output.getvalue()
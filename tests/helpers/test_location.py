@@ -2,6 +2,7 @@
 from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
 from homeassistant.core import State
 from homeassistant.helpers import location
+import homeassistant.util.location as loc_util
 
 
 def test_has_location_with_invalid_states():
@@ -43,3 +44,36 @@ def test_closest_returns_closest():
     state2 = State("light.test", "on", {ATTR_LATITUDE: 125.45, ATTR_LONGITUDE: 125.45})
 
     assert state == location.closest(123.45, 123.45, [state, state2])
+
+
+def test_approximate_distance():
+    """Test the approximate distance is close to the exact distance."""
+    exact = loc_util.distance(52.37, 4.89, 48.86, 2.35)
+    approx = location.approximate_distance(52.37, 4.89, 48.86, 2.35)
+
+    assert abs(approx - exact) < exact * location.APPROXIMATION_MARGIN
+
+
+def test_location_index():
+    """Test the location index."""
+    index = location.LocationIndex()
+    index.async_set("zone.home", 52.37, 4.89, 100)
+    index.async_set("zone.work", 52.09, 5.12, 200)
+    index.async_set("zone.country", 52.0, 5.0, 500000)
+
+    assert len(index) == 3
+    assert "zone.home" in index
+
+    assert index.async_candidates(52.3701, 4.8901) == {"zone.home", "zone.country"}
+    assert index.async_candidates(52.09, 5.12, 50) == {"zone.work", "zone.country"}
+    assert index.async_candidates(-33.86, 151.2) == {"zone.country"}
+
+    index.async_set("zone.home", 52.09, 5.121)
+    assert index.async_candidates(52.3701, 4.8901) == {"zone.country"}
+
+    index.async_remove("zone.country")
+    index.async_remove("zone.unknown")
+    assert index.async_candidates(52.09, 5.12) == {"zone.home", "zone.work"}
+
+    # Too big for the grid, every area is a candidate
+    assert index.async_candidates(0, 0, 10000000) == {"zone.home", "zone.work"}
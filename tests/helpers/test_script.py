@@ -14,7 +14,7 @@ from homeassistant import exceptions
 import homeassistant.components.scene as scene
 from homeassistant.const import ATTR_ENTITY_ID, SERVICE_TURN_ON
 from homeassistant.core import Context, callback
-from homeassistant.helpers import config_validation as cv, script
+from homeassistant.helpers import config_validation as cv, script, template
 import homeassistant.util.dt as dt_util
 
 from tests.common import async_fire_time_changed
@@ -190,6 +190,47 @@ async def test_calling_service_template(hass):
     assert calls[0].data.get("hello") == "world"
 
 
+async def test_static_templates_rendered_once(hass):
+    """Test static templates are rendered when the script is created."""
+    calls = []
+
+    @callback
+    def record_call(service):
+        """Add recorded call to list."""
+        calls.append(service)
+
+    hass.services.async_register("test", "script", record_call)
+
+    script_obj = script.Script(
+        hass,
+        cv.SCRIPT_SCHEMA(
+            {
+                "service_template": "test.script",
+                "data": {"hello": "data"},
+                "data_template": {"hello": "world", "value": "{{ value }}"},
+            }
+        ),
+    )
+
+    with mock.patch.object(
+        template.Template,
+        "async_render",
+        autospec=True,
+        side_effect=template.Template.async_render,
+    ) as mock_render:
+        await script_obj.async_run({"value": 1})
+        await script_obj.async_run({"value": 2})
+        await hass.async_block_till_done()
+
+    assert mock_render.call_count == 2
+    assert [call.data for call in calls] == [
+        {"hello": "world", "value": "1"},
+        {"hello": "world", "value": "2"},
+    ]
+    assert script_obj.step_runs == [2]
+    assert script_obj.step_durations[0] > 0
+
+
 async def test_delay(hass):
     """Test the delay."""
     event = "test_event"
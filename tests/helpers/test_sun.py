@@ -3,7 +3,11 @@
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
-from homeassistant.const import SUN_EVENT_SUNRISE, SUN_EVENT_SUNSET
+from homeassistant.const import (
+    EVENT_CORE_CONFIG_UPDATE,
+    SUN_EVENT_SUNRISE,
+    SUN_EVENT_SUNSET,
+)
 import homeassistant.helpers.sun as sun
 import homeassistant.util.dt as dt_util
 
@@ -191,3 +195,49 @@ def test_norway_in_june(hass):
     )
     assert sun.get_astral_event_date(hass, SUN_EVENT_SUNRISE, june) is None
     assert sun.get_astral_event_date(hass, SUN_EVENT_SUNSET, june) is None
+
+
+def test_date_events_cached_per_day(hass):
+    """Test astral events are only calculated once per location and day."""
+    location = sun.get_astral_location(hass)
+    day = datetime(2016, 11, 1).date()
+    sun._EPHEMERIS.clear()
+
+    with patch.object(
+        type(location), "sunrise", autospec=True, return_value=dt_util.utcnow()
+    ) as mock_sunrise:
+        first = sun.get_astral_event_date(hass, SUN_EVENT_SUNRISE, day)
+        second = sun.get_astral_event_date(hass, SUN_EVENT_SUNRISE, day)
+        sun.get_astral_event_date(hass, SUN_EVENT_SUNRISE, day + timedelta(days=1))
+
+    sun._EPHEMERIS.clear()
+
+    assert first is second
+    assert mock_sunrise.call_count == sun.EPHEMERIS_PRECOMPUTE_DAYS
+
+    hass.config.latitude += 1
+    assert sun.get_astral_event_date(hass, SUN_EVENT_SUNRISE, day) != first
+
+
+def test_date_events_cached_per_solar_depression(hass):
+    """Test dawn is cached separately for each solar depression."""
+    location = sun.get_astral_location(hass)
+    day = datetime(2016, 11, 1).date()
+
+    location.solar_depression = "civil"
+    civil = sun.get_location_astral_event_date(location, "dawn", day)
+    location.solar_depression = "astronomical"
+    astronomical = sun.get_location_astral_event_date(location, "dawn", day)
+
+    assert astronomical < civil
+
+
+async def test_locations_dropped_on_core_config_update(hass):
+    """Test the cached locations are dropped when the core config changes."""
+    location = sun.get_astral_location(hass)
+    assert sun.get_astral_location(hass) is location
+
+    hass.bus.async_fire(EVENT_CORE_CONFIG_UPDATE)
+    await hass.async_block_till_done()
+
+    assert sun.get_astral_location(hass) is not location
@@ -8,6 +8,7 @@ import unittest.mock as mock
 
 import asynctest
 import pytest
+import voluptuous as vol
 from voluptuous import Invalid, MultipleInvalid
 import yaml
 
@@ -35,7 +36,12 @@ from homeassistant.loader import async_get_integration
 from homeassistant.util import dt as dt_util
 from homeassistant.util.yaml import SECRET_YAML
 
-from tests.common import get_test_config_dir, patch_yaml_files
+from tests.common import (
+    MockModule,
+    get_test_config_dir,
+    mock_integration,
+    patch_yaml_files,
+)
 
 CONFIG_DIR = get_test_config_dir()
 YAML_PATH = os.path.join(CONFIG_DIR, config_util.YAML_CONFIG_FILE)
@@ -893,3 +899,32 @@ async def test_merge_split_component_definition(hass):
     assert len(config["light one"]) == 1
     assert len(config["light two"]) == 1
     assert len(config["light three"]) == 1
+
+
+async def test_component_config_validation_cached(hass):
+    """Test unchanged config sections are not validated again."""
+    schema = mock.Mock(
+        side_effect=vol.Schema({"comp_conf": {"hello": str}}, extra=vol.ALLOW_EXTRA)
+    )
+    mock_integration(hass, MockModule("comp_conf", config_schema=schema))
+    integration = await async_get_integration(hass, "comp_conf")
+    config = {"comp_conf": {"hello": "world"}, "other": {"key": "value"}}
+
+    first = await config_util.async_process_component_config(hass, config, integration)
+    second = await config_util.async_process_component_config(hass, config, integration)
+
+    assert schema.call_count == 1
+    assert first == second == config
+    assert second["comp_conf"] is not first["comp_conf"]
+    assert second["other"] is config["other"]
+
+    third = await config_util.async_process_component_config(
+        hass, {"comp_conf": {"hello": "again"}}, integration
+    )
+    assert schema.call_count == 2
+    assert third == {"comp_conf": {"hello": "again"}}
+
+    with pytest.raises(Invalid):
+        config_util.async_validate_cached(
+            hass, schema, {"comp_conf": {"hello": 1}}, "comp_conf"
+        )
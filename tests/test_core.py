@@ -585,6 +585,26 @@ class TestStateMachine(unittest.TestCase):
         states = sorted(state.entity_id for state in self.states.all())
         assert ["light.bowl", "switch.ac"] == states
 
+    def test_domain_filter(self):
+        """Test filtering states by domain."""
+        self.states.set("light.Kitchen", "off")
+
+        states = sorted(state.entity_id for state in self.states.all("light"))
+        assert ["light.bowl", "light.kitchen"] == states
+        assert [] == self.states.all("sensor")
+        assert 2 == self.states.async_entity_ids_count("light")
+        assert 3 == self.states.async_entity_ids_count()
+
+        # The domain index follows updates and removals
+        self.states.set("light.kitchen", "on")
+        assert {"on"} == {state.state for state in self.states.all("light")}
+
+        self.states.remove("light.kitchen")
+        self.states.remove("switch.ac")
+        assert ["light.bowl"] == self.states.entity_ids("light")
+        assert [] == self.states.entity_ids("switch")
+        assert 0 == self.states.async_entity_ids_count("switch")
+
     def test_remove(self):
         """Test remove method."""
         events = []
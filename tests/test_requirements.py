@@ -1,4 +1,5 @@
 """Test requirements module."""
+from datetime import timedelta
 import os
 from pathlib import Path
 from unittest.mock import call, patch
@@ -8,15 +9,21 @@ import pytest
 from homeassistant import loader, setup
 from homeassistant.requirements import (
     CONSTRAINT_FILE,
+    DATA_PKG_CACHE,
     PROGRESS_FILE,
+    SAVE_DELAY,
+    STORAGE_KEY,
     RequirementsNotFound,
     _install,
+    _site_fingerprint,
     async_get_integration_with_requirements,
     async_process_requirements,
 )
+import homeassistant.util.dt as dt_util
 
 from tests.common import (
     MockModule,
+    async_fire_time_changed,
     get_test_home_assistant,
     mock_coro,
     mock_integration,
@@ -104,6 +111,87 @@ async def test_install_existing_package(hass):
     assert len(mock_inst.mock_calls) == 0
 
 
+async def test_satisfied_requirements_cache(hass, hass_storage):
+    """Test satisfied requirements are cached for unchanged packages."""
+    with patch("homeassistant.util.package.is_installed", return_value=True):
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=SAVE_DELAY))
+    await hass.async_block_till_done()
+
+    stored = hass_storage[STORAGE_KEY]["data"]
+    assert stored["requirements"] == ["hello==1.0.0"]
+
+    # A warm start skips the check
+    hass.data.pop(DATA_PKG_CACHE)
+    with patch("homeassistant.util.package.is_installed") as mock_is_installed:
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+    assert not mock_is_installed.called
+
+    # Changed packages invalidate the cache
+    hass.data.pop(DATA_PKG_CACHE)
+    stored["fingerprint"] = "changed"
+    with patch(
+        "homeassistant.util.package.is_installed", return_value=True
+    ) as mock_is_installed:
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+    assert mock_is_installed.called
+
+
+def test_site_fingerprint(tmpdir):
+    """Test the fingerprint only follows the package directories."""
+    config_dir = tmpdir.mkdir("config")
+    site_dir = tmpdir.mkdir("site-packages")
+    deps_dir = config_dir.mkdir("deps").mkdir("lib")
+    path = [str(config_dir), str(site_dir), str(deps_dir)]
+
+    with patch("sys.path", path), patch(
+        "site.getsitepackages", return_value=[str(site_dir)]
+    ), patch("site.ENABLE_USER_SITE", False):
+        fingerprint = _site_fingerprint(str(config_dir))
+
+        # Files coming and going in the config dir do not matter
+        config_dir.join("home-assistant_v2.db-wal").write("")
+        os.utime(str(config_dir), ns=(0, 0))
+        assert _site_fingerprint(str(config_dir)) == fingerprint
+
+        # Installing into site-packages or deps does
+        os.utime(str(site_dir), ns=(0, 0))
+        assert _site_fingerprint(str(config_dir)) != fingerprint
+        fingerprint = _site_fingerprint(str(config_dir))
+
+        os.utime(str(deps_dir), ns=(0, 0))
+        assert _site_fingerprint(str(config_dir)) != fingerprint
+
+    # Without any package directory there is nothing to fingerprint
+    with patch("sys.path", []), patch(
+        "site.getsitepackages", return_value=[str(tmpdir.join("missing"))]
+    ), patch("site.ENABLE_USER_SITE", False):
+        assert _site_fingerprint(str(config_dir)) is None
+
+
+async def test_satisfied_requirements_without_fingerprint(hass, hass_storage):
+    """Test requirements are not cached when packages cannot be fingerprinted."""
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": {"fingerprint": None, "requirements": ["hello==1.0.0"]},
+    }
+
+    with patch(
+        "homeassistant.requirements._package_dirs", return_value=["/non/existing"]
+    ), patch(
+        "homeassistant.util.package.is_installed", return_value=True
+    ) as mock_is_installed:
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+    assert len(mock_is_installed.mock_calls) == 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=SAVE_DELAY))
+    await hass.async_block_till_done()
+    assert hass_storage[STORAGE_KEY]["data"]["requirements"] == ["hello==1.0.0"]
+    assert hass_storage[STORAGE_KEY]["data"]["fingerprint"] is None
+
+
 async def test_install_missing_package(hass):
     """Test an install attempt on an existing package."""
     with patch(
@@ -134,6 +134,40 @@ def test_parse_datetime_converts_correctly():
     assert utcnow == dt_util.parse_datetime(utcnow.isoformat())
 
 
+def test_parse_datetime_iso_formats():
+    """Test parse_datetime handles canonical and loose ISO 8601 strings."""
+    assert dt_util.parse_datetime("1986-07-09 12:00") == datetime(1986, 7, 9, 12, 0)
+    assert dt_util.parse_datetime("1986-7-9T12:00:00.5") == datetime(
+        1986, 7, 9, 12, 0, 0, 500000
+    )
+    assert dt_util.parse_datetime("1986-07-09T12:00:00+0130") == datetime(
+        1986, 7, 9, 10, 30, 0, tzinfo=dt_util.UTC
+    )
+    assert dt_util.parse_datetime("1986-07-09T12:00:00Z").tzinfo is dt_util.UTC
+    assert dt_util.parse_datetime("1986-07-09") is None
+    assert dt_util.parse_datetime("1986-07-09T12:00:00+01:30:15") is None
+    assert dt_util.parse_datetime("1986-07-09T12:00:00+05:00:00") is None
+    assert dt_util.parse_datetime("1986-07-09T12:34:56:123456+05:30") is None
+    assert dt_util.parse_datetime("1986-07-09T12:56.123456") is None
+    assert dt_util.parse_datetime("1986-07-09T12+05:00") is None
+    assert dt_util.parse_datetime("1986-07-09T12:00+05:00") == datetime(
+        1986, 7, 9, 7, 0, tzinfo=dt_util.UTC
+    )
+
+    with pytest.raises(ValueError):
+        dt_util.parse_datetime("1986-13-09T12:00:00")
+
+
+def test_parse_datetime_shares_time_zones():
+    """Test parsed fixed offsets share their time zone instances."""
+    first = dt_util.parse_datetime("1986-07-09T12:00:00-05:00")
+    second = dt_util.parse_datetime("2020-01-01T00:00:00.123456-05:00")
+    third = dt_util.parse_datetime("2020-01-01T00:00:00-0500")
+
+    assert first.tzinfo is second.tzinfo is third.tzinfo
+    assert first.utcoffset() == timedelta(hours=-5)
+
+
 def test_parse_datetime_returns_none_for_incorrect_format():
     """Test parse_datetime returns None if incorrect format."""
     assert dt_util.parse_datetime("not a datetime string") is None
@@ -461,3 +461,57 @@ def test_duplicate_key(caplog):
     with patch_yaml_files(files):
         load_yaml_config_file(YAML_CONFIG_FILE)
     assert "contains duplicate key" in caplog.text
+
+
+def test_line_numbers_from_libyaml(tmp_path):
+    """Test the file name and line numbers are kept by the default loader."""
+    conf = tmp_path / "conf.yaml"
+    conf.write_text("key:\n  - one\n  - two\nother:\n  nested: value\n")
+    doc = yaml_loader.load_yaml(str(conf))
+    assert doc.__config_file__ == str(conf)
+    assert doc["key"].__line__ == 1
+    assert doc["other"].__line__ == 4
+
+
+def test_parse_cache(tmp_path):
+    """Test unchanged files are served from the parse cache."""
+    yaml_loader.clear_parse_cache()
+    conf = tmp_path / "conf.yaml"
+    included = tmp_path / "included.yaml"
+    conf.write_text("key: !include included.yaml\n")
+    included.write_text("value: 1\n")
+
+    first = yaml_loader.load_yaml(str(conf))
+    with patch.object(yaml_loader, "_parse_yaml") as mock_parse:
+        second = yaml_loader.load_yaml(str(conf))
+    assert not mock_parse.called
+    assert second == first == {"key": {"value": 1}}
+    assert second["key"].__config_file__ == str(conf)
+
+    # Callers get their own copy
+    second["key"]["value"] = 2
+    assert yaml_loader.load_yaml(str(conf)) == {"key": {"value": 1}}
+
+    # A change to an included file invalidates the including file
+    included.write_text("value: 10\n")
+    assert yaml_loader.load_yaml(str(conf)) == {"key": {"value": 10}}
+
+
+def test_parse_cache_environment_variable(tmp_path):
+    """Test a changed environment variable invalidates the parse cache."""
+    yaml_loader.clear_parse_cache()
+    conf = tmp_path / "conf.yaml"
+    conf.write_text("password: !env_var PASSWORD default\n")
+
+    with patch.dict(os.environ, {"PASSWORD": "secret_password"}):
+        assert yaml_loader.load_yaml(str(conf)) == {"password": "secret_password"}
+    assert yaml_loader.load_yaml(str(conf)) == {"password": "default"}
+
+
+def test_parse_cache_skips_mocked_files():
+    """Test files without a file descriptor are never cached."""
+    yaml_loader.clear_parse_cache()
+    files = {YAML_CONFIG_FILE: "key: value"}
+    with patch_yaml_files(files):
+        assert yaml_loader.load_yaml(YAML_CONFIG_FILE) == {"key": "value"}
+    assert YAML_CONFIG_FILE not in yaml_loader._PARSE_CACHE